@@ -2,19 +2,12 @@
 
 import streamlit as st
 
-# Jogo 1 — Quiz
-from games.quiz.core.state import init_state as quiz_init_state
-from games.quiz.pages.home import page_home as quiz_home
-from games.quiz.pages.quiz import page_quiz
-from games.quiz.pages.result import page_result
-
-# Jogo 2 — Roleta
-from games.roleta.pages.roleta import page_roleta
-
-# Jogo 3 — Sorte
-from games.sorte.pages.sorte import page_sorte
+# Os jogos são importados só quando abertos (ver games/shared/registry.py)
+from games.shared.metrics import export, timed
+from games.shared.registry import GAMES, get_game
 
 
+@timed()
 def init_hub_state() -> None:
     """Garante que o estado global do Hub exista."""
     if "active_game" not in st.session_state:
@@ -30,10 +23,10 @@ def go_hub() -> None:
     st.rerun()
 
 
+@timed()
 def main() -> None:
     """Controla o fluxo entre Hub e os jogos."""
     init_hub_state()
-    quiz_init_state()
 
     game = st.session_state.active_game
 
@@ -43,90 +36,40 @@ def main() -> None:
     if game is None:
         st.title("Escolha seu jogo")
 
-        # Jogo 1 — Quiz
-        st.markdown("### 🎯 Jogo 1 — Quiz")
-        if st.button(
-            "▶️ Jogar Quiz",
-            key="go_quiz",
-            use_container_width=True,
-        ):
-            st.session_state.active_game = "quiz"
-            st.session_state.page = "home"
-            st.rerun()
-
-        st.markdown("---")
-
-        # Jogo 2 — Roleta
-        st.markdown("### 🌀 Jogo 2 — Roleta")
-        if st.button(
-            "▶️ Jogar Roleta",
-            key="go_roleta_main",
-            use_container_width=True,
-        ):
-            st.session_state.active_game = "roleta"
-            st.rerun()
-
-        st.markdown("---")
-
-        # Jogo 3 — Sorte
-        st.markdown("### 🍀 Jogo 3 — Sorte")
-        if st.button(
-            "▶️ Jogar Sorte",
-            key="go_sorte_main",
-            use_container_width=True,
-        ):
-            st.session_state.active_game = "sorte"
-            st.rerun()
-
-        return
-
-    # ------------------------------------------------------------------
-    # 2) Jogo 1 — Quiz (usa o roteamento interno do jogo)
-    # ------------------------------------------------------------------
-    if game == "quiz":
-        if st.button("⟵ Voltar ao início", key="quiz_back"):
-            go_hub()
-            return
-
-        page = st.session_state.get("page", "home")
-
-        if page == "home":
-            quiz_home()
-            return
+        for i, spec in enumerate(GAMES):
+            if i:
+                st.markdown("---")
 
-        if page == "quiz":
-            page_quiz()
-            return
+            st.markdown(f"### {spec.heading}")
+            if st.button(
+                spec.button,
+                key=spec.button_key,
+                use_container_width=True,
+            ):
+                st.session_state.active_game = spec.key
+                st.session_state.page = "home"
+                st.rerun()
 
-        if page == "result":
-            page_result()
-            return
-
-        st.session_state.page = "home"
-        st.rerun()
-
-    # ------------------------------------------------------------------
-    # 3) Jogo 2 — Roleta
-    # ------------------------------------------------------------------
-    if game == "roleta":
-        if st.button("⟵ Voltar ao início", key="roleta_back"):
-            go_hub()
-            return
-
-        page_roleta()
         return
 
     # ------------------------------------------------------------------
-    # 4) Jogo 3 — Sorte
+    # 2) Jogo ativo — importa as páginas do jogo na primeira vez
     # ------------------------------------------------------------------
-    if game == "sorte":
-        if st.button("⟵ Voltar ao início", key="sorte_back"):
-            go_hub()
-            return
+    spec = get_game(game)
+    if spec is None:
+        go_hub()
+        return
 
-        page_sorte()
+    if st.button("⟵ Voltar ao início", key=spec.back_key):
+        go_hub()
         return
 
+    spec.load()()
+
 
 if __name__ == "__main__":
-    main()
+    try:
+        main()
+    finally:
+        # também quando o rerun sai por st.rerun()/st.stop()
+        export()
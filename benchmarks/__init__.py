@@ -0,0 +1 @@
+"""Micro-benchmarks dos caminhos quentes do app (ver `benchmarks.bench`)."""
@@ -0,0 +1,186 @@
+"""Roda os micro-benchmarks e compara com uma linha de base.
+
+Cada caso de `benchmarks.cases` é medido com `timeit`: calibra o número
+de chamadas para ~0,2 s por rodada, repete `--repeat` rodadas e guarda
+mediana e mínimo em µs por operação. O resultado vai para
+`benchmarks/results/<data>.json` e `benchmarks/results/latest.json`;
+com `--baseline`, também para `benchmarks/baseline.json`.
+
+`run` também roda as conferências de `benchmarks.fidelity` que casam
+com `--filter` (ex.: os dois motores da roleta desenham a mesma roda) e
+falha (saída 1) se alguma não passar; `check` roda só as conferências.
+
+`compare` falha (saída 1) se a mediana de algum caso piorou mais que a
+tolerância em relação à base. Casos que só existem de um lado aparecem
+no relatório, mas não reprovam.
+
+Uso:
+    python -m benchmarks.bench run [--filter engine] [--repeat 7] [--baseline]
+    python -m benchmarks.bench check [--filter roleta] [--save DIR]
+    python -m benchmarks.bench compare [BASE] [NOVO] [--tolerance 0.2]
+    python -m benchmarks.bench list
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+import timeit
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from benchmarks.cases import CASES
+from benchmarks.fidelity import CHECKS
+
+BENCH_DIR = Path(__file__).resolve().parent
+RESULTS_DIR = BENCH_DIR / "results"
+LATEST = RESULTS_DIR / "latest.json"
+BASELINE = BENCH_DIR / "baseline.json"
+DEFAULT_REPEAT = 7
+DEFAULT_TOLERANCE = 0.2
+
+
+def measure(name: str, repeat: int = DEFAULT_REPEAT) -> Dict:
+    """Mede um caso: µs por operação (mediana, mínimo) e contagens."""
+    fn, ops = CASES[name]()
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    rounds = timer.repeat(repeat=repeat, number=number)
+    per_op = [t / (number * ops) * 1e6 for t in rounds]
+    return {
+        "median_us": statistics.median(per_op),
+        "min_us": min(per_op),
+        "number": number,
+        "ops": ops,
+        "repeat": repeat,
+    }
+
+
+def run(names: List[str], repeat: int) -> Dict:
+    """Mede os casos e monta o documento de resultados."""
+    results = {}
+    for name in names:
+        res = results[name] = measure(name, repeat)
+        print(f"{name:32s} {res['median_us']:12.2f} µs/op "
+              f"(mín {res['min_us']:.2f}, {res['number']}×{res['ops']})")
+    return {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": results,
+    }
+
+
+def run_checks(names: List[str], save: Optional[Path] = None) -> List[str]:
+    """Roda as conferências de fidelidade; retorna as que falharam."""
+    failed = []
+    for name in names:
+        print(f"{name}:")
+        if CHECKS[name](save):
+            failed.append(name)
+    return failed
+
+
+def _write(path: Path, doc: Dict) -> None:
+    """Grava o JSON criando a pasta se preciso."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(doc, indent=2, sort_keys=True) + "\n",
+                    encoding="utf-8")
+
+
+def compare(base: Dict, new: Dict, tolerance: float) -> List[str]:
+    """Imprime a comparação e retorna os casos que regrediram."""
+    old_res, new_res = base["results"], new["results"]
+    regressed = []
+    for name in sorted(set(old_res) | set(new_res)):
+        if name not in new_res or name not in old_res:
+            side = "só na base" if name in old_res else "novo"
+            print(f"{name:32s} {'':>12s} {'':>12s} {'':>8s}  ({side})")
+            continue
+        a, b = old_res[name]["median_us"], new_res[name]["median_us"]
+        delta = b / a - 1 if a else 0.0
+        flag = ""
+        if delta > tolerance:
+            flag = "  REGRESSÃO"
+            regressed.append(name)
+        print(f"{name:32s} {a:12.2f} {b:12.2f} {delta:+8.1%}{flag}")
+    return regressed
+
+
+def _load(path: Path) -> Dict:
+    """Lê um arquivo de resultados."""
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Ponto de entrada da linha de comando."""
+    ap = argparse.ArgumentParser(description="Micro-benchmarks do app.")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    r = sub.add_parser("run", help="mede os casos e grava o JSON")
+    r.add_argument("--filter", default="",
+                   help="só casos cujo nome contém este texto")
+    r.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    r.add_argument("--baseline", action="store_true",
+                   help=f"grava também em {BASELINE.name}")
+    k = sub.add_parser("check", help="só as conferências de fidelidade")
+    k.add_argument("--filter", default="",
+                   help="só conferências cujo nome contém este texto")
+    k.add_argument("--save", type=Path, default=None,
+                   help="grava as imagens comparadas nesta pasta")
+    c = sub.add_parser("compare", help="compara dois resultados")
+    c.add_argument("base", type=Path, nargs="?", default=BASELINE)
+    c.add_argument("new", type=Path, nargs="?", default=LATEST)
+    c.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                   help="piora relativa aceita na mediana (0.2 = 20%%)")
+    sub.add_parser("list", help="lista os casos")
+    args = ap.parse_args(argv)
+
+    if args.cmd == "list":
+        print("\n".join(list(CASES) + list(CHECKS)))
+        return 0
+
+    if args.cmd == "check":
+        names = [n for n in CHECKS if args.filter in n]
+        if not names:
+            print(f"nenhuma conferência com '{args.filter}'", file=sys.stderr)
+            return 2
+        failed = run_checks(names, args.save)
+        return 1 if failed else 0
+
+    if args.cmd == "run":
+        names = [n for n in CASES if args.filter in n]
+        checks = [n for n in CHECKS if args.filter in n]
+        if not names and not checks:
+            print(f"nenhum caso com '{args.filter}'", file=sys.stderr)
+            return 2
+        failed = run_checks(checks)
+        if names:
+            doc = run(names, args.repeat)
+            out = RESULTS_DIR / f"{doc['created'].replace(':', '')}.json"
+            _write(out, doc)
+            _write(LATEST, doc)
+            if args.baseline and not failed:
+                _write(BASELINE, doc)
+            print(f"resultados em {out}")
+        if failed:
+            print(f"conferência(s) falharam: {', '.join(failed)}")
+            return 1
+        return 0
+
+    for path in (args.base, args.new):
+        if not path.exists():
+            print(f"arquivo não encontrado: {path}", file=sys.stderr)
+            return 2
+    regressed = compare(_load(args.base), _load(args.new), args.tolerance)
+    if regressed:
+        print(f"{len(regressed)} caso(s) acima da tolerância de "
+              f"{args.tolerance:.0%}: {', '.join(regressed)}")
+        return 1
+    print(f"sem regressões acima de {args.tolerance:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,292 @@
+"""Casos de benchmark: motor do quiz, composer, loaders e renderizadores.
+
+Cada caso é uma função de preparo registrada com `@case(nome)`. Ela monta
+as entradas fora da medição e devolve `(fn, ops)`: `fn()` executa `ops`
+operações, e o tempo reportado é por operação. As entradas usam semente
+fixa, então duas execuções medem exatamente o mesmo trabalho.
+"""
+
+import io
+import logging
+import random
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+Setup = Callable[[], Tuple[Callable[[], object], int]]
+
+CASES: Dict[str, Setup] = {}
+SEED = 1234
+PATHS_PER_CASE = 256
+WHEEL_LABELS = 12
+WHEEL_SIZE = 640
+
+
+def case(name: str) -> Callable[[Setup], Setup]:
+    """Registra a função de preparo de um benchmark."""
+    def register(setup: Setup) -> Setup:
+        CASES[name] = setup
+        return setup
+    return register
+
+
+def _quiet_streamlit() -> None:
+    """Silencia o aviso de session_state fora do `streamlit run`."""
+    import streamlit  # noqa: F401  (os loggers só existem após o import)
+
+    for name in logging.root.manager.loggerDict:
+        if name.startswith("streamlit"):
+            logging.getLogger(name).setLevel(logging.ERROR)
+
+
+def _theme(prefix: str) -> Dict:
+    """JSON do primeiro tema do catálogo cujo id começa com `prefix`."""
+    from games.quiz.core.catalog import load_catalog
+
+    for item in load_catalog():
+        if item["id"].startswith(prefix):
+            return item["raw"]
+    raise LookupError(f"tema '{prefix}*' não encontrado")
+
+
+def _paths(theme: Dict, n: int = PATHS_PER_CASE) -> List[Tuple]:
+    """(respostas, placar, chave, bloco) de `n` caminhos aleatórios."""
+    from games.quiz.core.compiled import compile_theme
+    from games.quiz.core.engine import compute_result
+
+    ct = compile_theme(theme)
+    rng = random.Random(SEED)
+    out = []
+    for _ in range(n):
+        answers = [(q.id, rng.choice(q.options).id) for q in ct.questions]
+        scores = {rk: 0 for rk in ct.result_keys}
+        for q_id, opt_id in answers:
+            for rk, v in ct.weights_for(q_id, opt_id).items():
+                if rk in scores:
+                    scores[rk] += v
+        key, block = compute_result(scores, theme, answers)
+        out.append((answers, scores, key, block))
+    return out
+
+
+# ---------------------------------------------------------------------
+# Motor do quiz
+# ---------------------------------------------------------------------
+@case("engine.compute_result")
+def _compute_result():
+    from games.quiz.core.engine import compute_result
+
+    theme = _theme("criaturas")
+    paths = _paths(theme)
+
+    def run():
+        for answers, scores, _, _ in paths:
+            compute_result(scores, theme, answers)
+    return run, len(paths)
+
+
+@case("engine.resolve_tie")
+def _resolve_tie():
+    from games.quiz.core.engine import resolve_tie
+
+    theme = _theme("criaturas")
+    keys = list(theme["results"])
+    paths = _paths(theme)
+
+    def run():
+        for answers, _, _, _ in paths:
+            resolve_tie(keys, theme, answers)
+    return run, len(paths)
+
+
+@case("engine.apply_variant")
+def _apply_variant():
+    from games.quiz.core.engine import apply_variant
+
+    theme = _theme("criaturas")
+    paths = _paths(theme)
+
+    def run():
+        for answers, _, key, block in paths:
+            apply_variant(block, theme, answers, key=key)
+    return run, len(paths)
+
+
+@case("engine.apply_variant_counts")
+def _apply_variant_counts():
+    from games.quiz.core.engine import apply_variant
+    from games.quiz.core.variants import signal_vector
+
+    theme = _theme("criaturas")
+    paths = [(a, k, b, signal_vector(theme, a))
+             for a, _, k, b in _paths(theme)]
+
+    def run():
+        for answers, key, block, counts in paths:
+            apply_variant(block, theme, answers, key=key, counts=counts)
+    return run, len(paths)
+
+
+# ---------------------------------------------------------------------
+# Convite
+# ---------------------------------------------------------------------
+def _plans() -> Tuple[Dict, List[Dict[str, str]]]:
+    """Tema Surpresa e os planos de caminhos aleatórios."""
+    from games.quiz.core.composer import collect_plan
+
+    theme = _theme("surpresa")
+    return theme, [collect_plan(theme, a) for a, *_ in _paths(theme)]
+
+
+@case("composer.compose_invite")
+def _compose_invite():
+    from games.quiz.core.composer import compose_invite
+
+    theme, plans = _plans()
+
+    def run():
+        for plan in plans:
+            compose_invite(theme, plan)
+    return run, len(plans)
+
+
+@case("composer.compose_invites")
+def _compose_invites():
+    from games.quiz.core.composer import compose_invites
+
+    theme, plans = _plans()
+    return (lambda: compose_invites(theme, plans)), len(plans)
+
+
+# ---------------------------------------------------------------------
+# Loaders
+# ---------------------------------------------------------------------
+@case("theme_io.load_theme")
+def _load_theme():
+    from games.quiz.core.theme_io import load_theme, load_theme_files
+
+    files: List[Path] = []
+    for p in load_theme_files():
+        try:
+            load_theme(p)
+        except ValueError:
+            continue  # cards.json e afins não são temas
+        files.append(p)
+
+    def run():
+        for p in files:
+            load_theme(p)
+    return run, len(files)
+
+
+@case("home._load_all_themes")
+def _load_all_themes():
+    _quiet_streamlit()
+    from games.quiz.pages.home import _load_all_themes
+
+    _load_all_themes()
+    return _load_all_themes, 1
+
+
+# ---------------------------------------------------------------------
+# Roleta (um quadro por operação, sem o cache de quadros)
+# ---------------------------------------------------------------------
+def _wheel_angles(n: int = 41) -> List[float]:
+    """Ângulos de um giro, como a animação da página."""
+    rng = random.Random(SEED)
+    return [rng.uniform(0, 360) for _ in range(n)]
+
+
+@case("roleta.frame_pil")
+def _frame_pil():
+    from games.roleta.core.frame_cache import _encode_pil
+
+    labels = [f"Pergunta {i}" for i in range(WHEEL_LABELS)]
+    angles = _wheel_angles()
+    _encode_pil(labels, 0.0, None, WHEEL_SIZE)
+
+    def run():
+        for a in angles:
+            _encode_pil(labels, a, None, WHEEL_SIZE)
+    return run, len(angles)
+
+
+@case("roleta.frame_mpl")
+def _frame_mpl():
+    from games.roleta.core.wheel_mpl import WheelFigure
+
+    labels = [f"Pergunta {i}" for i in range(WHEEL_LABELS)]
+    angles = _wheel_angles(11)
+    fig = WheelFigure(labels)
+
+    def run():
+        for a in angles:
+            fig.render_png(a, None, WHEEL_SIZE)
+    return run, len(angles)
+
+
+@case("roleta.draw_wheel")
+def _draw_wheel():
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    from games.roleta.core.wheel_mpl import draw_wheel
+
+    labels = [f"Pergunta {i}" for i in range(WHEEL_LABELS)]
+    angles = _wheel_angles(5)
+
+    def run():
+        for a in angles:
+            fig = draw_wheel(labels, a, None)
+            fig.savefig(io.BytesIO(), format="png", dpi=WHEEL_SIZE / 5.5)
+            plt.close(fig)
+    return run, len(angles)
+
+
+@case("roleta.frame_cached")
+def _frame_cached():
+    from games.roleta.core.frame_cache import encoded_frame, quantize_angle
+
+    labels = [f"Pergunta {i}" for i in range(WHEEL_LABELS)]
+    angles = [quantize_angle(a) for a in _wheel_angles()]
+    for a in angles:
+        encoded_frame(labels, a, None, size=WHEEL_SIZE)
+
+    def run():
+        for a in angles:
+            encoded_frame(labels, a, None, size=WHEEL_SIZE)
+    return run, len(angles)
+
+
+# ---------------------------------------------------------------------
+# Sorte
+# ---------------------------------------------------------------------
+@case("sorte.load_sorte_cards")
+def _load_sorte_cards():
+    from games.sorte.core.loader import load_sorte_cards
+
+    load_sorte_cards()
+    return load_sorte_cards, 1
+
+
+@case("sorte.pick_card")
+def _pick_card():
+    _quiet_streamlit()
+    from games.sorte.core.loader import load_sorte_cards
+    from games.sorte.core.state import (
+        current_hand,
+        init_sorte_state,
+        pick_card,
+        reset_sorte,
+    )
+
+    deck = load_sorte_cards()
+    init_sorte_state(deck)
+
+    def run():
+        # uma leitura completa: mão e escolha em cada um dos três estágios
+        reset_sorte()
+        for _ in range(3):
+            pick_card(current_hand()[0])
+    return run, 3
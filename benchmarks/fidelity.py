@@ -0,0 +1,82 @@
+"""Conferências de fidelidade que acompanham os benchmarks.
+
+Um motor mais rápido só vale se desenhar a mesma coisa. Cada conferência
+é registrada com `@check(nome)` e devolve a lista de falhas (vazia se
+passou); `python -m benchmarks.bench run` roda as conferências cujo nome
+casa com `--filter` e sai com código 1 se alguma falhar.
+
+`roleta.pil_vs_mpl` compara pixel a pixel os dois motores da roleta nos
+mesmos rótulos, ângulos e destaques, numa tela de 550 px (figura de
+5,5" a 100 dpi). Textos usam fontes diferentes em cada motor, então a
+conferência tolera até `MAX_DIFF` de pixels divergentes por caso.
+"""
+
+import io
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+Check = Callable[[Optional[Path]], List[str]]
+
+CHECKS: Dict[str, Check] = {}
+WHEEL_SIZE = 550
+CHANNEL_TOLERANCE = 60
+MAX_DIFF = 0.05
+
+WHEEL_CASES = [
+    (["Sim", "Não"], 0.0, None),
+    ([f"Pergunta {i}" for i in range(6)], 0.0, None),
+    ([f"Pergunta {i}" for i in range(6)], 37.5, 2),
+    ([f"Pergunta {i}" for i in range(12)], 123.0, None),  # quadro do giro
+    ([f"Uma pergunta bem comprida número {i}" for i in range(12)], 200.0, 7),
+    ([f"P{i}" for i in range(24)], 359.0, 0),
+]
+
+
+def check(name: str) -> Callable[[Check], Check]:
+    """Registra uma conferência."""
+    def register(fn: Check) -> Check:
+        CHECKS[name] = fn
+        return fn
+    return register
+
+
+@check("roleta.pil_vs_mpl")
+def _wheels(save: Optional[Path] = None) -> List[str]:
+    """Fração de pixels divergentes entre Pillow e Matplotlib, por caso.
+
+    Com `save`, grava os pares de imagens nessa pasta.
+    """
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    import numpy as np
+    from PIL import Image
+
+    from games.roleta.core.wheel_mpl import draw_wheel
+    from games.roleta.core.wheel_pil import render_frame
+
+    failures = []
+    for k, (labels, angle, highlight) in enumerate(WHEEL_CASES):
+        fig = draw_wheel(labels, angle, highlight)
+        buf = io.BytesIO()
+        fig.savefig(buf, format="png", dpi=WHEEL_SIZE / 5.5)
+        plt.close(fig)
+        ref = np.asarray(Image.open(buf).convert("RGB"), dtype=np.int16)
+        img = render_frame(labels, angle, highlight, size=WHEEL_SIZE)
+        out = np.asarray(img, dtype=np.int16)
+
+        diff = np.abs(ref - out).max(axis=2) > CHANNEL_TOLERANCE
+        frac = float(diff.mean())
+        ok = frac <= MAX_DIFF
+        print(f"  {'ok' if ok else 'FALHA':5} caso {k}: {len(labels):2} "
+              f"fatias, ângulo {angle:6.1f}, destaque {highlight}: "
+              f"{frac:.2%} divergentes")
+        if not ok:
+            failures.append(f"caso {k}: {frac:.2%} > {MAX_DIFF:.0%}")
+
+        if save:
+            save.mkdir(parents=True, exist_ok=True)
+            Image.fromarray(ref.astype(np.uint8)).save(save / f"{k}_mpl.png")
+            img.save(save / f"{k}_pil.png")
+    return failures
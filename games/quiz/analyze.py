@@ -0,0 +1,235 @@
+"""Analisa a distribuição de resultados de cada tema do quiz.
+
+Percorre os caminhos de resposta (todas as combinações de opções) com as
+mesmas regras de `compute_result` + `apply_variant`, em blocos processados
+por um pool de processos. Quando o espaço é grande demais, sorteia uma
+amostra uniforme no lugar da enumeração completa.
+
+Sai com código 1 se algum resultado for inalcançável numa enumeração
+completa. Na amostra, resultados não observados só aparecem no
+relatório: não sorteá-los não prova que são inalcançáveis.
+
+Uso:
+    python -m games.quiz.analyze [themes/x.json ...] [--workers N]
+        [--max-exhaustive N] [--samples N] [--chunk N] [--json]
+"""
+
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterator, List, Tuple
+
+import numpy as np
+
+from games.quiz.core.catalog import load_catalog
+from games.quiz.core.compiled import compile_theme
+from games.quiz.core.scoring import resolve_paths, signal_counts
+from games.quiz.core.theme_io import load_theme
+from games.quiz.core.variants import variant_table
+
+DEFAULT_MAX_EXHAUSTIVE = 4_000_000
+DEFAULT_SAMPLES = 1_000_000
+DEFAULT_CHUNK = 1 << 16
+
+_THEMES: Dict[str, Dict] = {}
+
+
+def _theme_for(path: str) -> Dict:
+    """Carrega o tema uma vez por processo."""
+    theme = _THEMES.get(path)
+    if theme is None:
+        theme = _THEMES[path] = load_theme(Path(path))
+    return theme
+
+
+def _decode(radix: np.ndarray, start: int, stop: int) -> np.ndarray:
+    """Converte os índices de [start, stop) em caminhos (base mista)."""
+    idx = np.arange(start, stop, dtype=np.int64)
+    paths = np.empty((idx.size, radix.size), dtype=np.int64)
+    for q in range(radix.size - 1, -1, -1):
+        idx, paths[:, q] = np.divmod(idx, radix[q])
+    return paths
+
+
+def _sample(radix: np.ndarray, n: int, seed: int) -> np.ndarray:
+    """Sorteia n caminhos com escolha uniforme em cada pergunta."""
+    rng = np.random.default_rng(seed)
+    return rng.integers(0, radix[None, :], size=(n, radix.size))
+
+
+def _run_chunk(task: Tuple[str, str, int, int, int]) -> Dict[str, np.ndarray]:
+    """Processa um bloco e devolve apenas os contadores agregados."""
+    path, mode, start, stop, seed = task
+    theme = _theme_for(path)
+    ct = compile_theme(theme)
+    radix = np.array([len(q.options) for q in ct.questions], dtype=np.int64)
+
+    if mode == "exhaustive":
+        paths = _decode(radix, start, stop)
+    else:
+        paths = _sample(radix, stop - start, seed)
+
+    winner, stage = resolve_paths(theme, paths)
+    hits = variant_table(theme).match_many(winner, signal_counts(theme, paths))
+
+    n_res = len(ct.result_keys)
+    n_var = max(
+        (len(theme["results"][rk].get("variants", []))
+         for rk in ct.result_keys),
+        default=0,
+    )
+    variants = np.zeros((n_res, n_var + 1), dtype=np.int64)
+    np.add.at(variants, (winner, hits + 1), 1)
+    return {
+        "results": np.bincount(winner, minlength=n_res),
+        "stages": np.bincount(stage + 1, minlength=len(ct.tie_breakers) + 2),
+        "variants": variants,
+    }
+
+
+def _tasks(path: str, mode: str, n: int, chunk: int,
+           seed: int) -> Iterator[Tuple[str, str, int, int, int]]:
+    """Gera as tarefas em blocos, sem materializar todos os caminhos."""
+    for i, start in enumerate(range(0, n, chunk)):
+        yield path, mode, start, min(start + chunk, n), seed + i
+
+
+def analyze_theme(path: Path, workers: int = 0,
+                  max_exhaustive: int = DEFAULT_MAX_EXHAUSTIVE,
+                  samples: int = DEFAULT_SAMPLES,
+                  chunk: int = DEFAULT_CHUNK, seed: int = 0) -> Dict:
+    """Calcula probabilidades, variantes e desempates de um tema."""
+    theme = load_theme(path)
+    ct = compile_theme(theme)
+    total = 1
+    for q in ct.questions:
+        total *= max(len(q.options), 1)
+
+    mode = "exhaustive" if total <= max_exhaustive else "sampled"
+    n = total if mode == "exhaustive" else samples
+    tasks = _tasks(str(path), mode, n, chunk, seed)
+
+    acc: Dict[str, np.ndarray] = {}
+    if workers == 1:
+        for part in map(_run_chunk, tasks):
+            _merge(acc, part)
+    else:
+        with ProcessPoolExecutor(max_workers=workers or None) as pool:
+            for part in pool.map(_run_chunk, tasks):
+                _merge(acc, part)
+
+    return _report(theme, ct, mode, total, n, acc)
+
+
+def _merge(acc: Dict[str, np.ndarray], part: Dict[str, np.ndarray]) -> None:
+    """Soma os contadores de um bloco ao acumulado."""
+    for key, arr in part.items():
+        if key in acc:
+            acc[key] += arr
+        else:
+            acc[key] = arr.copy()
+
+
+def _report(theme: Dict, ct, mode: str, total: int, n: int,
+            acc: Dict[str, np.ndarray]) -> Dict:
+    """Monta o relatório final em estruturas simples (serializáveis)."""
+    results = {}
+    for r, rk in enumerate(ct.result_keys):
+        hits = int(acc["results"][r])
+        row = acc["variants"][r]
+        variants = theme["results"][rk].get("variants", [])
+        results[rk] = {
+            "count": hits,
+            "probability": hits / n if n else 0.0,
+            "variants": {
+                "none": int(row[0]) / hits if hits else 0.0,
+                **{
+                    str(i): int(row[i + 1]) / hits if hits else 0.0
+                    for i in range(len(variants))
+                },
+            },
+        }
+
+    stages = acc["stages"]
+    tie_breaks = {"no_tie": int(stages[0]) / n if n else 0.0}
+    for k, q_id in enumerate(ct.tie_breakers):
+        tie_breaks[q_id] = int(stages[k + 1]) / n if n else 0.0
+    tie_breaks["alphabetical"] = int(stages[-1]) / n if n else 0.0
+
+    return {
+        "id": ct.id,
+        "title": theme.get("title", ct.id),
+        "mode": mode,
+        "space": total,
+        "paths": n,
+        "results": results,
+        "unreachable": [rk for rk, r in results.items() if r["count"] == 0],
+        "tie_breaks": tie_breaks,
+    }
+
+
+def _format(rep: Dict) -> str:
+    """Formata o relatório de um tema como texto."""
+    how = "exaustivo" if rep["mode"] == "exhaustive" else "amostragem"
+    lines = [
+        f"Tema: {rep['title']} ({rep['id']}) — {how}, "
+        f"{rep['paths']:,} de {rep['space']:,} caminhos"
+    ]
+    for rk, r in rep["results"].items():
+        vs = " | ".join(
+            f"{'sem' if k == 'none' else '#' + str(int(k) + 1)} {p:.1%}"
+            for k, p in r["variants"].items()
+        )
+        lines.append(f"  {rk:<24} {r['probability']:7.2%}   variantes: {vs}")
+
+    tb = " | ".join(f"{k} {p:.2%}" for k, p in rep["tie_breaks"].items())
+    lines.append(f"  desempate: {tb}")
+    if rep["unreachable"]:
+        label = ("inalcançáveis" if rep["mode"] == "exhaustive"
+                 else "não observados")
+        lines.append(f"  {label}: {', '.join(rep['unreachable'])}")
+    return "\n".join(lines)
+
+
+def main(argv: List[str] | None = None) -> int:
+    """Ponto de entrada da linha de comando."""
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("themes", nargs="*", type=Path,
+                    help="arquivos de tema (padrão: todos de themes/)")
+    ap.add_argument("--workers", type=int, default=0,
+                    help="processos (0 = número de CPUs, 1 = sem pool)")
+    ap.add_argument("--max-exhaustive", type=int,
+                    default=DEFAULT_MAX_EXHAUSTIVE)
+    ap.add_argument("--samples", type=int, default=DEFAULT_SAMPLES)
+    ap.add_argument("--chunk", type=int, default=DEFAULT_CHUNK)
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--json", action="store_true", help="saída em JSON")
+    args = ap.parse_args(argv)
+
+    paths = args.themes or [it["path"] for it in load_catalog()]
+    reports = [
+        analyze_theme(
+            p,
+            workers=args.workers or os.cpu_count() or 1,
+            max_exhaustive=args.max_exhaustive,
+            samples=args.samples,
+            chunk=args.chunk,
+            seed=args.seed,
+        )
+        for p in paths
+    ]
+
+    if args.json:
+        json.dump(reports, sys.stdout, ensure_ascii=False, indent=2)
+        print()
+    else:
+        print("\n\n".join(_format(r) for r in reports))
+    return 1 if any(r["unreachable"] and r["mode"] == "exhaustive"
+                    for r in reports) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
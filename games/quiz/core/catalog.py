@@ -0,0 +1,114 @@
+"""Catálogo de temas compartilhado entre sessões, invalidado por mtime."""
+
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from games.quiz.core.theme_io import (
+    load_theme,
+    load_theme_files,
+    validate_theme,
+)
+from games.shared.bundle import bundle_theme
+from games.shared.metrics import register_stats, timed
+
+# Caminho → (mtime_ns, tamanho, item do catálogo ou None se não for tema).
+_ENTRIES: Dict[Path, Tuple[int, int, Optional[Dict]]] = {}
+_STATS = {"hits": 0, "misses": 0, "not_theme": 0}
+_LOCK = threading.Lock()
+
+
+def _stamp(path: Path) -> Tuple[int, int]:
+    """Retorna (mtime_ns, tamanho) do arquivo."""
+    info = path.stat()
+    return info.st_mtime_ns, info.st_size
+
+
+def _make_item(path: Path, data: Dict) -> Dict:
+    """Monta o item do catálogo usado pela tela inicial."""
+    return {
+        "id": data["id"],
+        "title": data["title"],
+        "requires": data.get("requires"),
+        "requires_any": data.get("requires_any"),
+        "path": path,
+        "raw": data,
+    }
+
+
+def _parse(path: Path) -> Optional[Dict]:
+    """Lê e valida um arquivo; None se não for um tema utilizável.
+
+    Se o bundle tem o arquivo com o mesmo conteúdo, usa os dados já
+    validados no build.
+    """
+    found, data = bundle_theme(path)
+    if found:
+        return _make_item(path, data) if data is not None else None
+    try:
+        data = load_theme(path)
+    except ValueError:
+        # JSON inválido ou arquivo que não é tema de quiz
+        return None
+    if validate_theme(data):
+        # Tema malformado nunca chega às páginas
+        return None
+    return _make_item(path, data)
+
+
+@timed(game="quiz")
+def load_catalog() -> List[Dict]:
+    """Retorna os temas válidos, relendo apenas arquivos alterados.
+
+    Cada arquivo é interpretado uma única vez por combinação de mtime e
+    tamanho; na primeira vez, vêm do bundle se o conteúdo bate com o build.
+    Arquivos que não são temas (ex.: `cards.json`) ou que falham na
+    validação também ficam registrados, para não serem relidos.
+    Os itens retornados são compartilhados entre sessões: não altere.
+    """
+    items: List[Dict] = []
+    with _LOCK:
+        seen = set()
+        for p in load_theme_files():
+            try:
+                stamp = _stamp(p)
+            except OSError:
+                continue
+            seen.add(p)
+
+            entry = _ENTRIES.get(p)
+            if entry is not None and entry[:2] == stamp:
+                _STATS["hits"] += 1
+                item = entry[2]
+            else:
+                _STATS["misses"] += 1
+                item = _parse(p)
+                _ENTRIES[p] = (stamp[0], stamp[1], item)
+
+            if item is None:
+                _STATS["not_theme"] += 1
+                continue
+            items.append(item)
+
+        for gone in set(_ENTRIES) - seen:
+            del _ENTRIES[gone]
+    return items
+
+
+def catalog_stats() -> Dict[str, int]:
+    """Retorna contadores de acertos e falhas do cache de temas."""
+    with _LOCK:
+        out = dict(_STATS)
+        out["files"] = len(_ENTRIES)
+    return out
+
+
+register_stats("quiz.catalog", catalog_stats)
+
+
+def clear_catalog() -> None:
+    """Esvazia o cache (útil em testes e após trocar THEMES_DIR)."""
+    with _LOCK:
+        _ENTRIES.clear()
+        for key in _STATS:
+            _STATS[key] = 0
@@ -0,0 +1,192 @@
+"""Representação compilada de um tema, com índices prontos para consulta."""
+
+import hashlib
+import json
+import sys
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+_MAX_COMPILED = 64
+
+
+@dataclass(frozen=True, eq=False)
+class CompiledOption:
+    """Opção de uma pergunta com pesos, sinais e plano já resolvidos."""
+
+    id: str
+    index: int
+    weights: Dict[str, int]
+    signals: Tuple[str, ...]
+    plan: Tuple[Tuple[str, str], ...]
+
+
+@dataclass(frozen=True, eq=False)
+class CompiledQuestion:
+    """Pergunta com índice de opções por id."""
+
+    id: str
+    index: int
+    weights: Dict[str, int]
+    options: Tuple[CompiledOption, ...]
+    option_index: Dict[str, CompiledOption]
+
+
+@dataclass(frozen=True, eq=False)
+class CompiledTheme:
+    """Tema pronto para o motor: perguntas, opções e sinais indexados.
+
+    É construído uma vez por versão do tema (ver `compile_theme`) e
+    compartilhado entre sessões, por isso nunca deve ser alterado.
+    """
+
+    raw: Dict
+    id: str
+    version: str
+    result_keys: Tuple[str, ...]
+    questions: Tuple[CompiledQuestion, ...]
+    question_index: Dict[str, CompiledQuestion]
+    tie_breakers: Tuple[str, ...]
+    signals: Tuple[str, ...]
+    signal_index: Dict[str, int]
+
+    def question(self, q_id: str) -> Optional[CompiledQuestion]:
+        """Retorna a pergunta pelo id, ou None."""
+        return self.question_index.get(q_id)
+
+    def option(self, q_id: str, opt_id: str) -> Optional[CompiledOption]:
+        """Retorna a opção escolhida numa pergunta, ou None."""
+        q = self.question_index.get(q_id)
+        if q is None:
+            return None
+        return q.option_index.get(opt_id)
+
+    def weights_for(self, q_id: str, opt_id: str) -> Dict[str, int]:
+        """Pesos da opção; cai nos pesos da pergunta se a opção não existir.
+
+        Levanta KeyError se a pergunta não fizer parte do tema.
+        """
+        q = self.question_index[q_id]
+        opt = q.option_index.get(opt_id)
+        return opt.weights if opt else q.weights
+
+    def answer_pairs(self, picks: Sequence[int]) -> List[Tuple[str, str]]:
+        """Pares (q_id, opt_id) a partir dos índices de opção escolhidos.
+
+        Índices fora da pergunta viram opção "" (vale o peso da pergunta).
+        """
+        out = []
+        for q, pick in zip(self.questions, picks):
+            opt_id = q.options[pick].id if pick < len(q.options) else ""
+            out.append((q.id, opt_id))
+        return out
+
+
+def theme_version(theme: Dict) -> str:
+    """Hash curto do conteúdo do tema; muda a cada edição do arquivo."""
+    data = json.dumps(theme, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.blake2b(data.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def _int_weights(raw: Dict) -> Dict[str, int]:
+    """Converte o dicionário de pesos para inteiros."""
+    return {str(k): int(v) for k, v in (raw or {}).items()}
+
+
+def _build(theme: Dict) -> CompiledTheme:
+    """Compila o JSON bruto do tema."""
+    all_signals = set()
+    questions = []
+    for qi, q in enumerate(theme.get("questions", [])):
+        options = []
+        for oi, o in enumerate(q.get("options", [])):
+            signals = tuple(sys.intern(str(s)) for s in o.get("signals", []))
+            all_signals.update(signals)
+            plan = tuple(
+                (sys.intern(str(k)), str(v))
+                for k, v in o.get("plan", {}).items()
+            )
+            options.append(
+                CompiledOption(
+                    id=o.get("id"),
+                    index=oi,
+                    weights=_int_weights(o.get("weights")),
+                    signals=signals,
+                    plan=plan,
+                )
+            )
+        questions.append(
+            CompiledQuestion(
+                id=q["id"],
+                index=qi,
+                weights=_int_weights(q.get("weights")),
+                options=tuple(options),
+                option_index={o.id: o for o in options},
+            )
+        )
+
+    signals = tuple(sorted(all_signals))
+    return CompiledTheme(
+        raw=theme,
+        id=theme.get("id", ""),
+        version=theme_version(theme),
+        result_keys=tuple(theme.get("results", {}).keys()),
+        questions=tuple(questions),
+        question_index={q.id: q for q in questions},
+        tie_breakers=tuple(theme.get("tie_breakers", [])),
+        signals=signals,
+        signal_index={s: i for i, s in enumerate(signals)},
+    )
+
+
+_COMPILED: "OrderedDict[int, CompiledTheme]" = OrderedDict()
+_VERSIONS: "OrderedDict[Tuple[str, str], CompiledTheme]" = OrderedDict()
+_LOCK = threading.Lock()
+
+
+def _remember(ct: CompiledTheme) -> None:
+    """Registra o tema por (id, versão); chamar com o lock."""
+    key = (ct.id, ct.version)
+    _VERSIONS[key] = ct
+    _VERSIONS.move_to_end(key)
+    while len(_VERSIONS) > _MAX_COMPILED:
+        _VERSIONS.popitem(last=False)
+
+
+def compile_theme(theme: Dict) -> CompiledTheme:
+    """Retorna o tema compilado, construindo-o só na primeira chamada.
+
+    O cache usa a identidade do dicionário: cada versão carregada do tema
+    é um objeto novo e, portanto, ganha sua própria compilação.
+    """
+    key = id(theme)
+    with _LOCK:
+        ct = _COMPILED.get(key)
+        if ct is not None and ct.raw is theme:
+            _COMPILED.move_to_end(key)
+            _remember(ct)
+            return ct
+
+    ct = _build(theme)
+    with _LOCK:
+        _COMPILED[key] = ct
+        _COMPILED.move_to_end(key)
+        while len(_COMPILED) > _MAX_COMPILED:
+            _COMPILED.popitem(last=False)
+        _remember(ct)
+    return ct
+
+
+def find_compiled(theme_id: str, version: str) -> Optional[CompiledTheme]:
+    """Tema compilado de uma versão específica, se ainda estiver em cache.
+
+    É o que as sessões usam para achar o tema a partir de `(id, versão)`
+    sem guardar o dicionário: versões antigas continuam disponíveis
+    enquanto não forem descartadas do cache.
+    """
+    with _LOCK:
+        ct = _VERSIONS.get((theme_id, version))
+        if ct is not None:
+            _VERSIONS.move_to_end((theme_id, version))
+        return ct
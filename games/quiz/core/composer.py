@@ -1,79 +1,219 @@
-"""Funções para compor o convite final do tema Surpresa."""
+"""Funções para compor o convite final do tema Surpresa.
 
-from typing import Dict, List, Tuple
+O convite é montado por um programa compilado uma vez por versão do
+tema, a partir de `compose_map`, `compose_order` e, se houver,
+`compose_templates`:
+
+    "compose_templates": {
+      "sentences": [
+        ["Que tal {horario}?"],
+        ["Pensei em {lugar} com clima {vibe}.", "Pensei em {lugar}."]
+      ],
+      "closing": "Se topar, eu organizo tudo. :)"
+    }
+
+Cada frase é uma lista de alternativas; vale a primeira cujas lacunas
+têm todas uma expressão no plano. As frases saem na ordem de
+`compose_order` (pela lacuna que aparece primeiro nela), e itens da
+ordem sem frase própria ganham "{item}.". Sem `compose_templates`,
+valem os modelos padrão abaixo, que reproduzem o texto de sempre.
+"""
+
+import itertools
+import math
+import string
+import threading
+import weakref
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Tuple
+
+from games.quiz.core.compiled import CompiledTheme, compile_theme
+
+DEFAULT_SENTENCES: Tuple[Tuple[str, ...], ...] = (
+    ("Que tal {horario}?",),
+    ("Pensei em {lugar} com clima {vibe}.", "Pensei em {lugar}."),
+    ("A ideia é {atividade}.",),
+    ("Pra comer, {comida}; pra beber, {bebida}.", "Pra comer, {comida}.",
+     "Pra beber, {bebida}."),
+    ("Música em volume {som}.",),
+    ("Vamos {transporte}.",),
+    ("Orçamento {orcamento}.",),
+    ("Dress code {dress}.",),
+    ("Gesto extra: {gesto}.",),
+    ("Se chover, {clima}.",),
+)
+DEFAULT_CLOSING = "Se topar, eu organizo tudo do jeitinho que você escolheu. :)"
+GENERIC_SENTENCE = "{%s}."
+
+# Acima disso, a frase não ganha tabela pronta e é montada a cada convite.
+MAX_TABLE = 4096
+
+# Uma alternativa compilada: (lacunas exigidas, modelo para format_map).
+Alternative = Tuple[Tuple[str, ...], str]
+
+
+@dataclass(frozen=True, eq=False)
+class Sentence:
+    """Frase compilada: lacunas, alternativas e a tabela de textos prontos.
+
+    `table` vai dos valores do plano direto ao texto da frase ("" se
+    nenhuma alternativa serve). A chave é o próprio valor quando a frase
+    tem uma lacuna só e a tupla de valores (um por lacuna, None para
+    ausente) quando tem várias.
+    """
+
+    slots: Tuple[str, ...]
+    alternatives: Tuple[Alternative, ...]
+    table: Dict[Any, str]
+
+    def fill(self, phrases: Dict[str, Dict[str, str]],
+             values: Any) -> str:
+        """Monta a frase sem a tabela (valores fora de compose_map)."""
+        if len(self.slots) == 1 and not isinstance(values, tuple):
+            values = (values,)
+        filled = {}
+        for slot, v in zip(self.slots, values):
+            phrase = phrases.get(slot, {}).get(v) if v else None
+            if phrase:
+                filled[slot] = phrase
+        for slots, template in self.alternatives:
+            if all(s in filled for s in slots):
+                return template.format_map(filled)
+        return ""
+
+
+@dataclass(frozen=True, eq=False)
+class InviteProgram:
+    """Convite compilado: tabelas de frases e frases em ordem.
+
+    `phrases[k]` leva o valor do plano à expressão da lacuna k;
+    `sentences` já está na ordem final. Renderizar é uma consulta de
+    tabela por frase.
+    """
+
+    phrases: Dict[str, Dict[str, str]]
+    sentences: Tuple[Sentence, ...]
+    closing: str
+    separator: str = " "
+
+    def render(self, plan: Dict[str, str]) -> str:
+        """Texto do convite para um plano."""
+        parts: List[str] = []
+        get = plan.get
+        for sentence in self.sentences:
+            slots = sentence.slots
+            key = get(slots[0]) if len(slots) == 1 else tuple(map(get, slots))
+            text = sentence.table.get(key)
+            if text is None:
+                text = sentence.fill(self.phrases, key)
+            if text:
+                parts.append(text)
+        if self.closing:
+            parts.append(self.closing)
+        return self.separator.join(parts)
+
+
+def _compile_alternative(template: str) -> Alternative:
+    """Lacunas do modelo (sem repetição, na ordem) e o próprio modelo."""
+    slots: List[str] = []
+    for _, field, _, _ in string.Formatter().parse(template):
+        if field and field not in slots:
+            slots.append(field)
+    return tuple(slots), template
+
+
+def _compile_sentence(alternatives: Tuple[Alternative, ...],
+                      phrases: Dict[str, Dict[str, str]]) -> Sentence:
+    """Frase com a tabela de todas as combinações de valores conhecidos."""
+    slots: List[str] = []
+    for alt_slots, _ in alternatives:
+        slots += [s for s in alt_slots if s not in slots]
+    sentence = Sentence(tuple(slots), alternatives, {})
+    domains = [[*phrases.get(s, {}), None, ""] for s in slots]
+    if math.prod(len(d) for d in domains) <= MAX_TABLE:
+        for values in itertools.product(*domains):
+            key = values[0] if len(values) == 1 else values
+            sentence.table[key] = sentence.fill(phrases, values)
+    return sentence
+
+
+def _build(ct: CompiledTheme) -> InviteProgram:
+    """Compila o convite do tema."""
+    raw = ct.raw
+    cmap = raw.get("compose_map") or {}
+    phrases = {k: dict(v) for k, v in cmap.items() if isinstance(v, dict)}
+    order = list(raw.get("compose_order") or [])
+    custom = raw.get("compose_templates") or {}
+    templates = custom.get("sentences", DEFAULT_SENTENCES)
+
+    sentences = []
+    covered = set()
+    for sentence in templates:
+        if isinstance(sentence, str):
+            sentence = [sentence]
+        compiled = _compile_sentence(
+            tuple(_compile_alternative(t) for t in sentence), phrases
+        )
+        if not any(s in cmap for s in compiled.slots):
+            continue
+        covered.update(compiled.slots)
+        sentences.append(compiled)
+    for key in order:
+        if key not in covered:
+            alternative = _compile_alternative(GENERIC_SENTENCE % key)
+            sentences.append(_compile_sentence((alternative,), phrases))
+            covered.add(key)
+
+    rank = {k: i for i, k in enumerate(order)}
+    # estável: frases fora de compose_order mantêm a ordem de declaração
+    sentences.sort(key=lambda st: min(rank.get(s, len(rank))
+                                      for s in st.slots))
+    return InviteProgram(
+        phrases=phrases,
+        sentences=tuple(sentences),
+        closing=custom.get("closing", DEFAULT_CLOSING),
+        separator=custom.get("separator", " "),
+    )
+
+
+_PROGRAMS: "weakref.WeakKeyDictionary[CompiledTheme, InviteProgram]" = (
+    weakref.WeakKeyDictionary()
+)
+_LOCK = threading.Lock()
+
+
+def invite_program(theme: Dict) -> InviteProgram:
+    """Retorna o convite compilado do tema, uma vez por versão."""
+    ct = compile_theme(theme)
+    with _LOCK:
+        program = _PROGRAMS.get(ct)
+    if program is None:
+        program = _build(ct)
+        with _LOCK:
+            _PROGRAMS[ct] = program
+    return program
 
 
 def collect_plan(theme: dict, answers: List[Tuple[str, str]]) -> Dict[str, str]:
     """Coleta o dicionário plan selecionado em cada pergunta."""
-    q_index = {q["id"]: q for q in theme.get("questions", [])}
+    ct = compile_theme(theme)
     plan: Dict[str, str] = {}
     for q_id, opt_id in answers:
-        q = q_index.get(q_id)
-        if not q:
-            continue
-        opt = next((o for o in q.get("options", []) if o.get("id") == opt_id),
-                   None)
+        opt = ct.option(q_id, opt_id)
         if not opt:
             continue
-        opt_plan = opt.get("plan", {})
-        for k, v in opt_plan.items():
+        for k, v in opt.plan:
             plan[k] = v
     return plan
 
 
 def compose_invite(theme: dict, plan: Dict[str, str]) -> str:
     """Gera o texto do convite a partir de compose_map e compose_order."""
-    cmap = theme.get("compose_map", {})
-    order = theme.get("compose_order", [])
-    parts: List[str] = []
-
-    # Frases principais em ordem intuitiva
-    horario = _phrase(cmap, "horario", plan.get("horario"))
-    lugar = _phrase(cmap, "lugar", plan.get("lugar"))
-    vibe = _phrase(cmap, "vibe", plan.get("vibe"))
-    atividade = _phrase(cmap, "atividade", plan.get("atividade"))
-    comida = _phrase(cmap, "comida", plan.get("comida"))
-    bebida = _phrase(cmap, "bebida", plan.get("bebida"))
-    som = _phrase(cmap, "som", plan.get("som"))
-    transporte = _phrase(cmap, "transporte", plan.get("transporte"))
-    orcamento = _phrase(cmap, "orcamento", plan.get("orcamento"))
-    dress = _phrase(cmap, "dress", plan.get("dress"))
-    gesto = _phrase(cmap, "gesto", plan.get("gesto"))
-    clima = _phrase(cmap, "clima", plan.get("clima"))
-
-    if horario:
-        parts.append(f"Que tal {horario}?")
-    if lugar and vibe:
-        parts.append(f"Pensei em {lugar} com clima {vibe}.")
-    elif lugar:
-        parts.append(f"Pensei em {lugar}.")
-    if atividade:
-        parts.append(f"A ideia é {atividade}.")
-    if comida and bebida:
-        parts.append(f"Pra comer, {comida}; pra beber, {bebida}.")
-    elif comida:
-        parts.append(f"Pra comer, {comida}.")
-    elif bebida:
-        parts.append(f"Pra beber, {bebida}.")
-    if som:
-        parts.append(f"Música em volume {som}.")
-    if transporte:
-        parts.append(f"Vamos {transporte}.")
-    if orcamento:
-        parts.append(f"Orçamento {orcamento}.")
-    if dress:
-        parts.append(f"Dress code {dress}.")
-    if gesto:
-        parts.append(f"Gesto extra: {gesto}.")
-    if clima:
-        parts.append(f"Se chover, {clima}.")
-
-    parts.append("Se topar, eu organizo tudo do jeitinho que você escolheu. :)")
-    return " ".join(parts)
-
-
-def _phrase(cmap: dict, key: str, value: str) -> str:
-    """Resolve a frase amigável para um valor do plano."""
-    if not value:
-        return ""
-    return cmap.get(key, {}).get(value, "")
+    return invite_program(theme).render(plan)
+
+
+def compose_invites(theme: dict,
+                    plans: Iterable[Dict[str, str]]) -> List[str]:
+    """Gera convites para muitos planos de uma vez (compila uma única vez)."""
+    render = invite_program(theme).render
+    return [render(plan) for plan in plans]
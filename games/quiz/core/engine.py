@@ -3,28 +3,26 @@
 from typing import Dict, List, Tuple
 from collections import Counter
 
+from games.quiz.core.compiled import compile_theme
+from games.quiz.core.variants import first_match, signal_vector, variant_table
+
 
 def resolve_tie(candidates, theme, answers):
     """Resolve empates usando tie_breakers definidos no tema."""
     ans_map = {q: a for q, a in answers}
-    q_index = {q["id"]: q for q in theme["questions"]}
-    tb = theme.get("tie_breakers", [])
+    ct = compile_theme(theme)
 
-    for q_id in tb:
+    for q_id in ct.tie_breakers:
         if q_id not in ans_map:
             continue
 
-        q = q_index[q_id]
-        opt = next((o for o in q.get("options", [])
-                    if o.get("id") == ans_map[q_id]), None)
-
-        weights = opt.get("weights", {}) if opt else q.get("weights", {})
+        weights = ct.weights_for(q_id, ans_map[q_id])
 
         best, best_val = None, -10**9
         vals = []
 
         for c in candidates:
-            v = int(weights.get(c, 0))
+            v = weights.get(c, 0)
             vals.append(v)
             if v > best_val:
                 best, best_val = c, v
@@ -47,42 +45,50 @@ def compute_result(scores, theme, answers):
 def tally_signals(theme, answers):
     """Conta sinais (signals) marcados nas opções selecionadas."""
     counts = Counter()
-    q_index = {q["id"]: q for q in theme["questions"]}
+    ct = compile_theme(theme)
 
     for q_id, opt_id in answers:
-        q = q_index.get(q_id)
-        if not q:
-            continue
-
-        opt = next((o for o in q.get("options", []) if o.get("id") == opt_id), None)
+        opt = ct.option(q_id, opt_id)
         if not opt:
             continue
 
-        for s in opt.get("signals", []):
+        for s in opt.signals:
             counts[s] += 1
 
     return dict(counts)
 
 
-def apply_variant(block, theme, answers):
-    """Aplica variante condicional ao resultado final."""
-    variants = block.get("variants", [])
+def apply_variant(block, theme, answers, key=None, counts=None):
+    """Aplica variante condicional ao resultado final.
+
+    Quando o bloco é o próprio `theme["results"][key]`, as regras vêm
+    compiladas de `variants.variant_table`; `key` (chave do resultado) e
+    `counts` (contagem de sinais na ordem do tema) podem vir prontos.
+    Qualquer outro bloco (cópia, bloco alterado) tem as suas próprias
+    `variants` avaliadas diretamente.
+    """
+    variants = block.get("variants")
     if not variants:
         return block
 
-    sigs = tally_signals(theme, answers)
-
-    for v in variants:
-        cond = v.get("when", {})
-        sig = cond.get("signal")
-        need = cond.get("min", 1)
-
-        if sig and sigs.get(sig, 0) >= need:
-            out = dict(block)
-            if "body_prefix" in v:
-                out["body"] = f"{v['body_prefix']} {out['body']}"
-            if "body_suffix" in v:
-                out["body"] = f"{out['body']} {v['body_suffix']}"
-            return out
+    results = theme.get("results", {})
+    if key is None:
+        key = next((k for k, b in results.items() if b is block), None)
+
+    if key is not None and results.get(key) is block:
+        if counts is None:
+            counts = signal_vector(theme, answers)
+        table = variant_table(theme)
+        v_idx = table.match(table.theme.result_keys.index(key), counts)
+    else:
+        v_idx = first_match(variants, tally_signals(theme, answers))
+    if v_idx < 0:
+        return block
 
-    return block
+    v = variants[v_idx]
+    out = dict(block)
+    if "body_prefix" in v:
+        out["body"] = f"{v['body_prefix']} {out['body']}"
+    if "body_suffix" in v:
+        out["body"] = f"{out['body']} {v['body_suffix']}"
+    return out
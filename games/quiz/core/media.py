@@ -0,0 +1,120 @@
+"""Variantes otimizadas da mídia de resultado, geradas no build.
+
+`python -m games.quiz.media build` converte os GIFs/imagens de resultado
+em WebP (e GIF com paleta otimizada) de larguras limitadas e grava um
+manifesto. Aqui o app lê esse manifesto uma vez por processo e escolhe,
+para cada mídia, a menor variante que ainda cobre a largura de exibição.
+Animações são servidas em WebP animado, com um GIF de reserva para
+navegadores sem suporte (a variante GIF, ou o original se nenhuma
+couber) e o pôster estático equivalente.
+Entradas cujo sha256 de origem mudou depois do build são descartadas na
+leitura; sem manifesto, tudo cai no arquivo original.
+"""
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Optional
+
+from games.shared.bundle import source_digest
+
+ROOT_DIR = Path(__file__).resolve().parents[3]
+MEDIA_DIR = Path(os.environ.get("APP_MEDIA_DIR", ROOT_DIR / "build" / "media"))
+MANIFEST_NAME = "manifest.json"
+DISPLAY_WIDTH = int(os.environ.get("RESULT_MEDIA_WIDTH", "360"))
+# Animações: WebP animado, com GIF de reserva. O st.image recodificaria o
+# WebP (só o primeiro quadro), então a página serve os dois num <picture>.
+ANIMATED_FORMAT = "webp"
+FALLBACK_FORMAT = "gif"
+
+_LOCK = threading.Lock()
+_MEDIA: Optional[Dict[str, Dict]] = None
+
+
+def read_manifest(media_dir: Path = MEDIA_DIR) -> Dict[str, Dict]:
+    """Entradas do manifesto ainda válidas (mesmo sha256 da origem)."""
+    try:
+        data = json.loads((media_dir / MANIFEST_NAME).read_text("utf-8"))
+    except (OSError, ValueError):
+        return {}
+    out = {}
+    for rel, entry in data.get("media", {}).items():
+        src = ROOT_DIR / rel
+        if not src.is_file() or entry.get("sha256") != source_digest(src):
+            continue
+        variants = [v for v in entry.get("variants", [])
+                    if (media_dir / v["file"]).exists()]
+        posters = [v for v in entry.get("posters", [])
+                   if (media_dir / v["file"]).exists()]
+        if variants:
+            out[rel] = dict(entry, variants=variants, posters=posters)
+    return out
+
+
+def _media() -> Dict[str, Dict]:
+    """Manifesto do processo (lido uma única vez)."""
+    global _MEDIA
+    if _MEDIA is None:
+        with _LOCK:
+            if _MEDIA is None:
+                _MEDIA = read_manifest()
+    return _MEDIA
+
+
+def pick_variant(entry: Dict, width: int = DISPLAY_WIDTH,
+                 kind: str = "variants",
+                 fmt: Optional[str] = None) -> Optional[Dict]:
+    """Menor variante (em bytes) com largura suficiente para `width`.
+
+    Com `fmt`, só considera variantes desse formato.
+    """
+    need = min(width, entry["width"])
+    items = entry.get(kind, [])
+    if fmt is not None:
+        items = [v for v in items if v["format"] == fmt]
+    fits = [v for v in items if v["width"] >= need]
+    if not fits:
+        return None
+    return min(fits, key=lambda v: v["bytes"])
+
+
+def served_variant(entry: Dict, width: int = DISPLAY_WIDTH) -> Optional[Dict]:
+    """Variante servida: o WebP animado nas animações, a menor nas demais."""
+    if entry.get("frames", 1) > 1:
+        return pick_variant(entry, width, fmt=ANIMATED_FORMAT)
+    return pick_variant(entry, width)
+
+
+def best_variant(media_path: str, width: int = DISPLAY_WIDTH) -> Optional[Path]:
+    """Arquivo da variante servida para a mídia do tema, ou None."""
+    entry = _media().get(media_path)
+    if entry is None:
+        return None
+    v = served_variant(entry, width)
+    return MEDIA_DIR / v["file"] if v else None
+
+
+def best_fallback(media_path: str,
+                  width: int = DISPLAY_WIDTH) -> Optional[Path]:
+    """GIF de reserva de uma animação servida em WebP, ou None.
+
+    É a variante GIF que cobre a largura; se nenhuma coube no limite de
+    bytes do build, o próprio original.
+    """
+    entry = _media().get(media_path)
+    if entry is None or served_variant(entry, width) is None:
+        return None
+    if entry.get("frames", 1) <= 1:
+        return None
+    v = pick_variant(entry, width, fmt=FALLBACK_FORMAT)
+    return MEDIA_DIR / v["file"] if v else ROOT_DIR / media_path
+
+
+def best_poster(media_path: str, width: int = DISPLAY_WIDTH) -> Optional[Path]:
+    """Pôster estático da animação, ou None se não houver."""
+    entry = _media().get(media_path)
+    if entry is None:
+        return None
+    v = pick_variant(entry, width, "posters")
+    return MEDIA_DIR / v["file"] if v else None
@@ -0,0 +1,191 @@
+"""Índice da mídia dos temas, montado junto com o snapshot.
+
+Resolve de uma vez, fora do caminho de renderização, a thumbnail de cada
+tema e a imagem de cada pergunta e resultado: caminho do arquivo a
+enviar (a variante otimizada de `games.quiz.core.media`, quando houver),
+tamanho, dimensões e hash do conteúdo. As páginas só consultam
+dicionários e nunca tocam no sistema de arquivos.
+
+Os dados de cada arquivo ficam em cache por carimbo (mtime, tamanho);
+na primeira leitura de um arquivo, o registro do bundle vale se o sha256
+do conteúdo bate, então só imagens que mudaram são abertas de novo.
+"""
+
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from games.quiz.core.media import best_fallback, best_poster, best_variant
+from games.shared.bundle import bundle_media, source_digest, source_stamp
+
+ROOT_DIR = Path(__file__).resolve().parents[3]
+THUMB_NAMES = ("thumb", "cover", "card", "_thumb", "_cover")
+THUMB_EXTS = ("png", "jpg", "jpeg", "webp", "gif")
+
+# (tamanho, largura, altura, sha256)
+FileRecord = Tuple[int, int, int, str]
+
+_LOCK = threading.Lock()
+_RECORDS: Dict[str, Tuple[Tuple[int, int], FileRecord]] = {}
+
+
+@dataclass(frozen=True)
+class MediaInfo:
+    """Arquivo resolvido de uma mídia citada por um tema."""
+
+    path: Path
+    size: int
+    width: int
+    height: int
+    sha256: str
+
+
+@dataclass(frozen=True, eq=False)
+class MediaIndex:
+    """Mídia resolvida de todos os temas de um snapshot.
+
+    `by_ref` usa o caminho exatamente como aparece no JSON (perguntas e
+    resultados); `posters` tem o pôster estático das animações e
+    `fallbacks` o GIF de reserva das servidas em WebP, pela mesma chave;
+    `thumbs` vai do id do tema à thumbnail encontrada.
+    Referências ausentes no disco não entram.
+    """
+
+    by_ref: Dict[str, MediaInfo] = field(default_factory=dict)
+    posters: Dict[str, MediaInfo] = field(default_factory=dict)
+    fallbacks: Dict[str, MediaInfo] = field(default_factory=dict)
+    thumbs: Dict[str, MediaInfo] = field(default_factory=dict)
+
+    def get(self, ref: Optional[str]) -> Optional[MediaInfo]:
+        """Mídia de uma pergunta ou resultado pelo caminho do JSON."""
+        return self.by_ref.get(ref) if ref else None
+
+    def poster(self, ref: Optional[str]) -> Optional[MediaInfo]:
+        """Pôster estático da animação, se o build gerou um."""
+        return self.posters.get(ref) if ref else None
+
+    def fallback(self, ref: Optional[str]) -> Optional[MediaInfo]:
+        """GIF de reserva, se a animação é servida em WebP."""
+        return self.fallbacks.get(ref) if ref else None
+
+    def thumb(self, theme_id: str) -> Optional[MediaInfo]:
+        """Thumbnail do tema, se houver."""
+        return self.thumbs.get(theme_id)
+
+
+def resolve(ref: str) -> Path:
+    """Resolve caminhos relativos ao diretório raiz do projeto."""
+    p = Path(ref)
+    return p if p.is_absolute() else ROOT_DIR / p
+
+
+def probe(path: Path) -> FileRecord:
+    """Lê tamanho, dimensões (só o cabeçalho) e sha256 do arquivo."""
+    from PIL import Image
+
+    digest = source_digest(path)
+    try:
+        with Image.open(path) as img:
+            width, height = img.size
+    except OSError:
+        width = height = 0
+    return path.stat().st_size, width, height, digest
+
+
+def file_record(path: Path) -> Optional[FileRecord]:
+    """Registro do arquivo (do cache, se o carimbo bate), ou None se faltar."""
+    stamp = source_stamp(path)
+    if stamp is None:
+        return None
+    key = str(path)
+    with _LOCK:
+        hit = _RECORDS.get(key)
+    if hit is not None and hit[0] == stamp:
+        return hit[1]
+    bundled = bundle_media(path)
+    record = tuple(bundled) if bundled else probe(path)
+    with _LOCK:
+        _RECORDS[key] = (stamp, record)
+    return record
+
+
+def _info(path: Path) -> Optional[MediaInfo]:
+    """MediaInfo do arquivo, ou None se ele não existir."""
+    record = file_record(path)
+    return MediaInfo(path, *record) if record else None
+
+
+def find_thumbnail(raw: Dict) -> Optional[Path]:
+    """Localiza a thumbnail do tema.
+
+    1) Se o JSON tiver "thumbnail", tenta usar.
+    2) Caso contrário, procura em assets/<pasta_do_tema>/{thumb,cover,card}.*
+    """
+    th = raw.get("thumbnail")
+    if th:
+        p = resolve(th)
+        if p.exists():
+            return p
+
+    folder = raw.get("id", "tema").split("_v")[0]
+    base = ROOT_DIR / "assets" / folder
+    for name in THUMB_NAMES:
+        for ext in THUMB_EXTS:
+            p = base / f"{name}.{ext}"
+            if p.exists():
+                return p
+    return None
+
+
+def theme_refs(raw: Dict) -> List[str]:
+    """Caminhos de mídia de perguntas e resultados, como no JSON."""
+    refs = [q["image"] for q in raw.get("questions", [])
+            if isinstance(q, dict) and q.get("image")]
+    for block in raw.get("results", {}).values():
+        if isinstance(block, dict):
+            refs += [block[k] for k in ("image_gif", "image") if block.get(k)]
+    return refs
+
+
+def build_media_index(themes: Iterable[Dict]) -> MediaIndex:
+    """Monta o índice para os itens do catálogo (com 'id' e 'raw')."""
+    index = MediaIndex()
+    for item in themes:
+        raw = item["raw"]
+        thumb = find_thumbnail(raw)
+        info = _info(thumb) if thumb else None
+        if info:
+            index.thumbs[item["id"]] = info
+        for ref in theme_refs(raw):
+            if ref in index.by_ref:
+                continue
+            info = _info(best_variant(ref) or resolve(ref))
+            if info:
+                index.by_ref[ref] = info
+            poster = best_poster(ref)
+            info = _info(poster) if poster else None
+            if info:
+                index.posters[ref] = info
+            fallback = best_fallback(ref)
+            info = _info(fallback) if fallback else None
+            if info:
+                index.fallbacks[ref] = info
+    return index
+
+
+def missing_media(raw: Dict) -> List[str]:
+    """Caminhos de mídia citados pelo tema que não existem no disco."""
+    return [ref for ref in theme_refs(raw) if not resolve(ref).is_file()]
+
+
+def media_records(themes: Iterable[Dict]) -> Dict[str, FileRecord]:
+    """Registros das fontes dos temas por caminho, para o bundle."""
+    out = {}
+    for raw in themes:
+        thumb = find_thumbnail(raw)
+        paths = [resolve(r) for r in theme_refs(raw)]
+        for p in ([thumb] if thumb else []) + paths:
+            if str(p) not in out and p.is_file():
+                out[str(p)] = probe(p)
+    return out
@@ -0,0 +1,109 @@
+"""Cache entre sessões do desfecho de uma partida do quiz.
+
+O desfecho (chave do resultado, bloco final já com a variante aplicada e
+o texto do convite) depende só da versão do tema e das opções escolhidas.
+Os caminhos possíveis são poucos e os populares se repetem entre
+pessoas, então o desfecho é calculado uma vez por `(id, versão, picks)`
+e guardado num LRU compartilhado: reruns da página de resultado e
+caminhos repetidos custam só a consulta.
+"""
+
+import os
+from dataclasses import dataclass
+from typing import Dict, Hashable, Optional, Sequence
+
+from games.quiz.core.compiled import CompiledTheme
+from games.quiz.core.engine import apply_variant, compute_result
+from games.shared.lru import ByteLRU
+from games.shared.metrics import register_stats
+
+# Importa o composer se existir; caso contrário, funciona sem convite.
+try:
+    from games.quiz.core.composer import (  # type: ignore
+        collect_plan,
+        compose_invite,
+    )
+    HAS_COMPOSER = True
+except Exception:  # noqa: BLE001
+    collect_plan = None  # type: ignore
+    compose_invite = None  # type: ignore
+    HAS_COMPOSER = False
+
+CACHE_BYTES = int(float(os.environ.get("QUIZ_OUTCOME_CACHE_MB", "8")) * 2**20)
+# Custo fixo estimado de um desfecho além dos textos (objetos e dict).
+_OVERHEAD = 512
+
+
+@dataclass(frozen=True)
+class Outcome:
+    """Desfecho pronto para a página de resultado (somente leitura)."""
+
+    key: str
+    block: Dict
+    invite: str
+
+
+def _sizeof(out: Outcome) -> int:
+    """Tamanho aproximado em bytes, para o orçamento do LRU."""
+    texts = [out.invite]
+    texts += [v for v in out.block.values() if isinstance(v, str)]
+    return _OVERHEAD + sum(len(t) for t in texts)
+
+
+_OUTCOMES = ByteLRU(CACHE_BYTES, sizeof=_sizeof)
+
+
+def wants_invite(theme: Dict) -> bool:
+    """Se o tema mostra convite (Surpresa ou com compose_map)."""
+    return theme.get("id", "").startswith("surpresa") or bool(
+        theme.get("compose_map")
+    )
+
+
+def outcome_key(ct: CompiledTheme, picks: Sequence[int]) -> Hashable:
+    """Chave canônica: tema, versão e opções escolhidas."""
+    return ct.id, ct.version, bytes(picks)
+
+
+def compute_outcome(ct: CompiledTheme, picks: Sequence[int],
+                    scores: Dict[str, int],
+                    counts: Optional[Sequence[int]] = None) -> Outcome:
+    """Calcula o desfecho sem cache."""
+    theme = ct.raw
+    answers = ct.answer_pairs(picks)
+    key, base = compute_result(scores=scores, theme=theme, answers=answers)
+    block = apply_variant(base, theme, answers, key=key, counts=counts)
+
+    invite = ""
+    if HAS_COMPOSER and wants_invite(theme):
+        plan = collect_plan(theme, answers)  # type: ignore[misc]
+        invite = compose_invite(theme, plan)  # type: ignore[misc]
+    return Outcome(key=key, block=block, invite=invite)
+
+
+def get_outcome(ct: CompiledTheme, picks: Sequence[int],
+                scores: Dict[str, int],
+                counts: Optional[Sequence[int]] = None) -> Outcome:
+    """Desfecho da partida, do cache compartilhado quando possível.
+
+    `scores` e `counts` (contagem de sinais) precisam corresponder a
+    `picks`, como os da sessão; só são usados quando o desfecho ainda
+    não está em cache.
+    """
+    return _OUTCOMES.get_or_create(
+        outcome_key(ct, picks),
+        lambda: compute_outcome(ct, picks, scores, counts),
+    )
+
+
+def outcome_stats() -> Dict[str, float]:
+    """Contadores do cache de desfechos (acertos, falhas, bytes...)."""
+    return _OUTCOMES.stats()
+
+
+register_stats("quiz.outcomes", outcome_stats)
+
+
+def clear_outcomes() -> None:
+    """Esvazia o cache e zera os contadores."""
+    _OUTCOMES.clear()
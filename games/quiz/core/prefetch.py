@@ -0,0 +1,131 @@
+"""Pré-carregamento em segundo plano da mídia do quiz.
+
+Enquanto a pessoa está na pergunta i, um pool pequeno de threads lê (e,
+se preciso, recodifica) a imagem da pergunta i+1 e a mídia dos
+resultados que lideram o placar, guardando os bytes num cache limitado
+e compartilhado entre sessões. No rerun seguinte a página pega os bytes
+da memória em vez de ler o disco.
+
+A chave é o sha256 do arquivo (vindo do índice de mídia), então um
+arquivo alterado nunca serve bytes velhos, e sessões no mesmo tema
+compartilham as entradas.
+"""
+
+import io
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Set
+
+from games.quiz.core.media_index import MediaIndex, MediaInfo
+from games.shared.lru import ByteLRU
+
+CACHE_BYTES = int(float(os.environ.get("QUIZ_PREFETCH_CACHE_MB", "48")) * 2**20)
+WORKERS = int(os.environ.get("QUIZ_PREFETCH_WORKERS", "2"))
+LEADERS = 2
+# Formatos que o st.image envia sem recodificar.
+PASSTHROUGH = (".jpg", ".jpeg", ".png", ".gif")
+
+_BYTES = ByteLRU(CACHE_BYTES)
+_LOCK = threading.Lock()
+_PENDING: Set[str] = set()
+_POOL: Optional[ThreadPoolExecutor] = None
+
+
+def encode(info: MediaInfo) -> bytes:
+    """Bytes prontos para enviar: o arquivo como está ou recodificado.
+
+    WebP e outros formatos estáticos viram PNG (com transparência) ou
+    JPEG, o mesmo que o st.image faria a cada exibição. WebP animado
+    fica como está: a página o serve num <picture>, sem o st.image.
+    """
+    data = info.path.read_bytes()
+    if info.path.suffix.lower() in PASSTHROUGH:
+        return data
+
+    from PIL import Image
+
+    with Image.open(io.BytesIO(data)) as img:
+        if getattr(img, "is_animated", False):
+            return data
+        buf = io.BytesIO()
+        if "A" in img.getbands() or "transparency" in img.info:
+            img.save(buf, format="PNG")
+        else:
+            img.convert("RGB").save(buf, format="JPEG", quality=90)
+    return buf.getvalue()
+
+
+def media_bytes(info: MediaInfo) -> bytes:
+    """Bytes da mídia: do cache, ou lidos agora (e guardados)."""
+    return _BYTES.get_or_create(info.sha256, lambda: encode(info))
+
+
+def _pool() -> ThreadPoolExecutor:
+    """Pool do processo, criado no primeiro uso."""
+    global _POOL
+    if _POOL is None:
+        with _LOCK:
+            if _POOL is None:
+                _POOL = ThreadPoolExecutor(max_workers=WORKERS,
+                                           thread_name_prefix="quiz-prefetch")
+    return _POOL
+
+
+def _load(info: MediaInfo) -> None:
+    """Tarefa do pool: carrega um arquivo no cache."""
+    try:
+        _BYTES.put(info.sha256, encode(info))
+    except OSError:
+        pass  # some do disco entre o snapshot e a leitura: a página avisa
+    finally:
+        with _LOCK:
+            _PENDING.discard(info.sha256)
+
+
+def prefetch(infos: Iterable[Optional[MediaInfo]]) -> int:
+    """Agenda a carga do que ainda não está no cache; retorna quantos."""
+    queued = 0
+    for info in infos:
+        if info is None or info.sha256 in _BYTES:
+            continue
+        with _LOCK:
+            if info.sha256 in _PENDING:
+                continue
+            _PENDING.add(info.sha256)
+        _pool().submit(_load, info)
+        queued += 1
+    return queued
+
+
+def leading_results(scores: Dict[str, int], k: int = LEADERS) -> List[str]:
+    """As k chaves de resultado com maior placar no momento."""
+    return sorted(scores, key=lambda r: (-scores[r], r))[:k]
+
+
+def prefetch_step(theme: Dict, idx: int, scores: Dict[str, int],
+                  index: MediaIndex, animations: bool = True) -> int:
+    """Agenda a imagem da pergunta idx+1 e a mídia dos resultados líderes.
+
+    Para os resultados entra a animação ou, sem `animations` (modo
+    econômico), o pôster — o mesmo que a página de resultado vai enviar.
+    """
+    wanted: List[Optional[MediaInfo]] = []
+    questions = theme.get("questions", [])
+    if idx + 1 < len(questions):
+        wanted.append(index.get(questions[idx + 1].get("image")))
+    results = theme.get("results", {})
+    for key in leading_results(scores):
+        block = results.get(key)
+        if not isinstance(block, dict):
+            continue
+        ref = block.get("image_gif") or block.get("image")
+        poster = index.poster(ref)
+        wanted.append(index.get(ref) if animations or poster is None
+                      else poster)
+    return prefetch(wanted)
+
+
+def stats() -> Dict[str, float]:
+    """Contadores do cache de bytes."""
+    return _BYTES.stats()
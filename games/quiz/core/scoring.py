@@ -0,0 +1,199 @@
+"""Pontuação vetorizada: matriz de pesos do tema e API em lote (NumPy).
+
+Reproduz as regras de `engine.compute_result`/`resolve_tie`, mas para
+muitos caminhos de resposta de uma vez. Um caminho é um vetor com o índice
+da opção escolhida em cada pergunta, na ordem do tema (-1 = sem resposta).
+"""
+
+import threading
+import weakref
+from dataclasses import dataclass
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from games.quiz.core.compiled import CompiledTheme, compile_theme
+
+UNANSWERED = -1
+
+
+@dataclass(frozen=True, eq=False)
+class WeightMatrix:
+    """Pesos densos do tema com formato perguntas × opções × resultados.
+
+    O eixo de opções tem duas posições extras por pergunta: `fallback`
+    guarda os pesos da própria pergunta (opção desconhecida, como no motor)
+    e `blank` é toda zero (pergunta sem resposta). `signals` segue o mesmo
+    layout, com a contagem de cada sinal marcado pela opção.
+    """
+
+    theme: CompiledTheme
+    weights: np.ndarray
+    signals: np.ndarray
+    n_options: np.ndarray
+    tie_rows: Tuple[Tuple[int, int], ...]
+    alpha_rank: np.ndarray
+
+    @property
+    def fallback(self) -> int:
+        """Posição dos pesos da pergunta no eixo de opções."""
+        return self.weights.shape[1] - 2
+
+    @property
+    def blank(self) -> int:
+        """Posição vazia (pergunta sem resposta) no eixo de opções."""
+        return self.weights.shape[1] - 1
+
+    def slots(self, paths: np.ndarray) -> np.ndarray:
+        """Converte caminhos N × perguntas em posições do eixo de opções."""
+        paths = np.asarray(paths, dtype=np.int64)
+        out = np.where(paths < 0, self.blank, paths)
+        return np.where(out >= self.n_options[None, :], self.fallback, out)
+
+
+def _build(ct: CompiledTheme) -> WeightMatrix:
+    """Monta a matriz densa a partir do tema compilado."""
+    n_q = len(ct.questions)
+    n_r = len(ct.result_keys)
+    max_opts = max((len(q.options) for q in ct.questions), default=0)
+    col = {rk: j for j, rk in enumerate(ct.result_keys)}
+
+    weights = np.zeros((n_q, max_opts + 2, n_r), dtype=np.int64)
+    signals = np.zeros((n_q, max_opts + 2, len(ct.signals)), dtype=np.int64)
+    for q in ct.questions:
+        for rk, v in q.weights.items():
+            if rk in col:
+                weights[q.index, max_opts, col[rk]] = v
+        for o in q.options:
+            for rk, v in o.weights.items():
+                if rk in col:
+                    weights[q.index, o.index, col[rk]] = v
+            for s in o.signals:
+                signals[q.index, o.index, ct.signal_index[s]] += 1
+
+    tie_rows = tuple(
+        (k, ct.question_index[q_id].index)
+        for k, q_id in enumerate(ct.tie_breakers)
+        if q_id in ct.question_index
+    )
+    alpha = sorted(range(n_r), key=lambda j: ct.result_keys[j])
+    alpha_rank = np.empty(n_r, dtype=np.int64)
+    alpha_rank[alpha] = np.arange(n_r)
+
+    return WeightMatrix(
+        theme=ct,
+        weights=weights,
+        signals=signals,
+        n_options=np.array([len(q.options) for q in ct.questions],
+                           dtype=np.int64),
+        tie_rows=tie_rows,
+        alpha_rank=alpha_rank,
+    )
+
+
+_MATRICES: "weakref.WeakKeyDictionary[CompiledTheme, WeightMatrix]" = (
+    weakref.WeakKeyDictionary()
+)
+_LOCK = threading.Lock()
+
+
+def weight_matrix(theme: Dict) -> WeightMatrix:
+    """Retorna a matriz de pesos do tema, compilada uma vez por versão."""
+    ct = compile_theme(theme)
+    with _LOCK:
+        wm = _MATRICES.get(ct)
+    if wm is None:
+        wm = _build(ct)
+        with _LOCK:
+            _MATRICES[ct] = wm
+    return wm
+
+
+def encode_answers(theme: Dict, answers: Sequence[Tuple[str, str]]) -> np.ndarray:
+    """Converte pares (q_id, opt_id) em um caminho de índices de opção.
+
+    Uma opção inexistente vira um índice fora do intervalo, para que a
+    pontuação use os pesos da pergunta, como `engine` faz.
+    """
+    ct = compile_theme(theme)
+    path = np.full(len(ct.questions), UNANSWERED, dtype=np.int64)
+    for q_id, opt_id in answers:
+        q = ct.question(q_id)
+        if q is None:
+            continue
+        opt = q.option_index.get(opt_id)
+        path[q.index] = opt.index if opt else len(q.options)
+    return path
+
+
+def score_paths(theme: Dict, paths) -> np.ndarray:
+    """Placar de vários caminhos de uma vez: matriz N × resultados."""
+    wm = weight_matrix(theme)
+    slots = wm.slots(np.atleast_2d(paths))
+    rows = np.arange(slots.shape[1])
+    return wm.weights[rows[None, :], slots].sum(axis=1)
+
+
+def signal_counts(theme: Dict, paths) -> np.ndarray:
+    """Contagem de sinais de vários caminhos: matriz N × sinais do tema."""
+    wm = weight_matrix(theme)
+    slots = wm.slots(np.atleast_2d(paths))
+    rows = np.arange(slots.shape[1])
+    return wm.signals[rows[None, :], slots].sum(axis=1)
+
+
+def score_path(theme: Dict, answers: Sequence[Tuple[str, str]]) -> Dict[str, int]:
+    """Placar de um único caminho de respostas, por chave de resultado."""
+    totals = score_paths(theme, encode_answers(theme, answers))[0]
+    keys = compile_theme(theme).result_keys
+    return {rk: int(v) for rk, v in zip(keys, totals)}
+
+
+def resolve_paths(theme: Dict, paths) -> Tuple[np.ndarray, np.ndarray]:
+    """Vencedor de cada caminho, com as mesmas regras de desempate do motor.
+
+    Retorna `(winner, stage)`: `winner` é o índice em `result_keys` e
+    `stage` indica como o resultado saiu — -1 sem empate, k quando decidido
+    pelo k-ésimo item de `tie_breakers` e `len(tie_breakers)` quando caiu
+    na ordem alfabética.
+    """
+    wm = weight_matrix(theme)
+    slots = wm.slots(np.atleast_2d(paths))
+    n_rows, n_q = slots.shape
+    n_r = wm.weights.shape[2]
+
+    scores = wm.weights[np.arange(n_q)[None, :], slots].sum(axis=1)
+    cand = scores == scores.max(axis=1, keepdims=True)
+
+    winner = np.full(n_rows, -1, dtype=np.int64)
+    stage = np.full(n_rows, -1, dtype=np.int64)
+    pending = cand.sum(axis=1) > 1
+    winner[~pending] = cand[~pending].argmax(axis=1)
+
+    floor = np.iinfo(np.int64).min
+    for k, q in wm.tie_rows:
+        rows = np.flatnonzero(pending & (slots[:, q] != wm.blank))
+        if not rows.size:
+            continue
+        c = cand[rows]
+        vals = np.where(c, wm.weights[q, slots[rows, q]], floor)
+        top = (vals == vals.max(axis=1, keepdims=True)) & c
+        unique = top.sum(axis=1) == 1
+        done = rows[unique]
+        winner[done] = top[unique].argmax(axis=1)
+        stage[done] = k
+        pending[done] = False
+
+    rows = np.flatnonzero(pending)
+    if rows.size:
+        ranks = np.where(cand[rows], wm.alpha_rank[None, :], n_r)
+        winner[rows] = ranks.argmin(axis=1)
+        stage[rows] = len(wm.theme.tie_breakers)
+    return winner, stage
+
+
+def compute_results(theme: Dict, paths) -> List[str]:
+    """Chave do resultado final de cada caminho (versão em lote)."""
+    keys = compile_theme(theme).result_keys
+    winner, _ = resolve_paths(theme, paths)
+    return [keys[i] for i in winner]
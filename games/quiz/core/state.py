@@ -1,21 +1,81 @@
-"""Gerência do estado via st.session_state e operações do quiz."""
+"""Gerência do estado via st.session_state e operações do quiz.
+
+A sessão guarda só o essencial da partida: `theme_ref` (um `ThemeRef`
+com o id, a versão e uma referência ao tema compilado), `picks` (um
+`bytearray` com o índice da opção escolhida em cada pergunta respondida,
+na ordem do tema), `score` (um `array` de inteiros na ordem de
+`result_keys`) e `signals` (um `array` com a contagem de cada sinal, na
+ordem de `signals` do tema), atualizados a cada resposta. O tema em si é
+o compilado compartilhado entre sessões; a referência fixa a versão do
+início da partida enquanto a sessão existir (mesmo que o cache de
+versões já a tenha descartado), então editar o arquivo no meio não troca
+as perguntas de quem já está jogando.
+"""
+
+from array import array
+from typing import Dict, List, Optional, Tuple
 
-from typing import Dict
 import streamlit as st
 
-
+from games.quiz.core.compiled import (
+    CompiledTheme,
+    compile_theme,
+    find_compiled,
+)
+from games.shared.metrics import timed
+from games.shared.snapshot import current
+
+# Em `picks`: opção com id desconhecido (vale o peso da pergunta).
+NO_OPTION = 255
+
+
+class ThemeRef:
+    """Versão do tema fixada por uma partida.
+
+    Guarda o tema compilado (só um ponteiro: o objeto é compartilhado),
+    o que o mantém vivo fora do cache de versões. Serializada, vira só
+    `(id, versão)`; ao ser restaurada, o tema é procurado de novo no
+    cache e no snapshot atual.
+    """
+
+    __slots__ = ("id", "version", "_theme")
+
+    def __init__(self, theme_id: str, version: str,
+                 theme: Optional[CompiledTheme] = None) -> None:
+        self.id = theme_id
+        self.version = version
+        self._theme = theme
+
+    def __reduce__(self):
+        return ThemeRef, (self.id, self.version)
+
+    @property
+    def theme(self) -> Optional[CompiledTheme]:
+        """Tema compilado da versão fixada, ou None se não existe mais."""
+        if self._theme is None:
+            ct = find_compiled(self.id, self.version)
+            if ct is None:
+                raw = current().theme_by_id(self.id)
+                ct = compile_theme(raw) if raw is not None else None
+                if ct is not None and ct.version != self.version:
+                    ct = None
+            self._theme = ct
+        return self._theme
+
+
+@timed("quiz_init_state", game="quiz")
 def init_state():
     """Inicializa todas as chaves necessárias no session_state."""
     if "page" not in st.session_state:
         st.session_state.page = "home"
-    if "theme" not in st.session_state:
-        st.session_state.theme = None
-    if "q_index" not in st.session_state:
-        st.session_state.q_index = 0
-    if "answers" not in st.session_state:
-        st.session_state.answers = []
-    if "scores" not in st.session_state:
-        st.session_state.scores = {}
+    if "theme_ref" not in st.session_state:
+        st.session_state.theme_ref = None
+    if "picks" not in st.session_state:
+        st.session_state.picks = bytearray()
+    if "score" not in st.session_state:
+        st.session_state.score = array("i")
+    if "signals" not in st.session_state:
+        st.session_state.signals = array("H")
     if "finished" not in st.session_state:
         st.session_state.finished = False
     if "completed" not in st.session_state:
@@ -32,52 +92,93 @@ def set_page(name: str):
     st.session_state.page = name
 
 
+def session_theme() -> Optional[CompiledTheme]:
+    """Tema compilado da partida em curso, ou None se não houver.
+
+    Só devolve None sem partida ou quando a versão fixada não pôde ser
+    restaurada (sessão desserializada depois que o tema mudou).
+    """
+    ref = st.session_state.get("theme_ref")
+    return ref.theme if ref is not None else None
+
+
+def require_theme() -> CompiledTheme:
+    """Tema da partida; sem ele, volta à tela inicial e reinicia o rerun."""
+    ct = session_theme()
+    if ct is None:
+        reset_app()
+        st.rerun()
+    return ct
+
+
+def current_theme() -> Dict:
+    """JSON do tema da partida (compartilhado: não altere)."""
+    return require_theme().raw
+
+
 def start_quiz(theme: Dict):
     """Inicializa o quiz para um tema específico."""
-    st.session_state.theme = theme
-    st.session_state.q_index = 0
-    st.session_state.answers = []
-    st.session_state.scores = {k: 0 for k in theme["results"].keys()}
+    ct = compile_theme(theme)
+    st.session_state.theme_ref = ThemeRef(ct.id, ct.version, ct)
+    st.session_state.picks = bytearray()
+    st.session_state.score = array("i", [0]) * len(ct.result_keys)
+    st.session_state.signals = array("H", [0]) * len(ct.signals)
     st.session_state.finished = False
     st.session_state.page = "quiz"
 
 
 def reset_app():
     """Retorna o app para a tela inicial mantendo progresso salvo."""
-    for key in ["theme", "q_index", "answers", "scores", "finished"]:
+    for key in ["theme_ref", "picks", "score", "signals", "finished"]:
         if key in st.session_state:
             del st.session_state[key]
     st.session_state.page = "home"
 
 
+def question_index() -> int:
+    """Índice da pergunta atual (= quantas já foram respondidas)."""
+    return len(st.session_state.picks)
+
+
 def current_question():
     """Retorna o dicionário da pergunta atual."""
-    theme = st.session_state.theme
-    idx = st.session_state.q_index
-    return theme["questions"][idx]
+    return current_theme()["questions"][question_index()]
 
 
 def record_answer(q_id: str, opt_id: str):
-    """Registra uma resposta e aplica os pesos ao placar."""
-    st.session_state.answers.append((q_id, opt_id))
-    theme = st.session_state.theme
-    q = {q["id"]: q for q in theme["questions"]}[q_id]
-
-    opt = next((o for o in q.get("options", []) if o["id"] == opt_id), None)
-    weights = opt.get("weights", {}) if opt else q.get("weights", {})
-
-    for rk in st.session_state.scores.keys():
-        st.session_state.scores[rk] += int(weights.get(rk, 0))
+    """Registra a resposta da pergunta atual: placar e contagem de sinais."""
+    ct = require_theme()
+    q = ct.question_index[q_id]
+    opt = q.option_index.get(opt_id)
+    st.session_state.picks.append(opt.index if opt else NO_OPTION)
+
+    weights = opt.weights if opt else q.weights
+    score = st.session_state.score
+    for j, rk in enumerate(ct.result_keys):
+        score[j] += weights.get(rk, 0)
+    if opt:
+        counts = st.session_state.signals
+        for s in opt.signals:
+            counts[ct.signal_index[s]] += 1
 
 
 def next_step():
-    """Avança para a próxima pergunta ou finaliza o quiz."""
-    theme = st.session_state.theme
-    if st.session_state.q_index + 1 < len(theme["questions"]):
-        st.session_state.q_index += 1
-    else:
+    """Após a última resposta, finaliza o quiz e marca o tema concluído."""
+    ct = require_theme()
+    if question_index() >= len(ct.questions):
         st.session_state.finished = True
         st.session_state.page = "result"
+        mark_completed(ct.id)
+
+
+def answer_pairs() -> List[Tuple[str, str]]:
+    """Respostas da partida como pares (q_id, opt_id)."""
+    return require_theme().answer_pairs(st.session_state.picks)
+
+
+def score_map() -> Dict[str, int]:
+    """Placar da partida por chave de resultado."""
+    return dict(zip(require_theme().result_keys, st.session_state.score))
 
 
 def mark_completed(theme_id: str):
@@ -1,8 +1,11 @@
 """Leitura e validação de temas em JSON."""
 
 import json
+import string
 from pathlib import Path
-from typing import Dict, List
+from typing import Any, Dict, List
+
+from games.shared.metrics import timed
 
 THEMES_DIR = Path("themes")
 
@@ -12,6 +15,7 @@ def load_theme_files() -> List[Path]:
     return sorted(THEMES_DIR.glob("*.json"))
 
 
+@timed(game="quiz")
 def load_theme(path: Path) -> Dict:
     """Carrega um tema JSON e valida todas as chaves obrigatórias."""
     with path.open("r", encoding="utf-8") as f:
@@ -23,3 +27,180 @@ def load_theme(path: Path) -> Dict:
             raise ValueError(f"Tema inválido, faltou a chave: {key}")
 
     return data
+
+
+def _is_int(v: object) -> bool:
+    """True para inteiros de verdade (bool não conta)."""
+    return isinstance(v, int) and not isinstance(v, bool)
+
+
+def _check_weights(where: str, weights: object, result_keys: set) -> List[str]:
+    """Valida um dicionário de pesos {resultado: inteiro}."""
+    if weights is None:
+        return []
+    if not isinstance(weights, dict):
+        return [f"{where}: 'weights' deve ser um objeto"]
+    errors = []
+    for rk, v in weights.items():
+        if rk not in result_keys:
+            errors.append(f"{where}: peso para resultado desconhecido '{rk}'")
+        if not _is_int(v):
+            errors.append(f"{where}: peso de '{rk}' não é inteiro ({v!r})")
+    return errors
+
+
+def _check_condition(where: str, cond: Any) -> List[str]:
+    """Valida a condição `when` de uma variante (com all/any aninhados)."""
+    if not isinstance(cond, dict) or not (
+        cond.get("signal") or "all" in cond or "any" in cond
+    ):
+        return [f"{where}: sem 'when.signal' (ou 'all'/'any')"]
+    errors = []
+    for key in ("min", "max"):
+        if key in cond and not _is_int(cond[key]):
+            errors.append(f"{where}: '{key}' não é inteiro")
+    if not cond.get("signal") and ("min" in cond or "max" in cond):
+        errors.append(f"{where}: 'min'/'max' sem 'signal'")
+    for key in ("all", "any"):
+        if key not in cond:
+            continue
+        subs = cond[key]
+        if not isinstance(subs, list) or not subs:
+            errors.append(f"{where}: '{key}' deve ser uma lista não vazia")
+            continue
+        for i, sub in enumerate(subs):
+            errors += _check_condition(f"{where}, {key}[{i}]", sub)
+    return errors
+
+
+def _check_templates(templates: Any, cmap: Dict) -> List[str]:
+    """Confere `compose_templates`: frases, lacunas e fecho."""
+    if not isinstance(templates, dict):
+        return ["'compose_templates' deve ser um objeto"]
+    errors = []
+    sentences = templates.get("sentences", [])
+    if not isinstance(sentences, list):
+        return ["compose_templates: 'sentences' deve ser uma lista"]
+    for si, sentence in enumerate(sentences):
+        alternatives = [sentence] if isinstance(sentence, str) else sentence
+        if not isinstance(alternatives, list) or not all(
+            isinstance(t, str) for t in alternatives
+        ):
+            errors.append(f"compose_templates: frase {si + 1} deve ser "
+                          "texto ou lista de textos")
+            continue
+        for t in alternatives:
+            try:
+                fields = [f for _, f, _, _ in string.Formatter().parse(t) if f]
+            except ValueError:
+                errors.append(f"compose_templates: modelo inválido '{t}'")
+                continue
+            for f in fields:
+                if f not in cmap:
+                    errors.append(f"compose_templates: lacuna '{f}' "
+                                  "ausente de compose_map")
+    for key in ("closing", "separator"):
+        if key in templates and not isinstance(templates[key], str):
+            errors.append(f"compose_templates: '{key}' deve ser texto")
+    return errors
+
+
+def validate_theme(data: Dict) -> List[str]:
+    """Valida a estrutura completa do tema e retorna a lista de problemas.
+
+    Vai além de `load_theme`: confere ids únicos, pesos inteiros apenas
+    para resultados existentes, sinais, planos contra `compose_map`,
+    variantes e se cada `tie_breakers` aponta para uma pergunta do tema.
+    Arquivos de mídia são conferidos à parte, em
+    `media_index.missing_media`.
+    """
+    errors: List[str] = []
+    results = data.get("results")
+    if not isinstance(results, dict) or not results:
+        return ["'results' deve ser um objeto não vazio"]
+    result_keys = set(results)
+    cmap = data.get("compose_map") or {}
+
+    questions = data.get("questions")
+    if not isinstance(questions, list) or not questions:
+        return errors + ["'questions' deve ser uma lista não vazia"]
+
+    q_ids = set()
+    for qi, q in enumerate(questions):
+        where = f"pergunta {qi + 1}"
+        if not isinstance(q, dict) or not q.get("id"):
+            errors.append(f"{where}: sem 'id'")
+            continue
+        where = f"pergunta '{q['id']}'"
+        if q["id"] in q_ids:
+            errors.append(f"{where}: id repetido")
+        q_ids.add(q["id"])
+        if not q.get("text"):
+            errors.append(f"{where}: sem 'text'")
+        errors += _check_weights(where, q.get("weights"), result_keys)
+
+        options = q.get("options")
+        if not isinstance(options, list) or not options:
+            errors.append(f"{where}: 'options' deve ser uma lista não vazia")
+            continue
+        o_ids = set()
+        for oi, o in enumerate(options):
+            o_where = f"{where}, opção {oi + 1}"
+            if not isinstance(o, dict) or not o.get("id"):
+                errors.append(f"{o_where}: sem 'id'")
+                continue
+            o_where = f"{where}, opção '{o['id']}'"
+            if o["id"] in o_ids:
+                errors.append(f"{o_where}: id repetido")
+            o_ids.add(o["id"])
+            if not o.get("label"):
+                errors.append(f"{o_where}: sem 'label'")
+            errors += _check_weights(o_where, o.get("weights"), result_keys)
+
+            signals = o.get("signals", [])
+            if not isinstance(signals, list) or not all(
+                isinstance(s, str) and s for s in signals
+            ):
+                errors.append(f"{o_where}: 'signals' deve ser lista de textos")
+
+            plan = o.get("plan", {})
+            if not isinstance(plan, dict):
+                errors.append(f"{o_where}: 'plan' deve ser um objeto")
+                continue
+            for k, v in plan.items():
+                if cmap and v not in cmap.get(k, {}):
+                    errors.append(
+                        f"{o_where}: plano '{k}={v}' ausente de compose_map"
+                    )
+
+    tie_breakers = data.get("tie_breakers")
+    if not isinstance(tie_breakers, list):
+        errors.append("'tie_breakers' deve ser uma lista")
+    else:
+        for q_id in tie_breakers:
+            if q_id not in q_ids:
+                errors.append(f"tie_breakers: pergunta inexistente '{q_id}'")
+
+    for rk, block in results.items():
+        where = f"resultado '{rk}'"
+        if not isinstance(block, dict):
+            errors.append(f"{where}: deve ser um objeto")
+            continue
+        for key in ("title", "body"):
+            if not isinstance(block.get(key), str):
+                errors.append(f"{where}: sem '{key}'")
+        for vi, v in enumerate(block.get("variants", [])):
+            cond = v.get("when", {}) if isinstance(v, dict) else None
+            errors += _check_condition(f"{where}, variante {vi + 1}", cond)
+
+    order = data.get("compose_order")
+    if order is not None:
+        for key in order:
+            if key not in cmap:
+                errors.append(f"compose_order: '{key}' ausente de compose_map")
+
+    templates = data.get("compose_templates")
+    if templates is not None:
+        errors += _check_templates(templates, cmap)
+
+    return errors
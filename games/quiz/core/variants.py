@@ -0,0 +1,208 @@
+"""Regras de variante compiladas em uma tabela de predicados (NumPy).
+
+A condição `when` de uma variante aceita, além do formato simples
+`{"signal": "x", "min": 2}`, limite superior e combinações:
+
+    {"signal": "x", "max": 1}
+    {"all": [{"signal": "a", "min": 2}, {"signal": "b", "max": 0}]}
+    {"any": [{"signal": "a", "min": 3}, {"all": [...]}]}
+
+`min` vale 1 por padrão, ou 0 quando só `max` é dado. Chaves no mesmo
+objeto se somam (E). Cada condição vira uma lista de cláusulas (forma
+normal disjuntiva), e cada cláusula, um par de vetores `lo`/`hi` sobre os
+sinais do tema; uma variante vale quando alguma cláusula tem
+`lo <= contagens <= hi` em todos os sinais. Para um resultado, avaliar
+todas as variantes é uma comparação das contagens com a tabela.
+"""
+
+import threading
+import weakref
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from games.quiz.core.compiled import CompiledTheme, compile_theme
+
+# Limite superior "sem limite" (contagens nunca passam disso).
+UNBOUNDED = np.iinfo(np.int64).max
+
+# Uma cláusula: sinal → (mínimo, máximo), todos exigidos juntos.
+Clause = Dict[str, Tuple[int, int]]
+
+
+def _atom(cond: Dict) -> Clause:
+    """Cláusula de uma condição simples {signal, min, max}."""
+    lo = int(cond.get("min", 0 if "max" in cond else 1))
+    hi = int(cond["max"]) if "max" in cond else UNBOUNDED
+    return {cond["signal"]: (lo, hi)}
+
+
+def _and(left: List[Clause], right: List[Clause]) -> List[Clause]:
+    """Produto de duas listas de cláusulas (E), intersectando limites."""
+    out = []
+    for a in left:
+        for b in right:
+            merged = dict(a)
+            for sig, (lo, hi) in b.items():
+                old_lo, old_hi = merged.get(sig, (0, UNBOUNDED))
+                merged[sig] = (max(lo, old_lo), min(hi, old_hi))
+            out.append(merged)
+    return out
+
+
+def clauses(cond: Dict) -> List[Clause]:
+    """Forma normal disjuntiva da condição (lista vazia: nunca vale)."""
+    if not isinstance(cond, dict):
+        return []
+    parts: List[List[Clause]] = []
+    if cond.get("signal"):
+        parts.append([_atom(cond)])
+    if "all" in cond:
+        acc: List[Clause] = [{}]
+        for sub in cond["all"]:
+            acc = _and(acc, clauses(sub))
+        parts.append(acc)
+    if "any" in cond:
+        parts.append([c for sub in cond["any"] for c in clauses(sub)])
+    if not parts:
+        return []
+    out = parts[0]
+    for p in parts[1:]:
+        out = _and(out, p)
+    return out
+
+
+def first_match(variants: Sequence, counts: Dict[str, int]) -> int:
+    """Primeira variante cuja condição vale para `counts` (-1 = nenhuma).
+
+    Avalia as condições direto, sem tabela: serve para blocos que não
+    são os do tema (cópias ou blocos alterados).
+    """
+    for v_idx, v in enumerate(variants):
+        when = v.get("when", {}) if isinstance(v, dict) else {}
+        for clause in clauses(when):
+            if all(lo <= counts.get(sig, 0) <= hi
+                   for sig, (lo, hi) in clause.items()):
+                return v_idx
+    return -1
+
+
+@dataclass(frozen=True, eq=False)
+class ResultRules:
+    """Cláusulas das variantes de um resultado, na ordem das variantes.
+
+    `lo`/`hi` têm formato cláusulas × sinais; `variant[c]` é o índice da
+    variante dona da cláusula c.
+    """
+
+    lo: np.ndarray
+    hi: np.ndarray
+    variant: np.ndarray
+
+    def match(self, counts: np.ndarray) -> int:
+        """Primeira variante satisfeita pelas contagens (-1 = nenhuma)."""
+        ok = ((counts >= self.lo) & (counts <= self.hi)).all(axis=1)
+        return int(self.variant[ok.argmax()]) if ok.any() else -1
+
+    def match_many(self, counts: np.ndarray) -> np.ndarray:
+        """`match` para uma matriz N × sinais de contagens."""
+        counts = counts[:, None, :]
+        ok = ((counts >= self.lo) & (counts <= self.hi)).all(axis=2)
+        first = ok.argmax(axis=1)
+        return np.where(ok.any(axis=1), self.variant[first], -1)
+
+
+@dataclass(frozen=True, eq=False)
+class VariantTable:
+    """Regras de todos os resultados do tema, por índice em `result_keys`."""
+
+    theme: CompiledTheme
+    rules: Tuple[Optional[ResultRules], ...]
+
+    def match(self, result: int, counts: Sequence[int]) -> int:
+        """Variante do resultado para um vetor de contagens (-1 = nenhuma)."""
+        rules = self.rules[result]
+        if rules is None:
+            return -1
+        return rules.match(np.asarray(counts, dtype=np.int64))
+
+    def match_many(self, winner: np.ndarray, counts: np.ndarray) -> np.ndarray:
+        """Variante de cada caminho, dado o vencedor e as contagens."""
+        hits = np.full(winner.size, -1, dtype=np.int64)
+        for r, rules in enumerate(self.rules):
+            rows = np.flatnonzero(winner == r)
+            if rules is not None and rows.size:
+                hits[rows] = rules.match_many(counts[rows])
+        return hits
+
+
+def _build_rules(ct: CompiledTheme, variants: List) -> Optional[ResultRules]:
+    """Tabela de cláusulas das variantes de um resultado."""
+    n_s = len(ct.signals)
+    lo_rows, hi_rows, owner = [], [], []
+    for v_idx, v in enumerate(variants):
+        when = v.get("when", {}) if isinstance(v, dict) else {}
+        for clause in clauses(when):
+            lo = np.zeros(n_s, dtype=np.int64)
+            hi = np.full(n_s, UNBOUNDED, dtype=np.int64)
+            possible = True
+            for sig, (a, b) in clause.items():
+                col = ct.signal_index.get(sig)
+                if col is None:
+                    # sinal que nenhuma opção marca: a contagem é sempre 0
+                    possible = possible and a <= 0 <= b
+                    continue
+                lo[col], hi[col] = max(lo[col], a), min(hi[col], b)
+            if possible:
+                lo_rows.append(lo)
+                hi_rows.append(hi)
+                owner.append(v_idx)
+    if not owner:
+        return None
+    return ResultRules(
+        lo=np.array(lo_rows).reshape(len(owner), n_s),
+        hi=np.array(hi_rows).reshape(len(owner), n_s),
+        variant=np.array(owner, dtype=np.int64),
+    )
+
+
+def _build(ct: CompiledTheme) -> VariantTable:
+    """Compila as variantes de todos os resultados do tema."""
+    results = ct.raw.get("results", {})
+    return VariantTable(
+        theme=ct,
+        rules=tuple(_build_rules(ct, results[rk].get("variants", []))
+                    for rk in ct.result_keys),
+    )
+
+
+_TABLES: "weakref.WeakKeyDictionary[CompiledTheme, VariantTable]" = (
+    weakref.WeakKeyDictionary()
+)
+_LOCK = threading.Lock()
+
+
+def variant_table(theme: Dict) -> VariantTable:
+    """Retorna as regras compiladas do tema, uma vez por versão."""
+    ct = compile_theme(theme)
+    with _LOCK:
+        table = _TABLES.get(ct)
+    if table is None:
+        table = _build(ct)
+        with _LOCK:
+            _TABLES[ct] = table
+    return table
+
+
+def signal_vector(theme: Dict,
+                  answers: Sequence[Tuple[str, str]]) -> np.ndarray:
+    """Contagem de sinais das respostas, na ordem de `signals` do tema."""
+    ct = compile_theme(theme)
+    counts = np.zeros(len(ct.signals), dtype=np.int64)
+    for q_id, opt_id in answers:
+        opt = ct.option(q_id, opt_id)
+        if opt:
+            for s in opt.signals:
+                counts[ct.signal_index[s]] += 1
+    return counts
@@ -0,0 +1,374 @@
+"""Pipeline de build da mídia de resultado dos temas do quiz.
+
+Para cada `image_gif`/`image` de resultado, gera variantes de largura
+limitada em WebP animado e em GIF com paleta adaptativa única, reduzindo
+a taxa de quadros para no máximo `--max-fps` (a duração dos quadros
+descartados passa para o anterior, então o tempo total não muda).
+
+`--max-bytes` vale para os dois formatos servidos: o WebP é refeito com
+qualidade menor e o GIF com menos cores; se ainda passar, a taxa de
+quadros cai pela metade e tenta de novo (até `MIN_FPS`). Variantes GIF
+que não ficam menores que o original são descartadas: aí o original é a
+reserva.
+
+Animações ganham também um pôster: um quadro estático em JPEG (o mais
+detalhado entre alguns quadros amostrados), em cada largura, para o
+modo econômico. A página serve o WebP animado com o GIF de reserva
+(veja `games.quiz.core.media`).
+
+O resultado vai para `build/media/` junto com `manifest.json`, que o app
+lê em `games.quiz.core.media`. Mídias cuja origem não mudou (mesmo
+sha256) desde o build anterior são reaproveitadas. No fim imprime, por
+tema, quantos bytes a variante servida na largura de exibição economiza.
+
+Uso:
+    python -m games.quiz.media build [--out DIR] [--widths 480,360,240]
+        [--max-fps 12] [--quality 70] [--colors 128] [--max-bytes N]
+        [--force] [--json]
+    python -m games.quiz.media report [--json]
+"""
+
+import argparse
+import io
+import json
+import sys
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from PIL import Image, ImageSequence, ImageStat
+
+from games.quiz.core.catalog import load_catalog
+from games.quiz.core.media import (
+    DISPLAY_WIDTH,
+    MANIFEST_NAME,
+    MEDIA_DIR,
+    ROOT_DIR,
+    FALLBACK_FORMAT,
+    pick_variant,
+    read_manifest,
+    served_variant,
+)
+from games.shared.bundle import source_digest
+
+MANIFEST_VERSION = 3
+DEFAULT_WIDTHS = (480, 360, 240)
+DEFAULT_MAX_FPS = 12.0
+DEFAULT_QUALITY = 70
+DEFAULT_COLORS = 128
+DEFAULT_MAX_BYTES = 1_000_000
+QUALITY_FLOOR = 40
+COLORS_FLOOR = 32
+MIN_FPS = 3.0
+POSTER_QUALITY = 72
+POSTER_SAMPLES = 8
+
+Frames = List[Tuple[Image.Image, int]]
+
+
+def result_media(raw: Dict) -> List[str]:
+    """Caminhos de mídia dos resultados do tema, sem repetição."""
+    out: List[str] = []
+    for block in raw.get("results", {}).values():
+        if not isinstance(block, dict):
+            continue
+        for key in ("image_gif", "image"):
+            if block.get(key) and block[key] not in out:
+                out.append(block[key])
+    return out
+
+
+def _decimate(frames: Frames, max_fps: float) -> Frames:
+    """Descarta quadros até `max_fps`, somando a duração ao anterior."""
+    min_ms = 1000.0 / max_fps if max_fps > 0 else 0.0
+    out: Frames = []
+    since = min_ms  # garante que o primeiro quadro entra
+    for frame, ms in frames:
+        if since >= min_ms or not out:
+            out.append((frame, ms))
+            since = ms
+        else:
+            last, dur = out[-1]
+            out[-1] = (last, dur + ms)
+            since += ms
+    return out
+
+
+def _frames(img: Image.Image, max_fps: float) -> Frames:
+    """Quadros RGBA com duração (ms), decimados até `max_fps`."""
+    return _decimate([(f.convert("RGBA"), int(f.info.get("duration") or 100))
+                      for f in ImageSequence.Iterator(img)], max_fps)
+
+
+def _resize(frames: Frames, width: int) -> Frames:
+    """Redimensiona todos os quadros para a largura, mantendo a proporção."""
+    w, h = frames[0][0].size
+    if width >= w:
+        return frames
+    size = (width, max(1, round(h * width / w)))
+    return [(f.resize(size, Image.LANCZOS), ms) for f, ms in frames]
+
+
+def _poster(frames: Frames) -> Image.Image:
+    """Quadro mais detalhado (maior desvio padrão) entre alguns amostrados.
+
+    O primeiro quadro de muitos GIFs é um fade ou um fundo liso; o desvio
+    padrão da luminância é um indicador barato de um quadro "cheio".
+    """
+    sample = [f for f, _ in frames[:: max(len(frames) // POSTER_SAMPLES, 1)]]
+    return max(sample,
+               key=lambda f: ImageStat.Stat(f.convert("L")).stddev[0])
+
+
+def _encode_webp(frames: Frames, quality: int, loop: int) -> bytes:
+    """WebP (animado se houver mais de um quadro)."""
+    buf = io.BytesIO()
+    first, _ = frames[0]
+    if len(frames) == 1:
+        first.save(buf, format="WEBP", quality=quality, method=4)
+    else:
+        first.save(buf, format="WEBP", save_all=True,
+                   append_images=[f for f, _ in frames[1:]],
+                   duration=[ms for _, ms in frames], loop=loop,
+                   quality=quality, method=4)
+    return buf.getvalue()
+
+
+def _encode_jpeg(frame: Image.Image, quality: int) -> bytes:
+    """Quadro único em JPEG, sobre fundo branco se tiver transparência."""
+    flat = Image.new("RGB", frame.size, "white")
+    flat.paste(frame, mask=frame.getchannel("A") if "A" in frame.mode else None)
+    buf = io.BytesIO()
+    flat.save(buf, format="JPEG", quality=quality, optimize=True)
+    return buf.getvalue()
+
+
+def _encode_gif(frames: Frames, colors: int, loop: int) -> bytes:
+    """GIF com uma paleta adaptativa única, tirada de uma amostra dos quadros."""
+    sample = frames[:: max(len(frames) // 8, 1)]
+    w, h = sample[0][0].size
+    strip = Image.new("RGB", (w, h * len(sample)))
+    for k, (f, _) in enumerate(sample):
+        strip.paste(f.convert("RGB"), (0, k * h))
+    palette = strip.quantize(colors=colors, method=Image.Quantize.MEDIANCUT)
+
+    # sem pontilhado: o ruído do dither estraga a compressão LZW entre quadros
+    quantized = [f.convert("RGB").quantize(palette=palette,
+                                           dither=Image.Dither.NONE)
+                 for f, _ in frames]
+    buf = io.BytesIO()
+    quantized[0].save(buf, format="GIF", save_all=True,
+                      append_images=quantized[1:],
+                      duration=[ms for _, ms in frames], loop=loop,
+                      optimize=True, disposal=1)
+    return buf.getvalue()
+
+
+def _fit(frames: Frames, max_fps: float, max_bytes: int,
+         encode: Callable[[Frames, int], bytes],
+         levels: Sequence[int]) -> Tuple[bytes, Dict]:
+    """Primeira codificação dentro de `max_bytes`, com nível, fps e quadros.
+
+    Tenta os níveis em ordem (qualidade ou cores, do melhor ao pior); se
+    nenhum cabe, corta a taxa de quadros pela metade e recomeça, até
+    `MIN_FPS`. Devolve a última tentativa se nada couber.
+    """
+    fps = max_fps
+    while True:
+        for level in levels:
+            data = encode(frames, level)
+            if len(data) <= max_bytes:
+                break
+        if (len(data) <= max_bytes or len(frames) == 1
+                or fps / 2 < MIN_FPS):
+            return data, {"level": level, "fps": fps, "frames": len(frames)}
+        fps /= 2
+        frames = _decimate(frames, fps)
+
+
+def _levels(start: int, floor: int, step: Callable[[int], int]) -> List[int]:
+    """Níveis de `start` até `floor` (inclusive), aplicando `step`."""
+    out = [start]
+    while out[-1] > floor:
+        out.append(max(step(out[-1]), floor))
+    return out
+
+
+def _variants(src: Path, widths: Tuple[int, ...], max_fps: float,
+              quality: int, colors: int,
+              max_bytes: int) -> Tuple[Dict, List[Tuple[str, bytes, Dict]]]:
+    """Metadados da origem e lista de (sufixo, bytes, metadados) das variantes.
+
+    O WebP sempre entra; a variante GIF só entra se ficar menor que o
+    arquivo original. Pôsteres saem com `poster=True` nos metadados.
+    """
+    src_bytes = src.stat().st_size
+    with Image.open(src) as img:
+        animated = getattr(img, "n_frames", 1) > 1
+        loop = int(img.info.get("loop", 0)) if animated else 0
+        frames = _frames(img, max_fps) if animated else [(img.convert("RGBA"), 0)]
+        info = {"width": img.width, "height": img.height,
+                "frames": getattr(img, "n_frames", 1)}
+
+    qualities = _levels(quality, QUALITY_FLOOR, lambda q: q - 10)
+    palettes = _levels(colors, min(colors, COLORS_FLOOR), lambda c: c // 2)
+    out = []
+    sizes = sorted({min(w, info["width"]) for w in widths} | {info["width"]},
+                   reverse=True)
+    for width in sizes:
+        scaled = _resize(frames, width)
+        meta = {"width": scaled[0][0].width, "height": scaled[0][0].height}
+
+        data, fit = _fit(scaled, max_fps, max_bytes,
+                         lambda f, q: _encode_webp(f, q, loop), qualities)
+        out.append((f"{width}.webp", data,
+                    dict(meta, frames=fit["frames"], format="webp",
+                         quality=fit["level"], fps=fit["fps"])))
+
+        if animated:
+            gif, fit = _fit(scaled, max_fps, max_bytes,
+                            lambda f, c: _encode_gif(f, c, loop), palettes)
+            if len(gif) < src_bytes:
+                out.append((f"{width}.gif", gif,
+                            dict(meta, frames=fit["frames"], format="gif",
+                                 colors=fit["level"], fps=fit["fps"])))
+
+            poster = _encode_jpeg(_poster(scaled), POSTER_QUALITY)
+            out.append((f"{width}-poster.jpg", poster,
+                        dict(meta, frames=1, format="jpeg", poster=True)))
+    return info, out
+
+
+def build(out: Path, widths: Tuple[int, ...], max_fps: float, quality: int,
+          colors: int, max_bytes: int, force: bool = False) -> Dict:
+    """Gera as variantes de todos os temas e grava o manifesto."""
+    previous = {} if force else read_manifest(out)
+    media: Dict[str, Dict] = {}
+    themes: Dict[str, List[str]] = {}
+    settings = {"widths": list(widths), "max_fps": max_fps,
+                "quality": quality, "colors": colors, "max_bytes": max_bytes,
+                "quality_floor": QUALITY_FLOOR, "colors_floor": COLORS_FLOOR,
+                "min_fps": MIN_FPS, "poster_quality": POSTER_QUALITY,
+                "poster_format": "jpeg"}
+
+    for item in load_catalog():
+        paths = result_media(item["raw"])
+        themes[item["id"]] = paths
+        for rel in paths:
+            src = ROOT_DIR / rel
+            if rel in media or not src.exists():
+                continue
+            old = previous.get(rel)
+            if old is not None and old.get("settings") == settings:
+                media[rel] = old
+                continue
+
+            info, variants = _variants(src, widths, max_fps, quality, colors,
+                                       max_bytes)
+            entry = dict(info, sha256=source_digest(src),
+                         bytes=src.stat().st_size, settings=settings,
+                         variants=[], posters=[])
+            for suffix, data, meta in variants:
+                rel_out = Path(rel).with_suffix("").as_posix() + f"-{suffix}"
+                target = out / rel_out
+                target.parent.mkdir(parents=True, exist_ok=True)
+                target.write_bytes(data)
+                kind = "posters" if meta.pop("poster", False) else "variants"
+                entry[kind].append(dict(meta, file=rel_out, bytes=len(data)))
+            media[rel] = entry
+
+    manifest = {"version": MANIFEST_VERSION, "media": media, "themes": themes}
+    out.mkdir(parents=True, exist_ok=True)
+    (out / MANIFEST_NAME).write_text(json.dumps(manifest, indent=1),
+                                     encoding="utf-8")
+    return manifest
+
+
+def savings(manifest: Dict, width: int = DISPLAY_WIDTH) -> Dict[str, Dict]:
+    """Bytes originais × servidos, da reserva GIF e do pôster, por tema."""
+    media = manifest["media"]
+    out = {}
+    for theme_id, paths in manifest["themes"].items():
+        before = after = fallback = poster = 0
+        for rel in paths:
+            entry = media.get(rel)
+            if entry is None:
+                continue
+            v = served_variant(entry, width) or {"bytes": entry["bytes"]}
+            p = pick_variant(entry, width, "posters") or v
+            g = v
+            if entry.get("frames", 1) > 1:
+                g = (pick_variant(entry, width, fmt=FALLBACK_FORMAT)
+                     or {"bytes": entry["bytes"]})
+            before += entry["bytes"]
+            after += v["bytes"]
+            fallback += g["bytes"]
+            poster += p["bytes"]
+        out[theme_id] = {"files": len(paths), "before": before,
+                         "after": after, "saved": before - after,
+                         "fallback": fallback, "poster_only": poster}
+    return out
+
+
+def _print_report(report: Dict[str, Dict], width: int) -> None:
+    """Tabela legível da economia por tema."""
+    print(f"Economia por tema (largura de exibição {width}px; "
+          f"servido → reserva GIF, pôster):")
+    total_b = total_a = total_f = 0
+    for theme_id, r in report.items():
+        total_b += r["before"]
+        total_a += r["after"]
+        total_f += r["fallback"]
+        pct = r["saved"] / r["before"] if r["before"] else 0.0
+        print(f"  {theme_id:28} {r['files']:2} arquivo(s)  "
+              f"{r['before']:>11,} → {r['after']:>10,} bytes  (-{pct:.0%}); "
+              f"reserva {r['fallback']:>10,}; pôster {r['poster_only']:>8,}")
+    if total_b:
+        print(f"  {'total':28}              {total_b:>11,} → {total_a:>10,} "
+              f"bytes  (-{(total_b - total_a) / total_b:.0%}); "
+              f"reserva {total_f:>10,}")
+
+
+def _widths(text: str) -> Tuple[int, ...]:
+    """Lista de larguras separadas por vírgula."""
+    return tuple(int(x) for x in text.split(",") if x.strip())
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Ponto de entrada da linha de comando."""
+    ap = argparse.ArgumentParser(description="Mídia de resultado otimizada.")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    b = sub.add_parser("build", help="gera variantes e manifesto")
+    b.add_argument("--out", type=Path, default=MEDIA_DIR)
+    b.add_argument("--widths", type=_widths, default=DEFAULT_WIDTHS)
+    b.add_argument("--max-fps", type=float, default=DEFAULT_MAX_FPS)
+    b.add_argument("--quality", type=int, default=DEFAULT_QUALITY)
+    b.add_argument("--colors", type=int, default=DEFAULT_COLORS)
+    b.add_argument("--max-bytes", type=int, default=DEFAULT_MAX_BYTES)
+    b.add_argument("--force", action="store_true",
+                   help="refaz tudo, mesmo o que não mudou")
+    b.add_argument("--json", action="store_true")
+    r = sub.add_parser("report", help="economia do último build")
+    r.add_argument("--out", type=Path, default=MEDIA_DIR)
+    r.add_argument("--json", action="store_true")
+    args = ap.parse_args(argv)
+
+    if args.cmd == "build":
+        manifest = build(args.out, args.widths, args.max_fps, args.quality,
+                         args.colors, args.max_bytes, args.force)
+    else:
+        try:
+            manifest = json.loads((args.out / MANIFEST_NAME).read_text("utf-8"))
+        except (OSError, ValueError):
+            print(f"sem manifesto em {args.out}; rode o build antes.")
+            return 1
+
+    report = savings(manifest)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        _print_report(report, DISPLAY_WIDTH)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,36 +1,15 @@
 """Tela inicial do Jogo 1: grid de temas, pré-requisitos e thumbnails."""
 
-from pathlib import Path
-
 import streamlit as st
 
 from games.quiz.core.state import start_quiz
-from games.quiz.core.theme_io import load_theme, load_theme_files
-
-ROOT_DIR = Path(__file__).resolve().parents[3]
+from games.shared.metrics import timed
+from games.shared.snapshot import current
 
 
 def _load_all_themes() -> list[dict]:
-    """Carrega todos os JSONs válidos do diretório `themes/`."""
-    items: list[dict] = []
-    for p in load_theme_files():
-        try:
-            data = load_theme(p)
-        except ValueError:
-            # Ignora arquivos JSON que não são temas de quiz
-            continue
-
-        items.append(
-            {
-                "id": data["id"],
-                "title": data["title"],
-                "requires": data.get("requires"),
-                "requires_any": data.get("requires_any"),
-                "path": p,
-                "raw": data,
-            }
-        )
-    return items
+    """Retorna os temas válidos de `themes/` do snapshot em vigor."""
+    return list(current().themes)
 
 
 def _iterify(x: object) -> list[str]:
@@ -103,35 +82,6 @@ def _requirements_label(
     return parts[0]
 
 
-def _find_theme_media(theme_raw: dict) -> Path | None:
-    """Localiza a thumbnail do tema.
-
-    Regras:
-    1) Se o JSON tiver "thumbnail", tenta usar.
-    2) Caso contrário, procura automaticamente em:
-       assets/<pasta_do_tema>/{thumb,cover,card}.* (png/jpg/webp/gif)
-    """
-    th = theme_raw.get("thumbnail")
-    if th:
-        p = Path(th)
-        if not p.is_absolute():
-            p = ROOT_DIR / p
-        if p.exists():
-            return p
-
-    theme_id = theme_raw.get("id", "tema")
-    folder = theme_id.split("_v")[0]
-    base = ROOT_DIR / "assets" / folder
-
-    for name in ("thumb", "cover", "card", "_thumb", "_cover"):
-        for ext in ("png", "jpg", "jpeg", "webp", "gif"):
-            p = base / f"{name}.{ext}"
-            if p.exists():
-                return p
-
-    return None
-
-
 def _render_theme_card(
     theme_raw: dict,
     completed_ids: set[str],
@@ -180,9 +130,9 @@ def _render_theme_card(
                         unsafe_allow_html=True,
                     )
 
-        media = _find_theme_media(theme_raw)
+        media = current().media.thumb(theme_id)
         if media:
-            st.image(str(media), width="stretch")
+            st.image(str(media.path), width="stretch")
 
         if intro:
             st.caption(intro)
@@ -201,6 +151,7 @@ def _render_theme_card(
             )
 
 
+@timed(game="quiz")
 def page_home() -> None:
     """Tela principal do Jogo 1.
 
@@ -1,34 +1,44 @@
 """Página de perguntas do quiz, com barra e imagem por pergunta."""
 
-from pathlib import Path
-
 import streamlit as st
 
-from games.quiz.core.state import current_question, next_step, record_answer
-
-ROOT_DIR = Path(__file__).resolve().parents[3]
+from games.quiz.core.media_index import resolve
+from games.quiz.core.prefetch import media_bytes, prefetch_step
+from games.quiz.core.state import (
+    current_question,
+    current_theme,
+    next_step,
+    question_index,
+    record_answer,
+    score_map,
+)
+from games.shared.metrics import timed
+from games.shared.snapshot import current
 
 
 def _show_question_image(q: dict):
-    """Exibe imagem da pergunta, resolvendo caminho relativo ao projeto."""
+    """Exibe imagem da pergunta, já resolvida no índice de mídia.
+
+    Os bytes vêm do cache de pré-carregamento quando a pergunta anterior
+    já os deixou prontos.
+    """
     path = q.get("image")
     if not path:
         return
 
-    p = Path(path)
-    if not p.is_absolute():
-        p = ROOT_DIR / p
-    if p.exists():
-        st.image(str(p), caption=None)
+    media = current().media.get(path)
+    if media:
+        st.image(media_bytes(media), caption=None)
     else:
-        st.caption(f"[imagem não encontrada: {p}]")
+        st.caption(f"[imagem não encontrada: {resolve(path)}]")
 
 
+@timed(game="quiz")
 def page_quiz():
     """Renderiza a página de perguntas com progresso e imagem."""
-    theme = st.session_state.theme
+    theme = current_theme()
     total_q = len(theme["questions"])
-    idx = st.session_state.q_index
+    idx = question_index()
     prog = idx / total_q if total_q else 0.0
 
     st.header(theme["title"])
@@ -42,6 +52,8 @@ def page_quiz():
     st.subheader(f"Pergunta {idx + 1} de {total_q}")
 
     _show_question_image(q)
+    prefetch_step(theme, idx, score_map(), current().media,
+                  animations=not st.session_state.get("low_bandwidth"))
 
     st.write(q["text"])
 
@@ -1,100 +1,116 @@
 """Página de resultado do quiz, com imagem/gif e convite Surpresa."""
 
-from pathlib import Path
-from typing import List, Tuple, Union
+import mimetypes
+import os
+from typing import Optional, Tuple
 
 import streamlit as st
 
-from games.quiz.core.engine import apply_variant, compute_result
-from games.quiz.core.state import mark_completed, reset_app, start_quiz
-
-# Importa o composer se existir; caso contrário, funciona sem convite.
-try:
-    from games.quiz.core.composer import (  # type: ignore
-        collect_plan,
-        compose_invite,
-    )
-    _HAS_COMPOSER = True
-except Exception:  # noqa: BLE001
-    collect_plan = None  # type: ignore
-    compose_invite = None  # type: ignore
-    _HAS_COMPOSER = False
-
-ROOT_DIR = Path(__file__).resolve().parents[3]
-
-
-def _resolve_path(path_str: str) -> Path:
-    """Resolve caminhos relativos ao diretório raiz do projeto."""
-    p = Path(path_str)
-    if not p.is_absolute():
-        p = ROOT_DIR / p
-    return p
-
-
-def _render_result_card(block: dict) -> None:
-    """Desenha o cartão do resultado (prefere GIF se existir)."""
+from games.quiz.core.media_index import MediaInfo, resolve
+from games.quiz.core.outcome import HAS_COMPOSER, get_outcome, wants_invite
+from games.quiz.core.prefetch import media_bytes
+from games.quiz.core.state import (
+    require_theme,
+    reset_app,
+    score_map,
+    start_quiz,
+)
+from games.shared.media import media_url
+from games.shared.metrics import timed
+from games.shared.snapshot import current
+
+# Valor inicial do modo econômico (só pôster); cada sessão pode trocar.
+LOW_BANDWIDTH = os.environ.get("RESULT_LOW_BANDWIDTH", "0") == "1"
+
+Pending = Optional[Tuple[object, MediaInfo, Optional[MediaInfo], str]]
+
+
+def _render_result_card(block: dict) -> Pending:
+    """Desenha o cartão do resultado (prefere a animação se existir).
+
+    O arquivo vem do índice de mídia do snapshot, que já aponta para a
+    menor variante gerada no build quando ela existe. Animações com
+    pôster mostram o pôster na hora; no modo econômico fica só ele. Fora
+    dele, a função devolve (espaço, animação, reserva, URL do pôster)
+    para `_fill_animation` trocar pela animação no fim da página.
+    """
+    pending: Pending = None
     media_path = block.get("image_gif") or block.get("image")
     if media_path:
-        p = _resolve_path(media_path)
-        if p.exists():
-            st.image(str(p))
+        index = current().media
+        media = index.get(media_path)
+        poster = index.poster(media_path)
+        fallback = index.fallback(media_path)
+        if media:
+            slot = st.empty()
+            if poster and st.session_state.low_bandwidth:
+                slot.image(media_bytes(poster))
+            elif poster:
+                still = media_url(media_bytes(poster), "image/jpeg",
+                                  "quiz_result.poster")
+                slot.markdown(_img(still, media.width),
+                              unsafe_allow_html=True)
+                pending = (slot, media, fallback, still)
+            else:
+                _show(slot, media, fallback)
         else:
-            st.caption(f"[mídia do resultado não encontrada: {p}]")
+            st.caption(f"[mídia do resultado não encontrada: "
+                       f"{resolve(media_path)}]")
             st.caption("→ Coloque o arquivo nesse caminho exato.")
 
     with st.container():
         st.success(block["title"])
         st.markdown(block["body"])
+    return pending
+
+
+def _img(src: str, width: int, style: str = "") -> str:
+    """Tag <img> na largura da mídia, sem passar da coluna."""
+    return (f'<img src="{src}" width="{width}" alt="" '
+            f'style="max-width:100%; height:auto;{style}">')
+
+
+def _show(slot, media: MediaInfo, fallback: Optional[MediaInfo],
+          still: str = "") -> None:
+    """Mostra a mídia no espaço.
 
+    Animação em WebP vai num <picture> com o GIF de reserva: o navegador
+    baixa só um dos dois. O st.image recodificaria o WebP num quadro só.
+    Com `still` (URL do pôster já na página), o pôster fica de fundo até
+    a animação chegar; a URL é a mesma, então sai do cache do navegador.
+    """
+    if fallback is None and not still:
+        slot.image(media_bytes(media))
+        return
+    mime = mimetypes.guess_type(media.path.name)[0] or "image/gif"
+    anim = media_url(media_bytes(media), mime, "quiz_result.anim")
+    style = (f" background:url({still}) center/contain no-repeat;"
+             if still else "")
+    if fallback is None:
+        slot.markdown(_img(anim, media.width, style), unsafe_allow_html=True)
+        return
+    gif = media_url(media_bytes(fallback), "image/gif", "quiz_result.gif")
+    slot.markdown(
+        f'<picture><source srcset="{anim}" type="image/webp">'
+        f'{_img(gif, media.width, style)}</picture>',
+        unsafe_allow_html=True,
+    )
 
-def _answers_to_pairs(
-    answers: Union[
-        List[Tuple[str, str]],
-        List[dict],
-        dict,
-    ]
-) -> List[Tuple[str, str]]:
-    """Normaliza respostas em lista de pares (q_id, opt_id)."""
-    pairs: List[Tuple[str, str]] = []
-
-    if isinstance(answers, dict):
-        for k, v in answers.items():
-            if isinstance(k, str) and isinstance(v, str):
-                pairs.append((k, v))
-        return pairs
-
-    if isinstance(answers, list):
-        for item in answers:
-            if isinstance(item, tuple) and len(item) == 2:
-                q_id, opt_id = item
-                if isinstance(q_id, str) and isinstance(opt_id, str):
-                    pairs.append((q_id, opt_id))
-            elif isinstance(item, dict):
-                q_id = (
-                    item.get("q")
-                    or item.get("question")
-                    or item.get("qid")
-                    or item.get("id")
-                )
-                opt_id = (
-                    item.get("a")
-                    or item.get("answer")
-                    or item.get("opt")
-                    or item.get("option")
-                )
-                if isinstance(q_id, str) and isinstance(opt_id, str):
-                    pairs.append((q_id, opt_id))
-    return pairs
-
-
-def _render_surprise_invite(theme: dict) -> None:
-    """Se for o tema Surpresa, gera e mostra o convite personalizado."""
-    is_surprise = theme.get("id", "").startswith("surpresa")
-    has_map = bool(theme.get("compose_map"))
-    if not (is_surprise or has_map):
+
+def _fill_animation(pending: Pending) -> None:
+    """Troca o pôster do cartão pela animação."""
+    if pending is None:
         return
+    slot, media, fallback, still = pending
+    _show(slot, media, fallback, still)
+
 
-    if not _HAS_COMPOSER:
+def _render_surprise_invite(theme: dict, invite: str) -> None:
+    """Se for o tema Surpresa, mostra o convite personalizado."""
+    if not wants_invite(theme):
+        return
+
+    if not HAS_COMPOSER:
         st.info(
             "Para montar o convite automaticamente, crie "
             "`core/composer.py` e adicione `compose_map` no JSON "
@@ -102,39 +118,42 @@ def _render_surprise_invite(theme: dict) -> None:
         )
         return
 
-    # Normaliza respostas e compõe o convite.
-    pairs = _answers_to_pairs(st.session_state.answers)
-    plan = collect_plan(theme, pairs)  # type: ignore[misc]
-    invite = compose_invite(theme, plan)  # type: ignore[misc]
-
     if invite.strip():
         st.divider()
         st.subheader("Convite")
         st.markdown(invite)
 
 
+@timed(game="quiz")
 def page_result() -> None:
-    """Renderiza o resultado final; aplica variante e ações."""
-    theme = st.session_state.theme
-    mark_completed(theme["id"])
-
-    key, base = compute_result(
-        scores=st.session_state.scores,
-        theme=theme,
-        answers=st.session_state.answers,
-    )
-    block = apply_variant(base, theme, st.session_state.answers)
+    """Renderiza o resultado final; aplica variante e ações.
 
-    _render_result_card(block)
-    _render_surprise_invite(theme)
+    O desfecho (resultado, variante e convite) vem do cache compartilhado
+    por versão do tema e respostas; reruns só consultam.
+    """
+    ct = require_theme()
+    theme = ct.raw
+    st.session_state.setdefault("low_bandwidth", LOW_BANDWIDTH)
+    outcome = get_outcome(ct, st.session_state.picks, score_map(),
+                          st.session_state.signals)
+
+    pending = _render_result_card(outcome.block)
+    _render_surprise_invite(theme, outcome.invite)
 
     st.divider()
-    c1, _, c3 = st.columns([1, 1, 1])
+    c1, c2, c3 = st.columns([1, 1, 1])
+    with c2:
+        st.toggle("📶 Economizar dados", key="low_bandwidth",
+                  help="Mostra só a imagem estática do resultado.")
     with c1:
         if st.button("↻ Rejogar este tema"):
-            start_quiz(theme)
+            # Recomeça com a versão mais nova do tema, se ele mudou
+            start_quiz(current().theme_by_id(theme["id"]) or theme)
             st.rerun()
     with c3:
         if st.button("⟵ Voltar ao início"):
             reset_app()
             st.rerun()
+
+    # Por último: o texto e os botões já chegaram ao navegador.
+    _fill_animation(pending)
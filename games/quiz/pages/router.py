@@ -0,0 +1,35 @@
+"""Roteamento interno do Jogo 1 entre home, perguntas e resultado."""
+
+import streamlit as st
+
+from games.quiz.core.state import init_state, require_theme
+from games.quiz.pages.home import page_home
+from games.quiz.pages.quiz import page_quiz
+from games.quiz.pages.result import page_result
+from games.shared.metrics import timed
+
+
+@timed(game="quiz")
+def page_game() -> None:
+    """Renderiza a página do quiz indicada em `st.session_state.page`."""
+    init_state()
+
+    page = st.session_state.get("page", "home")
+    if page in ("quiz", "result"):
+        # sem o tema da partida (não restaurável), volta ao início
+        require_theme()
+
+    if page == "home":
+        page_home()
+        return
+
+    if page == "quiz":
+        page_quiz()
+        return
+
+    if page == "result":
+        page_result()
+        return
+
+    st.session_state.page = "home"
+    st.rerun()
@@ -0,0 +1,107 @@
+"""Sorteio ponderado O(1) pelo método de alias (Vose).
+
+`AliasTable` é imutável e pode ser compartilhada entre sessões: a tabela
+do banco é montada uma vez no carregamento. Cada sessão ajusta os pesos
+com `WeightedDraw`, que guarda só os fatores que mudaram (perguntas que
+já saíram ou foram retiradas) e corrige o sorteio por rejeição: sorteia
+na tabela e aceita o índice com probabilidade igual ao seu fator.
+
+Quando a massa aceita cai abaixo de `REBUILD_BELOW` da massa da tabela,
+a rejeição ficaria cara; a sessão então monta uma tabela própria com os
+pesos atuais e zera os fatores. Como isso só ocorre depois de metade da
+massa sair, o custo de reconstrução fica amortizado em O(1) por retirada.
+"""
+
+import random
+from array import array
+from typing import Dict, Sequence
+
+REBUILD_BELOW = 0.5
+MAX_TRIES = 64
+
+
+class AliasTable:
+    """Tabela de alias para os índices 0..n-1 com os pesos dados."""
+
+    __slots__ = ("weights", "total", "_prob", "_alias")
+
+    def __init__(self, weights: Sequence[float]) -> None:
+        n = len(weights)
+        self.weights = array("d", weights)
+        self.total = float(sum(self.weights))
+        self._prob = array("d", bytes(8 * n))
+        self._alias = array("l", range(n))
+        if n == 0 or self.total <= 0:
+            return
+
+        scaled = [w * n / self.total for w in self.weights]
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            s, g = small.pop(), large.pop()
+            self._prob[s] = scaled[s]
+            self._alias[s] = g
+            scaled[g] -= 1.0 - scaled[s]
+            (small if scaled[g] < 1.0 else large).append(g)
+        for i in large + small:
+            # sobras por erro de arredondamento ficam com probabilidade 1
+            self._prob[i] = 1.0 if self.weights[i] > 0 else 0.0
+
+    def __len__(self) -> int:
+        return len(self.weights)
+
+    def draw(self, rng: random.Random = random) -> int:
+        """Um índice com probabilidade proporcional ao peso."""
+        i = rng.randrange(len(self._prob))
+        return i if rng.random() < self._prob[i] else self._alias[i]
+
+
+class WeightedDraw:
+    """Pesos de uma sessão sobre uma tabela compartilhada.
+
+    `factors[i]` é o peso atual de i dividido pelo peso na tabela
+    (ausente = 1). `mass` é a soma dos pesos atuais.
+    """
+
+    __slots__ = ("table", "factors", "mass")
+
+    def __init__(self, table: AliasTable) -> None:
+        self.table = table
+        self.factors: Dict[int, float] = {}
+        self.mass = table.total
+
+    def weight(self, idx: int) -> float:
+        """Peso atual do índice nesta sessão."""
+        return self.table.weights[idx] * self.factors.get(idx, 1.0)
+
+    def scale(self, idx: int, factor: float) -> None:
+        """Multiplica o peso atual de `idx` por `factor` (0 retira)."""
+        f = self.factors.get(idx, 1.0)
+        if f == 0.0:
+            return
+        self.mass -= self.table.weights[idx] * f * (1.0 - factor)
+        self.factors[idx] = f * factor
+        if self.mass < self.table.total * REBUILD_BELOW:
+            self.rebuild()
+
+    def rebuild(self) -> None:
+        """Monta uma tabela própria com os pesos atuais (O(n))."""
+        weights = [self.weight(i) for i in range(len(self.table))]
+        self.table = AliasTable(weights)
+        self.factors = {}
+        self.mass = self.table.total
+
+    def draw(self, rng: random.Random = random) -> int:
+        """Um índice com probabilidade proporcional ao peso atual.
+
+        Retorna -1 se não restar peso nenhum.
+        """
+        if self.mass <= 0:
+            return -1
+        for _ in range(MAX_TRIES):
+            i = self.table.draw(rng)
+            f = self.factors.get(i, 1.0)
+            if f >= 1.0 or rng.random() < f:
+                return i
+        self.rebuild()
+        return self.table.draw(rng) if self.mass > 0 else -1
@@ -0,0 +1,95 @@
+"""Cache entre sessões dos quadros já codificados da animação da roleta.
+
+Muitas sessões giram a mesma roda (todo mundo começa com a mesma lista de
+perguntas), então cada quadro é guardado pronto para envio: bytes JPEG
+indexados por um hash dos rótulos, o motor, o tamanho, o ângulo
+quantizado e o destaque. O ângulo é arredondado para `ANGLE_STEP` graus
+— a página usa o mesmo arredondamento no ângulo final, para que a fatia
+sob o ponteiro seja exatamente a da imagem.
+"""
+
+import hashlib
+import io
+import os
+from typing import Any, Dict, Optional, Sequence
+
+from games.shared.lru import ByteLRU
+from games.shared.metrics import register_stats, timed
+
+ANGLE_STEP = 1.0
+JPEG_QUALITY = 88
+CACHE_BYTES = int(float(os.environ.get("ROLETA_FRAME_CACHE_MB", "64")) * 2**20)
+
+_FRAMES = ByteLRU(CACHE_BYTES)
+
+
+def labels_key(labels: Sequence[str]) -> str:
+    """Hash curto e estável da tupla de rótulos."""
+    h = hashlib.blake2b(digest_size=12)
+    for label in labels:
+        h.update(label.encode("utf-8"))
+        h.update(b"\x1f")
+    return h.hexdigest()
+
+
+def quantize_angle(angle: float) -> float:
+    """Arredonda o ângulo (0–360) para o passo usado nas chaves do cache."""
+    steps = round(360 / ANGLE_STEP)
+    return (round((angle % 360) / ANGLE_STEP) % steps) * ANGLE_STEP
+
+
+@timed("roleta_render_pil", game="roleta")
+def _encode_pil(labels: Sequence[str], angle: float, highlight: int | None,
+                size: int) -> bytes:
+    """Renderiza com Pillow e codifica em JPEG."""
+    from games.roleta.core.wheel_pil import render_frame
+
+    buf = io.BytesIO()
+    render_frame(labels, angle, highlight, size=size).save(
+        buf, format="JPEG", quality=JPEG_QUALITY
+    )
+    return buf.getvalue()
+
+
+@timed("roleta_render_mpl", game="roleta")
+def _encode_mpl(labels: Sequence[str], angle: float, highlight: int | None,
+                size: int, figure: Optional[Any] = None) -> bytes:
+    """Renderiza com Matplotlib em PNG, reaproveitando `figure` se servir.
+
+    Sem uma `WheelFigure` dos mesmos rótulos, monta uma temporária e a
+    libera logo em seguida — nenhuma figura fica presa no pyplot.
+    """
+    from games.roleta.core.wheel_mpl import WheelFigure
+
+    if figure is not None and figure.labels == tuple(labels):
+        return figure.render_png(angle, highlight, size)
+    tmp = WheelFigure(labels)
+    try:
+        return tmp.render_png(angle, highlight, size)
+    finally:
+        tmp.close()
+
+
+def encoded_frame(labels: Sequence[str], angle: float, highlight: int | None,
+                  engine: str = "pil", size: int = 640,
+                  figure: Optional[Any] = None) -> bytes:
+    """Quadro codificado da roleta, servido da memória quando possível.
+
+    `figure` é a `WheelFigure` da sessão, usada pelo motor matplotlib
+    nas falhas de cache; o motor Pillow a ignora.
+    """
+    q = quantize_angle(angle)
+    key = (labels_key(labels), engine, size, q, highlight)
+    if engine == "matplotlib":
+        build = lambda: _encode_mpl(labels, q, highlight, size, figure)  # noqa: E731
+    else:
+        build = lambda: _encode_pil(labels, q, highlight, size)  # noqa: E731
+    return _FRAMES.get_or_create(key, build)
+
+
+def frame_cache_stats() -> Dict[str, float]:
+    """Taxa de acerto e uso de memória do cache de quadros."""
+    return _FRAMES.stats()
+
+
+register_stats("roleta.frames", frame_cache_stats)
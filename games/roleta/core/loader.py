@@ -1,19 +1,169 @@
-"""Carrega perguntas do arquivo themes/roleta.json."""
+"""Carrega o banco de perguntas da roleta (games/roleta/roleta.json).
 
+Dois formatos são aceitos. O simples, só com a lista:
+
+    {"questions": ["Pergunta 1", "Pergunta 2"]}
+
+e o com categorias e pesos:
+
+    {
+      "decay": 0.5,
+      "categories": [
+        {"id": "leve", "title": "Leves", "weight": 3,
+         "questions": ["Pergunta", {"text": "Outra", "weight": 2}]},
+        {"id": "profunda", "title": "Profundas", "weight": 1,
+         "questions": ["..."]}
+      ]
+    }
+
+A categoria é sorteada na proporção do seu peso e, dentro dela, a
+pergunta na proporção do peso da pergunta (padrão 1). `decay` multiplica
+o peso de uma pergunta cada vez que ela sai na roda.
+"""
+
+import hashlib
 import json
+import threading
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from games.roleta.core.alias import AliasTable
+from games.shared.bundle import bundle_section, source_stamp
+from games.shared.metrics import timed
 
 
 THEME_PATH = Path("games/roleta/roleta.json")
+DEFAULT_CATEGORY = "geral"
+DEFAULT_DECAY = 0.5
+
+_LOCK = threading.Lock()
+_CACHE: Optional[Tuple[Optional[Tuple[int, int]], "RoletaBank"]] = None
+
+
+@dataclass(frozen=True, eq=False)
+class RoletaBank:
+    """Banco imutável de perguntas, compartilhado entre sessões.
+
+    `weights[i]` já é o peso final da pergunta i (categoria × pergunta,
+    normalizado na categoria); `table` é a tabela de alias sobre eles.
+    `version` é um hash curto do conteúdo: dois bancos com a mesma versão
+    têm as mesmas perguntas nos mesmos índices.
+    """
+
+    questions: Tuple[str, ...]
+    category_of: Tuple[int, ...]
+    categories: Tuple[Tuple[str, str], ...]  # (id, título)
+    weights: Tuple[float, ...]
+    decay: float
+    table: AliasTable
+    version: str
+
+    def __len__(self) -> int:
+        return len(self.questions)
+
+    def __getitem__(self, idx: int) -> str:
+        return self.questions[idx]
 
+    def category_title(self, idx: int) -> str:
+        """Título da categoria da pergunta idx."""
+        return self.categories[self.category_of[idx]][1]
+
+
+def _weight(value: Any) -> float:
+    """Peso numérico positivo, ou 0 se inválido."""
+    try:
+        w = float(value)
+    except (TypeError, ValueError):
+        return 0.0
+    return w if w > 0 else 0.0
+
+
+def _parse_questions(items: List[Any]) -> List[Tuple[str, float]]:
+    """(texto, peso) das perguntas válidas de uma categoria."""
+    out = []
+    for raw in items:
+        if isinstance(raw, dict):
+            text = str(raw.get("text", "")).strip()
+            w = _weight(raw.get("weight", 1))
+        else:
+            text, w = str(raw).strip(), 1.0
+        if text and w > 0:
+            out.append((text, w))
+    return out
+
+
+def build_bank(data: Dict[str, Any]) -> RoletaBank:
+    """Monta o banco a partir do JSON (qualquer dos dois formatos)."""
+    cats = data.get("categories")
+    if not isinstance(cats, list):
+        cats = [{"id": DEFAULT_CATEGORY, "title": "",
+                 "questions": data.get("questions", [])}]
+
+    questions: List[str] = []
+    category_of: List[int] = []
+    categories: List[Tuple[str, str]] = []
+    weights: List[float] = []
+    for cat in cats:
+        if not isinstance(cat, dict):
+            continue
+        cat_w = _weight(cat.get("weight", 1))
+        items = _parse_questions(cat.get("questions") or [])
+        if not items or cat_w <= 0:
+            continue
+        k = len(categories)
+        cid = str(cat.get("id") or f"cat{k}")
+        categories.append((cid, str(cat.get("title", cid))))
+        subtotal = sum(w for _, w in items)
+        for text, w in items:
+            questions.append(text)
+            category_of.append(k)
+            weights.append(cat_w * w / subtotal)
+
+    decay = _weight(data.get("decay", DEFAULT_DECAY))
+    decay = min(decay, 1.0) or DEFAULT_DECAY
+    content = json.dumps([questions, category_of, categories, weights, decay],
+                         ensure_ascii=False)
+    return RoletaBank(
+        questions=tuple(questions),
+        category_of=tuple(category_of),
+        categories=tuple(categories),
+        weights=tuple(weights),
+        decay=decay,
+        table=AliasTable(weights),
+        version=hashlib.blake2b(content.encode("utf-8"),
+                                digest_size=8).hexdigest(),
+    )
+
+
+def _read_bank() -> RoletaBank:
+    """Lê o banco do bundle (se atual) ou do JSON."""
+    cached = bundle_section("roleta", THEME_PATH)
+    if isinstance(cached, dict):
+        return build_bank(cached)
 
-def load_roleta_questions() -> list[str]:
-    """Retorna lista de perguntas para a roleta."""
     if not THEME_PATH.exists():
-        return []
+        return build_bank({})
 
     with THEME_PATH.open("r", encoding="utf-8") as f:
         data = json.load(f)
+    return build_bank(data)
+
+
+@timed(game="roleta")
+def load_roleta_bank() -> RoletaBank:
+    """Retorna o banco de perguntas da roleta, compartilhado entre sessões.
 
-    qs = data.get("questions", [])
-    return [str(x).strip() for x in qs if str(x).strip()]
+    O arquivo só é relido quando o carimbo (mtime, tamanho) muda; do
+    contrário volta o mesmo objeto. Um arquivo regravado sem mudança
+    gera outro objeto com a mesma `version`.
+    """
+    global _CACHE
+    stamp = source_stamp(THEME_PATH)
+    hit = _CACHE
+    if hit is not None and hit[0] == stamp:
+        return hit[1]
+    with _LOCK:
+        if _CACHE is None or _CACHE[0] != stamp:
+            _CACHE = (stamp, _read_bank())
+        return _CACHE[1]
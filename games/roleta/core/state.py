@@ -1,20 +1,94 @@
-"""Gerencia o estado da Roleta."""
+"""Gerencia o estado da Roleta.
+
+O banco de perguntas é o `RoletaBank` compartilhado do snapshot; a sessão
+guarda só um `IndexPool` com os índices restantes, um `WeightedDraw` com
+os pesos que mudaram e a janela de fatias atual.
+"""
+
+from typing import List, Tuple
 
 import streamlit as st
-from typing import List
+
+from games.roleta.core.alias import WeightedDraw
+from games.roleta.core.loader import RoletaBank
+from games.shared.metrics import timed
+from games.shared.pool import IndexPool
+
+# Quantas fatias a roda mostra de uma vez, seja qual for o tamanho do banco
+WINDOW_SLICES = 12
+
+
+def _fresh_state(bank: RoletaBank) -> None:
+    """Conjunto restante completo e pesos originais do banco."""
+    st.session_state.roleta_pool = IndexPool(len(bank))
+    st.session_state.roleta_draw = WeightedDraw(bank.table)
+    st.session_state.roleta_window = None
+    st.session_state.roleta_last = None
+
+
+@timed(game="roleta")
+def init_roleta_state(bank: RoletaBank) -> None:
+    """Inicializa o estado do jogo da roleta (ou reinicia se o banco mudou).
+
+    Um snapshot novo pode trazer outro objeto com o mesmo conteúdo (outro
+    arquivo mudou, ou o JSON foi salvo igual): a sessão passa a usá-lo e
+    mantém o progresso. Os índices só valem para o mesmo conteúdo, então
+    só um banco com outra `version` reinicia o jogo.
+    """
+    old = st.session_state.get("roleta_bank")
+    if old is bank:
+        return
+    st.session_state.roleta_bank = bank
+    if old is None or old.version != bank.version:
+        _fresh_state(bank)
+        return
+    draw: WeightedDraw = st.session_state.roleta_draw
+    if draw.table is old.table:
+        draw.table = bank.table  # mesma tabela; não prende o banco antigo
 
 
-def init_roleta_state(all_questions: List[str]) -> None:
-    """Inicializa o estado do jogo da roleta."""
-    if "roleta_all" not in st.session_state:
-        st.session_state.roleta_all = list(all_questions)
-    if "roleta_left" not in st.session_state:
-        st.session_state.roleta_left = list(all_questions)
-    if "roleta_last" not in st.session_state:
-        st.session_state.roleta_last = None
+def roleta_window() -> Tuple[List[int], int]:
+    """Janela atual: (índices do banco por fatia, fatia sorteada).
+
+    A pergunta-alvo é sorteada primeiro, pelos pesos da sessão, e a
+    janela é completada com outras restantes até `WINDOW_SLICES`. Como a
+    janela sai em ordem de índice, bancos pequenos mostram sempre a
+    mesma roda.
+    """
+    cached = st.session_state.roleta_window
+    if cached is not None:
+        return cached
+    pool: IndexPool = st.session_state.roleta_pool
+    target = st.session_state.roleta_draw.draw()
+    if target not in pool:
+        target = pool.draw()
+    window = sorted(pool.sample(WINDOW_SLICES - 1, exclude=target) + [target])
+    st.session_state.roleta_window = (window, window.index(target))
+    return st.session_state.roleta_window
+
+
+def discard_window() -> None:
+    """Descarta a janela atual; a próxima execução sorteia outra."""
+    st.session_state.roleta_window = None
+
+
+def note_drawn(idx: int) -> None:
+    """Registra que a pergunta saiu na roda: o peso dela decai."""
+    st.session_state.roleta_last = idx
+    st.session_state.roleta_draw.scale(idx, st.session_state.roleta_bank.decay)
+
+
+def mark_used(idx: int) -> None:
+    """Retira a pergunta do conjunto restante (peso zero)."""
+    st.session_state.roleta_pool.remove(idx)
+    st.session_state.roleta_draw.scale(idx, 0.0)
+    st.session_state.roleta_last = None
+    discard_window()
 
 
 def reset_roleta() -> None:
     """Reinicia a roleta e restaura todas as perguntas."""
-    st.session_state.roleta_left = list(st.session_state.roleta_all)
-    st.session_state.roleta_last = None
+    _fresh_state(st.session_state.roleta_bank)
+    fig = st.session_state.pop("roleta_fig", None)
+    if fig is not None:
+        fig.close()
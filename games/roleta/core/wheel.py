@@ -0,0 +1,55 @@
+"""Geometria e cores da roleta, comuns a todos os motores de desenho."""
+
+from typing import List
+
+# Medidas em unidades do gráfico (raio externo = 1), iguais às do ax.pie
+WEDGE_WIDTH = 0.88
+LABEL_RADIUS = 0.62
+POINTER_FROM = 0.72
+POINTER_TO = 0.98
+HIGHLIGHT_COLOR = "#FFD54F"
+LABEL_MAX_CHARS = 18
+
+
+def _hsl_to_rgb(h: float, s: float, l: float) -> tuple[float, float, float]:
+    """Converte HSL para RGB normalizado 0–1."""
+    def hue2rgb(p, q, t):
+        if t < 0:
+            t += 1
+        if t > 1:
+            t -= 1
+        if t < 1 / 6:
+            return p + (q - p) * 6 * t
+        if t < 1 / 2:
+            return q
+        if t < 2 / 3:
+            return p + (q - p) * (2 / 3 - t) * 6
+        return p
+
+    if s == 0:
+        return (l, l, l)
+    q = l * (1 + s) if l < 0.5 else l + s - l * s
+    p = 2 * l - q
+    r = hue2rgb(p, q, h + 1/3)
+    g = hue2rgb(p, q, h)
+    b = hue2rgb(p, q, h - 1/3)
+    return (r, g, b)
+
+
+def generate_colors(n: int) -> List[str]:
+    """Gera n cores bem distintas (HSL → HEX)."""
+    out = []
+    for i in range(n):
+        h = (i / n) % 1.0
+        s = 0.70
+        l = 0.48
+        r, g, b = _hsl_to_rgb(h, s, l)
+        out.append("#%02x%02x%02x" % (int(r * 255), int(g * 255), int(b * 255)))
+    return out
+
+
+def short_label(label: str) -> str:
+    """Corta o rótulo para caber na fatia."""
+    if len(label) > LABEL_MAX_CHARS:
+        return label[:LABEL_MAX_CHARS] + "…"
+    return label
@@ -0,0 +1,151 @@
+"""Motor de desenho da roleta com Matplotlib.
+
+`draw_wheel` cria uma figura pyplot nova a cada chamada (quem chama
+precisa fechá-la com `plt.close`). `WheelFigure` é o modo de memória
+limitada: monta uma única `Figure` fora do pyplot por conjunto de
+rótulos e, a cada quadro, só gira as fatias e os textos já existentes.
+"""
+
+import io
+import math
+from typing import Sequence
+
+import matplotlib.pyplot as plt
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from games.roleta.core.wheel import (
+    HIGHLIGHT_COLOR,
+    LABEL_RADIUS,
+    POINTER_FROM,
+    POINTER_TO,
+    WEDGE_WIDTH,
+    generate_colors,
+    short_label,
+)
+
+
+def draw_wheel(labels: list[str], angle: float, highlight: int | None):
+    """Desenha a roleta com ângulo e highlight opcionais."""
+    n = len(labels)
+    colors = generate_colors(n)
+    fracs = [1 / n] * n
+
+    fig, ax = plt.subplots(figsize=(5.5, 5.5))
+    fig.subplots_adjust(0.02, 0.02, 0.98, 0.98)
+
+    wedges, _ = ax.pie(
+        fracs,
+        colors=colors,
+        startangle=angle,
+        counterclock=True,
+        wedgeprops=dict(width=WEDGE_WIDTH, edgecolor="white", linewidth=1.2),
+    )
+
+    # Rótulos curtos internos
+    for i, w in enumerate(wedges):
+        ang = (w.theta2 + w.theta1) / 2
+        txt = short_label(labels[i])
+        r = LABEL_RADIUS
+        ax.text(
+            r * math.cos(math.radians(ang)),
+            r * math.sin(math.radians(ang)),
+            txt,
+            ha="center",
+            va="center",
+            fontsize=9,
+            rotation=ang,
+            rotation_mode="anchor",
+            color="white",
+        )
+
+    # Ponteiro
+    ax.annotate(
+        "",
+        xy=(0, POINTER_TO),
+        xytext=(0, POINTER_FROM),
+        arrowprops=dict(arrowstyle="-|>", lw=2.0),
+    )
+
+    # Destaque final
+    if highlight is not None:
+        wedges[highlight].set_edgecolor(HIGHLIGHT_COLOR)
+        wedges[highlight].set_linewidth(4)
+
+    ax.set_aspect("equal")
+    ax.axis("off")
+    return fig
+
+
+class WheelFigure:
+    """Figura reaproveitável da roleta para um conjunto fixo de rótulos.
+
+    Não passa pelo gerenciador de figuras do pyplot, então nada fica
+    retido globalmente: a figura vive enquanto este objeto viver, e
+    `close()` a libera na hora. Não é thread-safe — use uma por sessão.
+    """
+
+    def __init__(self, labels: Sequence[str]) -> None:
+        self.labels = tuple(labels)
+        n = len(self.labels)
+        self.fig = Figure(figsize=(5.5, 5.5))
+        FigureCanvasAgg(self.fig)
+        self.fig.subplots_adjust(0.02, 0.02, 0.98, 0.98)
+        ax = self.fig.add_subplot()
+
+        self.wedges, _ = ax.pie(
+            [1 / n] * n,
+            colors=generate_colors(n),
+            startangle=0,
+            counterclock=True,
+            wedgeprops=dict(width=WEDGE_WIDTH, edgecolor="white",
+                            linewidth=1.2),
+        )
+        self._base = [(w.theta1, w.theta2) for w in self.wedges]
+        self.texts = [
+            ax.text(0, 0, short_label(label), ha="center", va="center",
+                    fontsize=9, rotation_mode="anchor", color="white")
+            for label in self.labels
+        ]
+        ax.annotate(
+            "",
+            xy=(0, POINTER_TO),
+            xytext=(0, POINTER_FROM),
+            arrowprops=dict(arrowstyle="-|>", lw=2.0),
+        )
+        ax.set_aspect("equal")
+        ax.axis("off")
+        self._highlight: int | None = None
+
+    def set_frame(self, angle: float, highlight: int | None) -> None:
+        """Gira fatias e textos para `angle` e ajusta o destaque."""
+        for w, t, (t1, t2) in zip(self.wedges, self.texts, self._base):
+            w.set_theta1(t1 + angle)
+            w.set_theta2(t2 + angle)
+            ang = (t1 + t2) / 2 + angle
+            t.set_position((LABEL_RADIUS * math.cos(math.radians(ang)),
+                            LABEL_RADIUS * math.sin(math.radians(ang))))
+            t.set_rotation(ang)
+
+        if highlight != self._highlight:
+            if self._highlight is not None:
+                self.wedges[self._highlight].set_edgecolor("white")
+                self.wedges[self._highlight].set_linewidth(1.2)
+            if highlight is not None:
+                self.wedges[highlight].set_edgecolor(HIGHLIGHT_COLOR)
+                self.wedges[highlight].set_linewidth(4)
+            self._highlight = highlight
+
+    def render_png(self, angle: float, highlight: int | None,
+                   size: int = 550) -> bytes:
+        """Quadro em PNG com `size` pixels de lado."""
+        self.set_frame(angle, highlight)
+        buf = io.BytesIO()
+        self.fig.savefig(buf, format="png", dpi=size / 5.5)
+        return buf.getvalue()
+
+    def close(self) -> None:
+        """Libera a figura e os artistas imediatamente."""
+        self.fig.clear()
+        self.wedges = []
+        self.texts = []
@@ -1,111 +1,61 @@
-"""Página do Jogo 2 — Roleta ANIMADA com Matplotlib."""
+"""Página do Jogo 2 — Roleta ANIMADA (Pillow ou Matplotlib)."""
 
 import math
+import os
 import random
 import time
-from pathlib import Path
-from typing import List
 
-import matplotlib.pyplot as plt
-import numpy as np
 import streamlit as st
 
-from games.roleta.core.loader import load_roleta_questions
-from games.roleta.core.state import init_roleta_state, reset_roleta
+from games.roleta.core.frame_cache import encoded_frame, quantize_angle
+from games.roleta.core.state import (
+    discard_window,
+    init_roleta_state,
+    mark_used,
+    note_drawn,
+    reset_roleta,
+    roleta_window,
+)
+from games.shared.metrics import timed
+from games.shared.snapshot import current
+
+# "pil" (sprite girado, padrão) ou "matplotlib" (uma figura por sessão)
+ENGINE = os.environ.get("ROLETA_ENGINE", "pil")
+WHEEL_SIZE = 640
 
 
 # ---------------------------------------------------------------------
-# Utilidades de desenho da roleta
+# Motores de desenho
 # ---------------------------------------------------------------------
-def _hsl_to_rgb(h: float, s: float, l: float) -> tuple[float, float, float]:
-    """Converte HSL para RGB normalizado 0–1."""
-    def hue2rgb(p, q, t):
-        if t < 0:
-            t += 1
-        if t > 1:
-            t -= 1
-        if t < 1 / 6:
-            return p + (q - p) * 6 * t
-        if t < 1 / 2:
-            return q
-        if t < 2 / 3:
-            return p + (q - p) * (2 / 3 - t) * 6
-        return p
-
-    if s == 0:
-        return (l, l, l)
-    q = l * (1 + s) if l < 0.5 else l + s - l * s
-    p = 2 * l - q
-    r = hue2rgb(p, q, h + 1/3)
-    g = hue2rgb(p, q, h)
-    b = hue2rgb(p, q, h - 1/3)
-    return (r, g, b)
-
-
-def _generate_colors(n: int) -> List[str]:
-    """Gera n cores bem distintas (HSL → HEX)."""
-    out = []
-    for i in range(n):
-        h = (i / n) % 1.0
-        s = 0.70
-        l = 0.48
-        r, g, b = _hsl_to_rgb(h, s, l)
-        out.append("#%02x%02x%02x" % (int(r * 255), int(g * 255), int(b * 255)))
-    return out
-
-
-def _draw_wheel(labels: list[str], angle: float, highlight: int | None):
-    """Desenha a roleta com ângulo e highlight opcionais."""
-    n = len(labels)
-    colors = _generate_colors(n)
-    fracs = [1 / n] * n
-
-    fig, ax = plt.subplots(figsize=(5.5, 5.5))
-    fig.subplots_adjust(0.02, 0.02, 0.98, 0.98)
-
-    wedges, _ = ax.pie(
-        fracs,
-        colors=colors,
-        startangle=angle,
-        counterclock=True,
-        wedgeprops=dict(width=0.88, edgecolor="white", linewidth=1.2),
-    )
-
-    # Rótulos curtos internos
-    for i, w in enumerate(wedges):
-        ang = (w.theta2 + w.theta1) / 2
-        txt = labels[i][:18] + ("…" if len(labels[i]) > 18 else "")
-        r = 0.62
-        ax.text(
-            r * math.cos(math.radians(ang)),
-            r * math.sin(math.radians(ang)),
-            txt,
-            ha="center",
-            va="center",
-            fontsize=9,
-            rotation=ang,
-            rotation_mode="anchor",
-            color="white",
-        )
-
-    # Ponteiro
-    ax.annotate(
-        "",
-        xy=(0, 0.98),
-        xytext=(0, 0.72),
-        arrowprops=dict(arrowstyle="-|>", lw=2.0),
-    )
-
-    # Destaque final
-    if highlight is not None:
-        wedges[highlight].set_edgecolor("#FFD54F")
-        wedges[highlight].set_linewidth(4)
-
-    ax.set_aspect("equal")
-    ax.axis("off")
+def _session_figure(labels: list[str]):
+    """WheelFigure da sessão para os rótulos atuais (só no matplotlib).
+
+    Quando a lista de perguntas muda, a figura anterior é fechada antes
+    de montar a nova, então cada sessão retém no máximo uma.
+    """
+    if ENGINE != "matplotlib":
+        return None
+    from games.roleta.core.wheel_mpl import WheelFigure
+
+    fig = st.session_state.get("roleta_fig")
+    if fig is not None and fig.labels == tuple(labels):
+        return fig
+    if fig is not None:
+        fig.close()
+    fig = WheelFigure(labels)
+    st.session_state.roleta_fig = fig
     return fig
 
 
+@timed("roleta_frame", game="roleta")
+def _show_wheel(container, labels: list[str], angle: float,
+                highlight: int | None) -> None:
+    """Mostra o quadro da roleta, vindo do cache compartilhado de quadros."""
+    frame = encoded_frame(labels, angle, highlight, engine=ENGINE,
+                          size=WHEEL_SIZE, figure=_session_figure(labels))
+    container.image(frame, width="stretch")
+
+
 # ---------------------------------------------------------------------
 # Lógica de rotação
 # ---------------------------------------------------------------------
@@ -141,76 +91,76 @@ def _compute_final_angle(n: int, target_idx: int, angle_start: float) -> float:
 # ---------------------------------------------------------------------
 # Página do jogo
 # ---------------------------------------------------------------------
+@timed(game="roleta")
 def page_roleta() -> None:
     """Renderiza o jogo 2 — Roleta animada."""
-    qs = load_roleta_questions()
-    init_roleta_state(qs)
+    init_roleta_state(current().roleta)
 
     st.title("🌀 Jogo 2 — Roleta de Perguntas")
 
-    left = st.session_state.roleta_left
-    st.caption(f"Perguntas restantes: **{len(left)}**")
+    bank = st.session_state.roleta_bank
+    pool = st.session_state.roleta_pool
+    st.caption(f"Perguntas restantes: **{len(pool)}**")
     st.divider()
 
     # Se acabou
-    if not left:
+    if not pool:
         st.success("✨ Todas as perguntas foram usadas!")
         if st.button("🔁 Reiniciar"):
             reset_roleta()
             st.rerun()
         return
 
-    # Frame inicial
-    labels = list(left)
+    # Frame inicial: uma janela de fatias tirada das perguntas restantes
+    window, target = roleta_window()
+    labels = [bank[i] for i in window]
     angle = st.session_state.get("roleta_angle", 0.0)
 
     container = st.empty()
-    fig = _draw_wheel(labels, angle, highlight=None)
-    container.pyplot(fig)
+    _show_wheel(container, labels, angle, highlight=None)
 
     # Botões
     if st.button("🎯 Girar", type="primary"):
         n = len(labels)
-        # index alvo aleatório
-        idx = random.randrange(n)
-        final_angle = _compute_final_angle(n, idx, angle)
+        # a fatia alvo já foi sorteada junto com a janela
+        final_angle = _compute_final_angle(n, target, angle)
 
         # animação
         frames = 40
         for i in range(frames):
             t = (i+1)/frames
             a = angle + (final_angle - angle) * _ease_out(t)
-            fig = _draw_wheel(labels, a, highlight=None)
-            container.pyplot(fig)
+            _show_wheel(container, labels, a, highlight=None)
             time.sleep(0.025)
 
-        # fixar estado
-        st.session_state.roleta_angle = final_angle % 360
-        st.session_state.roleta_last = labels[
-            _slice_index_under_pointer(n, st.session_state.roleta_angle)
-        ]
+        # fixar estado (ângulo arredondado como no cache de quadros, para a
+        # fatia sorteada ser exatamente a da imagem final)
+        st.session_state.roleta_angle = quantize_angle(final_angle)
+        idx_final = _slice_index_under_pointer(n, st.session_state.roleta_angle)
+        note_drawn(window[idx_final])
 
-        # destaque final
-        idx_final = labels.index(st.session_state.roleta_last)
-        fig = _draw_wheel(labels, st.session_state.roleta_angle, highlight=idx_final)
-        container.pyplot(fig)
+        # destaque final; o próximo giro usa uma janela nova
+        _show_wheel(container, labels, st.session_state.roleta_angle,
+                    highlight=idx_final)
+        discard_window()
 
     # Pergunta sorteada
     last = st.session_state.roleta_last
-    if last:
+    if last is not None:
         st.subheader("Pergunta sorteada:")
-        st.markdown(f"### {last}")
+        st.markdown(f"### {bank[last]}")
+        if len(bank.categories) > 1:
+            st.caption(bank.category_title(last))
 
         c1, c2 = st.columns(2)
         with c1:
             if st.button("✅ Marcar como usada"):
-                if last in left:
-                    left.remove(last)
-                st.session_state.roleta_last = None
+                mark_used(last)
                 st.rerun()
         with c2:
             if st.button("↻ Girar novamente"):
                 st.session_state.roleta_last = None
+                discard_window()
                 st.rerun()
 
     st.divider()
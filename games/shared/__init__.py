@@ -0,0 +1 @@
+"""Infraestrutura compartilhada entre os jogos do hub."""
@@ -0,0 +1,288 @@
+"""Bundle pré-compilado com temas, mídia, perguntas da roleta e cartas.
+
+O passo de build valida tudo e grava um único arquivo versionado: um
+cabeçalho (assinatura, versão, tamanho e sha256) seguido de JSON. O app
+lê o arquivo de uma vez ao iniciar (uma leitura e um `json.loads`) e usa
+os dados já validados, sem abrir cada JSON nem medir cada imagem.
+
+Cada seção guarda o sha256 do arquivo de origem e o caminho relativo à
+raiz do projeto, então um bundle gerado no CI continua valendo em outra
+cópia do repositório (onde os mtimes são outros). Se o conteúdo de uma
+origem mudou depois do build, a seção é ignorada e o loader volta a ler
+o arquivo normalmente. Só dados entram no bundle: nada é executado ao
+lê-lo.
+
+Uso:
+    python -m games.shared.bundle build [--out PATH] [--strict-media]
+    python -m games.shared.bundle check [--strict-media]
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import struct
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+ROOT_DIR = Path(__file__).resolve().parents[2]
+BUNDLE_PATH = Path(os.environ.get("APP_BUNDLE", "build/app.bundle"))
+
+MAGIC = b"ESCB"
+FORMAT_VERSION = 2
+_HEADER = struct.Struct("<4sHHQ32s")
+
+_LOCK = threading.Lock()
+_LOADED = False
+_BUNDLE: Optional[Dict[str, Any]] = None
+# caminho → (carimbo, sha256): cada arquivo é hasheado uma vez por versão
+_DIGESTS: Dict[str, Tuple[Tuple[int, int], str]] = {}
+
+
+def source_stamp(path: Path) -> Optional[Tuple[int, int]]:
+    """Carimbo (mtime_ns, tamanho) do arquivo, ou None se não existir."""
+    try:
+        info = path.stat()
+    except OSError:
+        return None
+    return info.st_mtime_ns, info.st_size
+
+
+def source_digest(path: Path) -> Optional[str]:
+    """sha256 do conteúdo do arquivo, ou None se não existir.
+
+    O hash fica em cache pelo carimbo, então só é recalculado quando o
+    arquivo muda.
+    """
+    stamp = source_stamp(path)
+    if stamp is None:
+        return None
+    key = str(path)
+    hit = _DIGESTS.get(key)
+    if hit is not None and hit[0] == stamp:
+        return hit[1]
+    try:
+        with path.open("rb") as f:
+            digest = hashlib.file_digest(f, "sha256").hexdigest()
+    except OSError:
+        return None
+    _DIGESTS[key] = (stamp, digest)
+    return digest
+
+
+def bundle_key(path: Path) -> str:
+    """Caminho como gravado no bundle: relativo à raiz, com barras."""
+    p = path if path.is_absolute() else Path.cwd() / path
+    try:
+        return p.resolve().relative_to(ROOT_DIR).as_posix()
+    except ValueError:
+        return p.resolve().as_posix()
+
+
+# ---------------------------------------------------------------------
+# Leitura (app)
+# ---------------------------------------------------------------------
+def read_bundle(path: Path) -> Dict[str, Any]:
+    """Lê e confere um bundle; levanta ValueError se inválido."""
+    raw = path.read_bytes()
+    if len(raw) < _HEADER.size:
+        raise ValueError("bundle truncado")
+    magic, version, _, size, digest = _HEADER.unpack_from(raw, 0)
+    if magic != MAGIC:
+        raise ValueError("arquivo não é um bundle do app")
+    if version != FORMAT_VERSION:
+        raise ValueError(f"versão de bundle não suportada: {version}")
+    payload = raw[_HEADER.size:]
+    if len(payload) != size:
+        raise ValueError("bundle truncado")
+    if hashlib.sha256(payload).digest() != digest:
+        raise ValueError("bundle corrompido (hash não confere)")
+    content = json.loads(payload)
+    if not isinstance(content, dict):
+        raise ValueError("bundle sem conteúdo")
+    return content
+
+
+def load_bundle() -> Optional[Dict[str, Any]]:
+    """Retorna o bundle do processo (lido uma vez), ou None se não houver."""
+    global _LOADED, _BUNDLE
+    if _LOADED:
+        return _BUNDLE
+    with _LOCK:
+        if not _LOADED:
+            try:
+                _BUNDLE = read_bundle(BUNDLE_PATH)
+            except (OSError, ValueError):
+                _BUNDLE = None
+            _LOADED = True
+    return _BUNDLE
+
+
+def bundle_section(name: str, source: Path) -> Optional[Any]:
+    """Dados de uma seção do bundle, se a origem não mudou desde o build."""
+    bundle = load_bundle()
+    if not bundle:
+        return None
+    section = bundle["sections"].get(name)
+    if section is None or section["source"] != bundle_key(source):
+        return None
+    if section["sha256"] != source_digest(source):
+        return None
+    return section["data"]
+
+
+def bundle_theme(path: Path) -> Tuple[bool, Optional[Dict]]:
+    """(achou, dados) do tema no bundle; dados None = não é tema.
+
+    Só acha se o arquivo ainda tem o conteúdo do build.
+    """
+    bundle = load_bundle()
+    entry = bundle["themes"].get(bundle_key(path)) if bundle else None
+    if entry is None or entry["sha256"] != source_digest(path):
+        return False, None
+    return True, entry["data"]
+
+
+def bundle_media(path: Path) -> Optional[List]:
+    """Registro de mídia gravado no build, se o arquivo não mudou."""
+    bundle = load_bundle()
+    record = bundle.get("media", {}).get(bundle_key(path)) if bundle else None
+    if record is None or record[-1] != source_digest(path):
+        return None
+    return record
+
+
+# ---------------------------------------------------------------------
+# Build
+# ---------------------------------------------------------------------
+def _collect(strict_media: bool) -> Tuple[Dict[str, Any], List[str],
+                                          List[str], int]:
+    """Lê e valida as fontes: (conteúdo, erros, avisos, mídias ausentes).
+
+    Mídia ausente é aviso (o app mostra o texto sem a imagem), a menos
+    que `strict_media` a torne erro.
+    """
+    global _LOADED, _BUNDLE
+    from games.quiz.core.media_index import media_records, missing_media
+    from games.quiz.core.theme_io import (
+        load_theme,
+        load_theme_files,
+        validate_theme,
+    )
+    from games.roleta.core.loader import THEME_PATH, load_roleta_bank
+    from games.sorte.core.loader import CARDS_PATH, load_sorte_cards
+
+    # O build sempre parte das fontes, nunca de um bundle anterior.
+    with _LOCK:
+        _LOADED, _BUNDLE = True, None
+
+    errors: List[str] = []
+    warnings: List[str] = []
+    missing = 0
+    themes: Dict[str, Dict[str, Any]] = {}
+
+    for p in load_theme_files():
+        entry = {"sha256": source_digest(p), "data": None}
+        themes[bundle_key(p)] = entry
+        try:
+            data = load_theme(p)
+        except ValueError:
+            warnings.append(f"{p}: não é um tema de quiz, ignorado")
+            continue
+        errors += [f"{p}: {e}" for e in validate_theme(data)]
+        media = [f"{p}: mídia não encontrada: {ref}"
+                 for ref in missing_media(data)]
+        missing += len(media)
+        (errors if strict_media else warnings).extend(media)
+        entry["data"] = data
+
+    roleta_data: Dict[str, Any] = {}
+    if THEME_PATH.exists():
+        roleta_data = json.loads(THEME_PATH.read_text(encoding="utf-8"))
+    if not load_roleta_bank():
+        warnings.append(f"{THEME_PATH}: nenhuma pergunta para a roleta")
+
+    cards = load_sorte_cards()
+    for c in cards:
+        for stage in ("past", "present", "future"):
+            if not c.get(stage):
+                errors.append(f"carta '{c.get('id')}': sem texto para '{stage}'")
+        if c.get("image") and not (ROOT_DIR / c["image"]).exists():
+            # a folha de sprites desenha uma frente com o nome no lugar
+            missing += 1
+            msg = f"carta '{c['id']}': arte não encontrada: {c['image']}"
+            (errors if strict_media else warnings).append(msg)
+
+    content = {
+        "built_at": time.time(),
+        "themes": themes,
+        "media": {bundle_key(Path(k)): list(v) for k, v in media_records(
+            e["data"] for e in themes.values() if e["data"]
+        ).items()},
+        "sections": {
+            "roleta": {
+                "source": bundle_key(THEME_PATH),
+                "sha256": source_digest(THEME_PATH),
+                "data": roleta_data,
+            },
+            "sorte": {
+                "source": bundle_key(CARDS_PATH),
+                "sha256": source_digest(CARDS_PATH),
+                "data": list(cards),
+            },
+        },
+    }
+    return content, errors, warnings, missing
+
+
+def write_bundle(content: Dict[str, Any], out: Path) -> int:
+    """Grava o bundle de forma atômica e retorna o tamanho em bytes."""
+    payload = json.dumps(content, ensure_ascii=False,
+                         separators=(",", ":")).encode("utf-8")
+    header = _HEADER.pack(MAGIC, FORMAT_VERSION, 0, len(payload),
+                          hashlib.sha256(payload).digest())
+    out.parent.mkdir(parents=True, exist_ok=True)
+    tmp = out.with_suffix(out.suffix + ".tmp")
+    with tmp.open("wb") as f:
+        f.write(header)
+        f.write(payload)
+    os.replace(tmp, out)
+    return len(header) + len(payload)
+
+
+def main(argv: List[str] | None = None) -> int:
+    """Ponto de entrada da linha de comando."""
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("command", choices=["build", "check"])
+    ap.add_argument("--out", type=Path, default=BUNDLE_PATH)
+    ap.add_argument("--strict-media", action="store_true",
+                    help="trata mídia ausente como erro, não aviso")
+    args = ap.parse_args(argv)
+
+    content, errors, warnings, missing = _collect(args.strict_media)
+    for w in warnings:
+        print(f"aviso: {w}")
+    for e in errors:
+        print(f"erro: {e}")
+    if missing:
+        print(f"{missing} arquivo(s) de mídia ausente(s).")
+    if errors:
+        print(f"{len(errors)} erro(s); bundle não gerado.")
+        return 1
+
+    n_themes = sum(1 for e in content["themes"].values() if e["data"])
+    if args.command == "check":
+        print(f"ok: {n_themes} tema(s) válidos, {len(warnings)} aviso(s).")
+        return 0
+
+    size = write_bundle(content, args.out)
+    print(f"bundle gerado em {args.out} ({size:,} bytes, {n_themes} temas, "
+          f"{len(warnings)} aviso(s)).")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
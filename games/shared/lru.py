@@ -0,0 +1,89 @@
+"""Cache LRU thread-safe com orçamento em bytes, compartilhado entre sessões."""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+
+class ByteLRU:
+    """LRU limitado pelo total de bytes dos valores, com contadores.
+
+    `sizeof` diz quantos bytes cada valor ocupa (padrão: `len`, para
+    valores `bytes`). Um valor maior que o orçamento inteiro não é
+    guardado. A construção em `get_or_create` roda fora do lock: duas
+    threads podem construir o mesmo valor, mas nenhuma fica esperando.
+    """
+
+    def __init__(self, max_bytes: int,
+                 sizeof: Callable[[Any], int] = len) -> None:
+        self.max_bytes = max_bytes
+        self._sizeof = sizeof
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._sizes: Dict[Hashable, int] = {}
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Se a chave está no cache (sem contar acerto nem mudar a ordem)."""
+        with self._lock:
+            return key in self._data
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Retorna o valor (marcando como recente) ou None."""
+        with self._lock:
+            value = self._data.get(key)
+            if value is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+            self._data.move_to_end(key)
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Guarda o valor, descartando os menos usados se faltar espaço."""
+        size = self._sizeof(value)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._data:
+                self._bytes -= self._sizes[key]
+            self._data[key] = value
+            self._data.move_to_end(key)
+            self._sizes[key] = size
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                old, _ = self._data.popitem(last=False)
+                self._bytes -= self._sizes.pop(old)
+                self._evictions += 1
+
+    def get_or_create(self, key: Hashable, build: Callable[[], Any]) -> Any:
+        """Retorna o valor em cache ou constrói, guarda e retorna."""
+        value = self.get(key)
+        if value is None:
+            value = build()
+            self.put(key, value)
+        return value
+
+    def stats(self) -> Dict[str, float]:
+        """Contadores de uso: acertos, falhas, taxa, bytes e entradas."""
+        with self._lock:
+            total = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / total if total else 0.0,
+                "evictions": self._evictions,
+                "entries": len(self._data),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+    def clear(self) -> None:
+        """Esvazia o cache e zera os contadores."""
+        with self._lock:
+            self._data.clear()
+            self._sizes.clear()
+            self._bytes = self._hits = self._misses = self._evictions = 0
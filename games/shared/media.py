@@ -0,0 +1,27 @@
+"""URLs de mídia servidas pelo Streamlit, sem passar pelo st.image.
+
+O st.image abre e, se preciso, recodifica os bytes a cada chamada (WebP
+vira um quadro só). Aqui os bytes vão direto para o gerenciador de
+mídia do Streamlit — o mesmo que o st.image usa — e voltam como URL
+para HTML da página (`<picture>`, ou a mesma `<img>` repetida sem
+reenviar os bytes). O st.image não aceita essa URL de volta: só
+endereços absolutos ou de `static/`.
+"""
+
+from streamlit import config, runtime
+
+
+def media_url(data: bytes, mimetype: str, coordinates: str) -> str:
+    """URL dos bytes para esta sessão ("" fora de um runtime).
+
+    `coordinates` identifica o lugar na página: registrar outra mídia
+    com a mesma coordenada libera a anterior, como no st.image. A URL já
+    inclui o `server.baseUrlPath`, que o frontend só acrescenta sozinho
+    nos elementos de mídia, não em HTML.
+    """
+    if not runtime.exists():
+        return ""
+    url = runtime.get_instance().media_file_mgr.add(data, mimetype,
+                                                    coordinates)
+    base = (config.get_option("server.baseUrlPath") or "").strip("/")
+    return f"/{base}{url}" if base and url.startswith("/") else url
@@ -0,0 +1,287 @@
+"""Spans de tempo por rerun, em histogramas no formato do Prometheus.
+
+Desligado por padrão: `timed` devolve a própria função, sem embrulho, e
+`span` devolve um contexto vazio compartilhado. Com `APP_METRICS=1`,
+cada span soma sua duração num histograma por (span, jogo), e o app
+exporta o texto do Prometheus:
+
+- `APP_METRICS_FILE` (padrão `build/metrics.prom`): reescrito ao fim de
+  um rerun, no máximo a cada `APP_METRICS_INTERVAL` segundos (padrão 5);
+  serve para o textfile collector do node_exporter ou para `report`;
+- `APP_METRICS_PORT`: se definido, responde em
+  `http://127.0.0.1:<porta>/metrics`.
+
+Caches e outros módulos podem publicar contadores próprios com
+`register_stats(nome, fn)`: `fn` devolve um dict e cada chave vira um
+gauge `app_stat{source=nome,stat=chave}` no mesmo texto.
+
+Os contadores são do processo (somam todas as sessões). p50/p99 saem
+de `histogram_quantile` no Prometheus, ou localmente:
+
+    python -m games.shared.metrics report [build/metrics.prom]
+"""
+
+import bisect
+import functools
+import os
+import re
+import sys
+import threading
+import time
+from contextlib import nullcontext
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple, TypeVar
+
+ENABLED = os.environ.get("APP_METRICS", "0") == "1"
+METRICS_FILE = Path(os.environ.get("APP_METRICS_FILE", "build/metrics.prom"))
+EXPORT_INTERVAL = float(os.environ.get("APP_METRICS_INTERVAL", "5"))
+METRICS_PORT = int(os.environ.get("APP_METRICS_PORT", "0"))
+
+METRIC = "app_span_seconds"
+STATS_METRIC = "app_stat"
+# Limites superiores em segundos (de 1 ms a 10 s).
+BUCKETS: Tuple[float, ...] = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5,
+    5.0, 10.0,
+)
+
+F = TypeVar("F", bound=Callable)
+
+
+class Histogram:
+    """Contagens por faixa, soma e total de um span."""
+
+    __slots__ = ("counts", "total", "count")
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(BUCKETS) + 1)  # a última é +Inf
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, seconds: float) -> None:
+        """Registra uma duração."""
+        self.counts[bisect.bisect_left(BUCKETS, seconds)] += 1
+        self.total += seconds
+        self.count += 1
+
+
+_HISTS: Dict[Tuple[str, str], Histogram] = {}
+_STATS: Dict[str, Callable[[], Dict[str, float]]] = {}
+_LOCK = threading.Lock()
+_NOOP = nullcontext()
+_LAST_EXPORT = 0.0
+_SERVE_LOCK = threading.Lock()
+_SERVE_TRIED = False
+
+
+def observe(name: str, game: str, seconds: float) -> None:
+    """Soma uma duração ao histograma de (span, jogo)."""
+    with _LOCK:
+        hist = _HISTS.get((name, game))
+        if hist is None:
+            hist = _HISTS[(name, game)] = Histogram()
+        hist.observe(seconds)
+
+
+class _Span:
+    """Mede o bloco, inclusive quando sai por st.rerun()/st.stop()."""
+
+    __slots__ = ("name", "game", "start")
+
+    def __init__(self, name: str, game: str) -> None:
+        self.name = name
+        self.game = game
+
+    def __enter__(self) -> "_Span":
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        observe(self.name, self.game, time.perf_counter() - self.start)
+
+
+def span(name: str, game: str = "hub"):
+    """Contexto que mede um trecho (vazio se as métricas estão desligadas)."""
+    return _Span(name, game) if ENABLED else _NOOP
+
+
+def timed(name: Optional[str] = None,
+          game: str = "hub") -> Callable[[F], F]:
+    """Decorador que mede cada chamada como um span (nome padrão: a função).
+
+    Desligado, devolve a função original: nenhum custo por chamada.
+    """
+    def decorate(fn: F) -> F:
+        if not ENABLED:
+            return fn
+        label = name or fn.__name__
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with _Span(label, game):
+                return fn(*args, **kwargs)
+        return wrapper  # type: ignore[return-value]
+    return decorate
+
+
+def register_stats(source: str, fn: Callable[[], Dict[str, float]]) -> None:
+    """Publica os contadores de `fn` como gauges (lidos a cada export)."""
+    _STATS[source] = fn
+
+
+def render() -> str:
+    """Histogramas e gauges no formato de texto do Prometheus."""
+    with _LOCK:
+        items = sorted((k, list(h.counts), h.total, h.count)
+                       for k, h in _HISTS.items())
+    lines = [
+        f"# HELP {METRIC} Duração dos spans do app por rerun.",
+        f"# TYPE {METRIC} histogram",
+    ]
+    for (name, game), counts, total, count in items:
+        labels = f'span="{name}",game="{game}"'
+        acc = 0
+        for bound, n in zip(BUCKETS, counts):
+            acc += n
+            lines.append(f'{METRIC}_bucket{{{labels},le="{bound}"}} {acc}')
+        lines.append(f'{METRIC}_bucket{{{labels},le="+Inf"}} {count}')
+        lines.append(f"{METRIC}_sum{{{labels}}} {total:.6f}")
+        lines.append(f"{METRIC}_count{{{labels}}} {count}")
+    if _STATS:
+        lines.append(f"# HELP {STATS_METRIC} Contadores de caches do app.")
+        lines.append(f"# TYPE {STATS_METRIC} gauge")
+    for source, fn in sorted(_STATS.items()):
+        for stat, value in sorted(fn().items()):
+            lines.append(f'{STATS_METRIC}{{source="{source}",'
+                         f'stat="{stat}"}} {value}')
+    return "\n".join(lines) + "\n"
+
+
+def write_file(path: Path = METRICS_FILE) -> None:
+    """Grava o texto de forma atômica (quem lê nunca vê meio arquivo)."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(render(), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def _serve(port: int) -> None:
+    """Liga o endpoint /metrics numa thread (uma tentativa por processo)."""
+    global _SERVE_TRIED
+    with _SERVE_LOCK:
+        if _SERVE_TRIED:
+            return
+        _SERVE_TRIED = True
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:  # noqa: N802
+            if self.path.split("?")[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = render().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type",
+                             "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args) -> None:
+            pass
+
+    try:
+        server = ThreadingHTTPServer(("127.0.0.1", port), Handler)
+    except OSError:
+        return  # porta ocupada (ex.: outra réplica): fica só o arquivo
+    threading.Thread(target=server.serve_forever, name="metrics-http",
+                     daemon=True).start()
+
+
+def export() -> None:
+    """Chamado ao fim de cada rerun: grava o arquivo e liga o endpoint.
+
+    Não faz nada com as métricas desligadas; o arquivo respeita o
+    intervalo mínimo entre gravações.
+    """
+    global _LAST_EXPORT
+    if not ENABLED:
+        return
+    if METRICS_PORT and not _SERVE_TRIED:
+        _serve(METRICS_PORT)
+    now = time.monotonic()
+    if now - _LAST_EXPORT < EXPORT_INTERVAL:
+        return
+    _LAST_EXPORT = now
+    try:
+        write_file()
+    except OSError:
+        pass  # disco cheio ou pasta sem permissão não derruba o app
+
+
+# ---------------------------------------------------------------------
+# Leitura do arquivo exportado
+# ---------------------------------------------------------------------
+_BUCKET = re.compile(
+    r'^' + METRIC + r'_bucket\{span="([^"]*)",game="([^"]*)",'
+    r'le="([^"]*)"\} (\S+)$'
+)
+
+
+def parse(text: str) -> Dict[Tuple[str, str], List[Tuple[float, int]]]:
+    """Buckets cumulativos (limite, contagem) por (span, jogo)."""
+    out: Dict[Tuple[str, str], List[Tuple[float, int]]] = {}
+    for line in text.splitlines():
+        m = _BUCKET.match(line)
+        if not m:
+            continue
+        name, game, le, value = m.groups()
+        out.setdefault((name, game), []).append(
+            (float("inf") if le == "+Inf" else float(le), int(float(value)))
+        )
+    return out
+
+
+def quantile(q: float, buckets: List[Tuple[float, int]]) -> float:
+    """Estimativa do quantil por interpolação, como `histogram_quantile`."""
+    total = buckets[-1][1]
+    if not total:
+        return 0.0
+    rank = q * total
+    prev_bound, prev_count = 0.0, 0
+    for bound, count in buckets:
+        if count >= rank:
+            if bound == float("inf"):
+                return prev_bound
+            width = count - prev_count
+            frac = (rank - prev_count) / width if width else 0.0
+            return prev_bound + (bound - prev_bound) * frac
+        prev_bound, prev_count = bound, count
+    return prev_bound
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Ponto de entrada da linha de comando."""
+    import argparse  # só na CLI: este módulo entra no startup do hub
+
+    ap = argparse.ArgumentParser(description="Métricas de spans do app.")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    r = sub.add_parser("report", help="p50/p99 por span e jogo")
+    r.add_argument("file", type=Path, nargs="?", default=METRICS_FILE)
+    args = ap.parse_args(argv)
+
+    if not args.file.exists():
+        print(f"arquivo não encontrado: {args.file}", file=sys.stderr)
+        return 2
+    data = parse(args.file.read_text(encoding="utf-8"))
+    print(f"{'jogo':8s} {'span':24s} {'n':>7s} {'p50 ms':>9s} {'p99 ms':>9s}")
+    for (name, game), buckets in sorted(data.items(),
+                                        key=lambda kv: (kv[0][1], kv[0][0])):
+        print(f"{game:8s} {name:24s} {buckets[-1][1]:7d} "
+              f"{quantile(0.5, buckets) * 1e3:9.2f} "
+              f"{quantile(0.99, buckets) * 1e3:9.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,66 @@
+"""Conjunto de índices dos itens restantes de uma sessão (roleta, sorte).
+
+O banco (perguntas, cartas) é compartilhado e imutável; cada sessão
+guarda só dois arrays de inteiros: `items` (os índices ainda
+disponíveis, em ordem qualquer) e `pos` (a posição de cada índice em
+`items`, ou -1 se já saiu). Sortear, conferir e remover são O(1): a
+remoção troca o item com o último e encurta o array.
+"""
+
+import random
+from array import array
+from typing import List
+
+
+class IndexPool:
+    """Índices 0..n-1 ainda disponíveis, com sorteio e remoção O(1)."""
+
+    __slots__ = ("items", "pos")
+
+    def __init__(self, n: int) -> None:
+        self.items = array("l", range(n))
+        self.pos = array("l", range(n))
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __contains__(self, idx: int) -> bool:
+        return 0 <= idx < len(self.pos) and self.pos[idx] >= 0
+
+    def _swap(self, a: int, b: int) -> None:
+        """Troca as posições a e b de `items`, mantendo `pos` em dia."""
+        items, pos = self.items, self.pos
+        ia, ib = items[a], items[b]
+        items[a], items[b] = ib, ia
+        pos[ia], pos[ib] = b, a
+
+    def draw(self, rng: random.Random = random) -> int:
+        """Um índice disponível qualquer, uniforme (não remove)."""
+        return self.items[rng.randrange(len(self.items))]
+
+    def remove(self, idx: int) -> None:
+        """Tira o índice do conjunto (sem efeito se já tiver saído)."""
+        if idx not in self:
+            return
+        self._swap(self.pos[idx], len(self.items) - 1)
+        self.items.pop()
+        self.pos[idx] = -1
+
+    def sample(self, k: int, rng: random.Random = random,
+               exclude: int = -1) -> List[int]:
+        """Até `k` índices distintos, uniformes, sem `exclude`. Custo O(k).
+
+        Faz um Fisher–Yates parcial no início de `items` (o `exclude`,
+        se estiver no conjunto, vai antes para a última posição e fica
+        de fora); a ordem interna muda, mas o conjunto continua o mesmo.
+        """
+        n = len(self.items)
+        if exclude in self:
+            self._swap(self.pos[exclude], n - 1)
+            n -= 1
+        k = min(k, n)
+        out = []
+        for j in range(k):
+            self._swap(j, rng.randrange(j, n))
+            out.append(self.items[j])
+        return out
@@ -0,0 +1,68 @@
+"""Registro dos jogos do hub, com importação preguiçosa das páginas.
+
+O hub lista os jogos só com os metadados abaixo; o módulo de páginas de
+um jogo (e tudo que ele puxa, como matplotlib) só é importado quando o
+jogo vira `active_game`. Este módulo não deve importar nada pesado.
+"""
+
+import importlib
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class GameSpec:
+    """Metadados leves de um jogo, suficientes para o hub."""
+
+    key: str
+    heading: str
+    button: str
+    button_key: str
+    back_key: str
+    entry: str
+
+    def load(self) -> Callable[[], None]:
+        """Importa o módulo do jogo e retorna a função de página."""
+        fn = _ENTRIES.get(self.key)
+        if fn is None:
+            module, _, attr = self.entry.partition(":")
+            fn = _ENTRIES[self.key] = getattr(
+                importlib.import_module(module), attr
+            )
+        return fn
+
+
+GAMES: Tuple[GameSpec, ...] = (
+    GameSpec(
+        key="quiz",
+        heading="🎯 Jogo 1 — Quiz",
+        button="▶️ Jogar Quiz",
+        button_key="go_quiz",
+        back_key="quiz_back",
+        entry="games.quiz.pages.router:page_game",
+    ),
+    GameSpec(
+        key="roleta",
+        heading="🌀 Jogo 2 — Roleta",
+        button="▶️ Jogar Roleta",
+        button_key="go_roleta_main",
+        back_key="roleta_back",
+        entry="games.roleta.pages.roleta:page_roleta",
+    ),
+    GameSpec(
+        key="sorte",
+        heading="🍀 Jogo 3 — Sorte",
+        button="▶️ Jogar Sorte",
+        button_key="go_sorte_main",
+        back_key="sorte_back",
+        entry="games.sorte.pages.sorte:page_sorte",
+    ),
+)
+
+_BY_KEY: Dict[str, GameSpec] = {g.key: g for g in GAMES}
+_ENTRIES: Dict[str, Callable[[], None]] = {}
+
+
+def get_game(key: str) -> Optional[GameSpec]:
+    """Retorna os metadados do jogo pela chave, ou None."""
+    return _BY_KEY.get(key)
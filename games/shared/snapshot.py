@@ -0,0 +1,150 @@
+"""Snapshots imutáveis dos dados do app, trocados a quente (estilo RCU).
+
+As páginas leem sempre `current()`, que devolve uma referência pronta e
+nunca é alterada depois de publicada. Uma thread observadora confere os
+arquivos de origem a cada poucos segundos; quando algo muda, monta um
+snapshot novo por completo e só então troca a referência global. Uma
+leitura concorrente vê o snapshot antigo inteiro ou o novo inteiro, nunca
+um catálogo pela metade.
+
+A observação é feita por polling de (mtime, tamanho): funciona em
+qualquer sistema e, para meia dúzia de arquivos, custa poucos `stat`
+por ciclo. `APP_RELOAD_INTERVAL=0` desativa a thread.
+"""
+
+import os
+import threading
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+from games.quiz.core.catalog import load_catalog
+from games.quiz.core.media_index import MediaIndex, build_media_index
+from games.quiz.core.theme_io import load_theme_files
+from games.roleta.core.loader import THEME_PATH, RoletaBank, load_roleta_bank
+from games.shared.bundle import source_stamp
+from games.shared.metrics import timed
+from games.sorte.core.loader import CARDS_PATH, load_sorte_cards
+
+RELOAD_INTERVAL = float(os.environ.get("APP_RELOAD_INTERVAL", "2.0"))
+
+Stamps = Tuple[Tuple[str, Optional[Tuple[int, int]]], ...]
+
+
+@dataclass(frozen=True, eq=False)
+class Snapshot:
+    """Versão consistente de todos os dados carregados de arquivos.
+
+    Os dicionários de tema e de carta são compartilhados entre sessões e
+    devem ser tratados como somente leitura.
+    """
+
+    version: int
+    themes: Tuple[Dict, ...]
+    theme_index: Dict[str, Dict]
+    media: MediaIndex
+    roleta: RoletaBank
+    sorte: Tuple[Dict, ...]
+    stamps: Stamps
+
+    def theme_by_id(self, theme_id: str) -> Optional[Dict]:
+        """Retorna o JSON bruto do tema pelo id, ou None."""
+        return self.theme_index.get(theme_id)
+
+
+_LOCK = threading.Lock()
+_CURRENT: Optional[Snapshot] = None
+_WATCHER: Optional[threading.Thread] = None
+_STOP = threading.Event()
+
+
+def _scan() -> Stamps:
+    """Carimbos de todos os arquivos observados, em ordem estável."""
+    paths = [*load_theme_files(), THEME_PATH, CARDS_PATH]
+    return tuple((str(p), source_stamp(p)) for p in paths)
+
+
+@timed("snapshot_build", game="shared")
+def _build(version: int, stamps: Stamps,
+           previous: Optional[Snapshot] = None) -> Snapshot:
+    """Monta um snapshot novo a partir dos loaders (que têm cache próprio).
+
+    Se um tema que existia deixou de ser válido (ex.: arquivo salvo pela
+    metade), a última versão boa dele é mantida até a próxima troca.
+    """
+    themes = list(load_catalog())
+    if previous is not None:
+        have = {it["path"] for it in themes}
+        themes += [
+            it for it in previous.themes
+            if it["path"] not in have and it["path"].exists()
+        ]
+    themes = tuple(themes)
+    return Snapshot(
+        version=version,
+        themes=themes,
+        theme_index={it["id"]: it["raw"] for it in themes},
+        media=build_media_index(themes),
+        roleta=load_roleta_bank(),
+        sorte=load_sorte_cards(),
+        stamps=stamps,
+    )
+
+
+def current() -> Snapshot:
+    """Snapshot em vigor; o primeiro acesso carrega e liga o observador."""
+    snap = _CURRENT
+    if snap is not None:
+        return snap
+    with _LOCK:
+        if _CURRENT is None:
+            _publish(_build(1, _scan()))
+            _start_watcher()
+        return _CURRENT
+
+
+def _publish(snap: Snapshot) -> None:
+    """Troca o snapshot global (atribuição única, atômica)."""
+    global _CURRENT
+    _CURRENT = snap
+
+
+def refresh() -> bool:
+    """Recarrega se algum arquivo mudou; retorna True se houve troca."""
+    stamps = _scan()
+    with _LOCK:
+        old = _CURRENT
+        if old is not None and old.stamps == stamps:
+            return False
+        version = old.version + 1 if old else 1
+        _publish(_build(version, stamps, old))
+    return True
+
+
+def _watch(interval: float) -> None:
+    """Laço da thread observadora."""
+    while not _STOP.wait(interval):
+        try:
+            refresh()
+        except Exception:  # noqa: BLE001
+            # Um arquivo salvo pela metade não derruba o app: o snapshot
+            # anterior continua valendo e o próximo ciclo tenta de novo.
+            continue
+
+
+def _start_watcher() -> None:
+    """Inicia a thread observadora uma única vez por processo."""
+    global _WATCHER
+    if RELOAD_INTERVAL <= 0 or _WATCHER is not None:
+        return
+    _WATCHER = threading.Thread(
+        target=_watch,
+        args=(RELOAD_INTERVAL,),
+        name="snapshot-watcher",
+        daemon=True,
+    )
+    _WATCHER.start()
+
+
+def stop_watcher() -> None:
+    """Encerra a thread observadora (útil em testes e ferramentas)."""
+    _STOP.set()
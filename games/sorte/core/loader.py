@@ -1,12 +1,29 @@
-"""Carregamento das cartas do Jogo 3 — Sorte."""
+"""Carregamento das cartas do Jogo 3 — Sorte.
+
+O baralho fica em `themes/cards.json` (com os textos em
+`meanings.{past,present,future}` e arte em `image`); o caminho antigo
+`games/sorte/cards.json`, com os textos direto na carta, ainda é aceito.
+As cartas saem normalizadas com as chaves `id`, `name`, `image`, `past`,
+`present` e `future`.
+"""
 
 import json
+import threading
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
+
+from games.shared.bundle import bundle_section, source_stamp
+from games.shared.metrics import timed
 
 
 BASE_DIR = Path(__file__).resolve().parents[1]
-CARDS_PATH = BASE_DIR / "cards.json"
+ROOT_DIR = BASE_DIR.parents[1]
+CARDS_PATHS = (ROOT_DIR / "themes" / "cards.json", BASE_DIR / "cards.json")
+CARDS_PATH = next((p for p in CARDS_PATHS if p.exists()), CARDS_PATHS[0])
+STAGES = ("past", "present", "future")
+
+_LOCK = threading.Lock()
+_CACHE: Optional[Tuple[Optional[Tuple[int, int]], Tuple[Dict, ...]]] = None
 
 
 def _fallback_cards() -> List[Dict]:
@@ -75,15 +92,36 @@ def _fallback_cards() -> List[Dict]:
     ]
 
 
-def load_sorte_cards() -> List[Dict]:
-    """Carrega as cartas do JSON; cai em fallback se falhar."""
+def normalize_card(raw: Dict) -> Dict:
+    """Carta no formato único, aceitando textos soltos ou em `meanings`."""
+    meanings = raw.get("meanings")
+    if not isinstance(meanings, dict):
+        meanings = {}
+    card = {
+        "id": str(raw["id"]),
+        "name": str(raw["name"]),
+        "image": raw.get("image") or "",
+    }
+    for stage in STAGES:
+        card[stage] = str(
+            meanings.get(stage) or raw.get(stage) or raw.get("meaning") or ""
+        )
+    return card
+
+
+def _read_cards() -> List[Dict]:
+    """Carrega as cartas do bundle ou do JSON; cai em fallback se falhar."""
+    cached = bundle_section("sorte", CARDS_PATH)
+    if cached is not None:
+        return [normalize_card(c) for c in cached]
+
     if not CARDS_PATH.exists():
-        return _fallback_cards()
+        return [normalize_card(c) for c in _fallback_cards()]
 
     try:
         data = json.loads(CARDS_PATH.read_text(encoding="utf-8"))
     except Exception:
-        return _fallback_cards()
+        return [normalize_card(c) for c in _fallback_cards()]
 
     items = data.get("cards", [])
     cards: List[Dict] = []
@@ -92,8 +130,27 @@ def load_sorte_cards() -> List[Dict]:
             continue
         if "id" not in raw or "name" not in raw:
             continue
-        cards.append(raw)
+        cards.append(normalize_card(raw))
 
     if not cards:
-        return _fallback_cards()
+        return [normalize_card(c) for c in _fallback_cards()]
     return cards
+
+
+@timed(game="sorte")
+def load_sorte_cards() -> Tuple[Dict, ...]:
+    """Baralho imutável, compartilhado entre sessões (relido só se mudar).
+
+    Enquanto o carimbo do arquivo não muda, volta a mesma tupla, então as
+    sessões reconhecem o baralho por identidade. As cartas são somente
+    leitura.
+    """
+    global _CACHE
+    stamp = source_stamp(CARDS_PATH)
+    hit = _CACHE
+    if hit is not None and hit[0] == stamp:
+        return hit[1]
+    with _LOCK:
+        if _CACHE is None or _CACHE[0] != stamp:
+            _CACHE = (stamp, tuple(_read_cards()))
+        return _CACHE[1]
@@ -0,0 +1,234 @@
+"""Folha de sprites das cartas do Jogo 3 — Sorte.
+
+Todas as cartas vão numa única imagem, já no tamanho de exibição: o verso
+compartilhado na célula 0 e as frentes em seguida, na ordem do baralho.
+O passo de build grava a folha e um manifesto em `build/`; o app carrega
+a folha uma vez (ou a desenha em memória, se não houver build atual) e
+corta cada carta a partir dela, guardando os bytes já codificados.
+
+Carta sem arte (ou com arquivo ausente) ganha uma frente desenhada com o
+nome, para a folha sempre ficar completa.
+
+Uso:
+    python -m games.sorte.core.sprites build [--out DIR]
+"""
+
+import argparse
+import hashlib
+import io
+import json
+import sys
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from PIL import Image, ImageDraw, ImageFont, ImageOps
+
+from games.shared.bundle import source_digest
+from games.sorte.core.loader import CARDS_PATH, ROOT_DIR, load_sorte_cards
+
+CARD_SIZE = (180, 288)
+JPEG_QUALITY = 85
+BUILD_DIR = ROOT_DIR / "build"
+SHEET_NAME = "sorte_cards.png"
+MANIFEST_NAME = "sorte_cards.json"
+
+_BACK_COLOR = (44, 38, 84)
+_GOLD = (224, 190, 110)
+
+_LOCK = threading.Lock()
+_SHEET: Optional[Tuple[Sequence[Dict], "CardSheet"]] = None
+
+
+def _font(px: float) -> ImageFont.ImageFont:
+    """DejaVu Sans (cobre acentos), ou a fonte padrão do Pillow."""
+    try:
+        return ImageFont.truetype("DejaVuSans.ttf", int(px))
+    except OSError:
+        pass
+    try:
+        return ImageFont.load_default(size=px)
+    except TypeError:
+        return ImageFont.load_default()
+
+
+def _draw_back() -> Image.Image:
+    """Verso comum a todas as cartas."""
+    w, h = CARD_SIZE
+    img = Image.new("RGB", CARD_SIZE, _BACK_COLOR)
+    draw = ImageDraw.Draw(img)
+    draw.rounded_rectangle([6, 6, w - 7, h - 7], radius=12,
+                           outline=_GOLD, width=3)
+    cx, cy = w / 2, h / 2
+    for r in (70, 50, 30):
+        draw.polygon([(cx, cy - r), (cx + r * 0.62, cy), (cx, cy + r),
+                      (cx - r * 0.62, cy)], outline=_GOLD, width=2)
+    return img
+
+
+def _card_hue(card_id: str) -> Tuple[int, int, int]:
+    """Cor estável (e escura o bastante para texto branco) por id."""
+    d = hashlib.blake2b(card_id.encode("utf-8"), digest_size=3).digest()
+    return tuple(60 + b // 3 for b in d)
+
+
+def _wrap(text: str, font: ImageFont.ImageFont, width: int) -> List[str]:
+    """Quebra o texto em linhas que caibam na largura."""
+    lines: List[str] = []
+    for word in text.split():
+        trial = f"{lines[-1]} {word}" if lines else word
+        if lines and font.getlength(trial) <= width:
+            lines[-1] = trial
+        else:
+            lines.append(word)
+    return lines
+
+
+def _draw_face(card: Dict) -> Image.Image:
+    """Frente da carta: a arte recortada no tamanho, ou o nome desenhado."""
+    w, h = CARD_SIZE
+    path = ROOT_DIR / card["image"] if card.get("image") else None
+    img = None
+    if path is not None and path.exists():
+        try:
+            with Image.open(path) as src:
+                img = ImageOps.fit(src.convert("RGB"), CARD_SIZE,
+                                   Image.LANCZOS)
+        except OSError:
+            img = None
+
+    if img is None:
+        img = Image.new("RGB", CARD_SIZE, _card_hue(card["id"]))
+        draw = ImageDraw.Draw(img)
+        font = _font(22)
+        lines = _wrap(card["name"], font, w - 24)
+        y = h / 2 - len(lines) * 14
+        for line in lines:
+            draw.text((w / 2, y), line, font=font, fill="white", anchor="mt")
+            y += 28
+
+    ImageDraw.Draw(img).rounded_rectangle(
+        [2, 2, w - 3, h - 3], radius=12, outline=_GOLD, width=3
+    )
+    return img
+
+
+def render_sheet(deck: Sequence[Dict]) -> Image.Image:
+    """Folha com o verso (célula 0) e as frentes, lado a lado."""
+    w, h = CARD_SIZE
+    sheet = Image.new("RGB", (w * (len(deck) + 1), h))
+    sheet.paste(_draw_back(), (0, 0))
+    for i, card in enumerate(deck, start=1):
+        sheet.paste(_draw_face(card), (i * w, 0))
+    return sheet
+
+
+class CardSheet:
+    """Folha decodificada e os recortes já codificados em JPEG."""
+
+    def __init__(self, image: Image.Image, ids: Sequence[str]) -> None:
+        self.image = image
+        self.cell = {cid: i + 1 for i, cid in enumerate(ids)}
+        self._encoded: Dict[int, bytes] = {}
+
+    def _crop(self, cell: int) -> bytes:
+        """Bytes JPEG da célula (codificados uma única vez)."""
+        hit = self._encoded.get(cell)
+        if hit is None:
+            w, h = CARD_SIZE
+            buf = io.BytesIO()
+            self.image.crop((cell * w, 0, (cell + 1) * w, h)).save(
+                buf, format="JPEG", quality=JPEG_QUALITY
+            )
+            hit = self._encoded[cell] = buf.getvalue()
+        return hit
+
+    def back(self) -> bytes:
+        """Verso das cartas."""
+        return self._crop(0)
+
+    def face(self, card_id: str) -> bytes:
+        """Frente da carta pelo id."""
+        return self._crop(self.cell[card_id])
+
+
+def _art_digest(card: Dict) -> str:
+    """sha256 do arquivo de arte da carta ("" se não houver arquivo)."""
+    path = ROOT_DIR / card["image"] if card.get("image") else None
+    if path is None or not path.is_file():
+        return ""
+    return source_digest(path)
+
+
+def _deck_key(deck: Sequence[Dict]) -> str:
+    """Hash do que aparece na folha (ids, nomes e conteúdo da arte).
+
+    Trocar a imagem de uma carta mantendo o nome do arquivo também muda
+    a chave, então a folha do build deixa de valer.
+    """
+    h = hashlib.blake2b(digest_size=12)
+    for c in deck:
+        h.update(f"{c['id']}\x1f{c['name']}\x1f{c.get('image', '')}\x1f"
+                 f"{_art_digest(c)}\x1e".encode("utf-8"))
+    return h.hexdigest()
+
+
+def _load_built(deck: Sequence[Dict]) -> Optional[Image.Image]:
+    """Folha gravada pelo build, se corresponder ao baralho atual."""
+    try:
+        manifest = json.loads((BUILD_DIR / MANIFEST_NAME).read_text("utf-8"))
+        if (manifest.get("deck") != _deck_key(deck)
+                or tuple(manifest.get("card_size", ())) != CARD_SIZE):
+            return None
+        with Image.open(BUILD_DIR / SHEET_NAME) as img:
+            return img.convert("RGB")
+    except (OSError, ValueError):
+        return None
+
+
+def card_sheet(deck: Sequence[Dict]) -> CardSheet:
+    """Folha do baralho, compartilhada entre sessões enquanto ele não mudar."""
+    global _SHEET
+    hit = _SHEET
+    if hit is not None and hit[0] is deck:
+        return hit[1]
+    with _LOCK:
+        if _SHEET is None or _SHEET[0] is not deck:
+            image = _load_built(deck) or render_sheet(deck)
+            _SHEET = (deck, CardSheet(image, [c["id"] for c in deck]))
+        return _SHEET[1]
+
+
+def build(out: Path) -> Path:
+    """Grava a folha e o manifesto do baralho atual em `out`."""
+    deck = load_sorte_cards()
+    out.mkdir(parents=True, exist_ok=True)
+    render_sheet(deck).save(out / SHEET_NAME, optimize=True)
+    manifest = {
+        "deck": _deck_key(deck),
+        "source": str(CARDS_PATH),
+        "sha256": source_digest(CARDS_PATH),
+        "card_size": list(CARD_SIZE),
+        "cells": {c["id"]: i for i, c in enumerate(deck, start=1)},
+        "back": 0,
+    }
+    (out / MANIFEST_NAME).write_text(json.dumps(manifest, indent=2),
+                                     encoding="utf-8")
+    return out / SHEET_NAME
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Ponto de entrada da linha de comando."""
+    ap = argparse.ArgumentParser(description="Folha de sprites das cartas.")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    b = sub.add_parser("build", help="gera a folha e o manifesto")
+    b.add_argument("--out", type=Path, default=BUILD_DIR)
+    args = ap.parse_args(argv)
+
+    path = build(args.out)
+    print(f"folha gerada em {path} ({path.stat().st_size:,} bytes).")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,54 +1,73 @@
-"""Gerência de estado do Jogo 3 — Sorte."""
+"""Gerência de estado do Jogo 3 — Sorte.
+
+O baralho é a tupla compartilhada do snapshot e nunca é copiado. A sessão
+guarda só um `IndexPool` com os índices das cartas restantes, uma semente
+e a mão oferecida no estágio atual — sorteada uma vez com essa semente,
+então não muda a cada rerun.
+"""
+
+import random
+from typing import Dict, Sequence, Tuple
 
-from typing import Dict, List
 import streamlit as st
 
+from games.shared.metrics import timed
+from games.shared.pool import IndexPool
 
-def init_sorte_state(deck: List[Dict]) -> None:
-    """Inicializa o estado da leitura de cartas, se ainda não existir."""
-    if "sorte_deck_all" not in st.session_state:
-        st.session_state.sorte_deck_all = list(deck)
-        st.session_state.sorte_deck_left = list(deck)
-        st.session_state.sorte_picks = []
-        st.session_state.sorte_stage = "past"
+HAND_SIZE = 5
 
+STAGE_LABELS = {
+    "past": "Passado",
+    "present": "Presente",
+    "future": "Futuro",
+}
+NEXT_STAGE = {"past": "present", "present": "future", "future": "done"}
 
-def reset_sorte() -> None:
-    """Reinicia a leitura, restaurando o baralho e limpando escolhas."""
-    st.session_state.sorte_deck_left = list(
-        st.session_state.sorte_deck_all
-    )
+
+def _fresh_state(deck: Sequence[Dict]) -> None:
+    """Baralho completo, sem escolhas, com uma semente nova."""
+    st.session_state.sorte_left = IndexPool(len(deck))
+    st.session_state.sorte_seed = random.getrandbits(32)
+    st.session_state.sorte_hand = None
     st.session_state.sorte_picks = []
     st.session_state.sorte_stage = "past"
 
 
-def pick_card(card: Dict) -> None:
+@timed(game="sorte")
+def init_sorte_state(deck: Sequence[Dict]) -> None:
+    """Inicializa o estado da leitura (ou reinicia se o baralho mudou).
+
+    Um snapshot novo pode trazer outra tupla com as mesmas cartas: a
+    sessão passa a usá-la e mantém a leitura. Só um baralho com conteúdo
+    diferente (os índices deixam de valer) reinicia.
+    """
+    old = st.session_state.get("sorte_deck")
+    if old is deck:
+        return
+    st.session_state.sorte_deck = deck
+    if old is None or tuple(old) != tuple(deck):
+        _fresh_state(deck)
+
+
+def reset_sorte() -> None:
+    """Reinicia a leitura, restaurando o baralho e limpando escolhas."""
+    _fresh_state(st.session_state.sorte_deck)
+
+
+def current_hand() -> Tuple[int, ...]:
+    """Índices das cartas oferecidas no estágio atual (estável). Custo O(k)."""
+    stage = st.session_state.sorte_stage
+    hand = st.session_state.sorte_hand
+    if hand is None or hand[0] != stage:
+        rng = random.Random(f"{st.session_state.sorte_seed}:{stage}")
+        cards = tuple(st.session_state.sorte_left.sample(HAND_SIZE, rng))
+        hand = st.session_state.sorte_hand = (stage, cards)
+    return hand[1]
+
+
+def pick_card(idx: int) -> None:
     """Registra a carta escolhida para o estágio atual e avança estágio."""
     stage = st.session_state.sorte_stage
-    label_map = {
-        "past": "Passado",
-        "present": "Presente",
-        "future": "Futuro",
-    }
-    label = label_map.get(stage, stage)
-
-    st.session_state.sorte_picks.append(
-        {
-            "stage": stage,
-            "label": label,
-            "card": card,
-        }
-    )
-
-    cid = card.get("id")
-    st.session_state.sorte_deck_left = [
-        c for c in st.session_state.sorte_deck_left
-        if c.get("id") != cid
-    ]
-
-    if stage == "past":
-        st.session_state.sorte_stage = "present"
-    elif stage == "present":
-        st.session_state.sorte_stage = "future"
-    else:
-        st.session_state.sorte_stage = "done"
+    st.session_state.sorte_picks.append((stage, idx))
+    st.session_state.sorte_left.remove(idx)
+    st.session_state.sorte_stage = NEXT_STAGE.get(stage, "done")
@@ -1,12 +1,18 @@
 """Página principal do Jogo 3 — Sorte (3 cartas: passado, presente, futuro)."""
 
-import random
-from typing import Dict, List
-
 import streamlit as st
 
-from games.sorte.core.loader import load_sorte_cards
-from games.sorte.core.state import init_sorte_state, pick_card, reset_sorte
+from games.shared.media import media_url
+from games.shared.metrics import timed
+from games.shared.snapshot import current
+from games.sorte.core.state import (
+    STAGE_LABELS,
+    current_hand,
+    init_sorte_state,
+    pick_card,
+    reset_sorte,
+)
+from games.sorte.core.sprites import card_sheet
 
 
 def _stage_label(stage: str) -> str:
@@ -24,17 +30,21 @@ def _render_finished() -> None:
     """Mostra a leitura final das três cartas."""
     st.subheader("Leitura completa")
 
-    picks = st.session_state.sorte_picks
-    for item in picks:
-        label = item["label"]
-        card = item["card"]
-        stage = item["stage"]
+    deck = st.session_state.sorte_deck
+    sheet = card_sheet(deck)
+    for stage, idx in st.session_state.sorte_picks:
+        label = STAGE_LABELS.get(stage, stage)
+        card = deck[idx]
 
-        st.markdown(f"### {label}: {card.get('name', 'Carta')}")
+        c_img, c_text = st.columns([1, 3])
+        with c_img:
+            st.image(sheet.face(card["id"]), width="stretch")
+        with c_text:
+            st.markdown(f"### {label}: {card.get('name', 'Carta')}")
 
-        text = card.get(stage) or card.get("meaning", "")
-        if text:
-            st.write(text)
+            text = card.get(stage) or card.get("meaning", "")
+            if text:
+                st.write(text)
 
         st.divider()
 
@@ -56,35 +66,40 @@ def _render_choice_stage() -> None:
 
     st.subheader(f"Escolha uma carta para o {label}")
 
-    left: List[Dict] = st.session_state.sorte_deck_left
-    if not left:
+    if not st.session_state.sorte_left:
         st.warning("Acabaram as cartas disponíveis.")
         st.session_state.sorte_stage = "done"
         return
 
-    if len(left) <= 5:
-        sample = left
-    else:
-        sample = random.sample(left, 5)
+    deck = st.session_state.sorte_deck
+    hand = current_hand()
+    # o verso é o mesmo em todas: enviado uma vez, repetido pela URL
+    back = card_sheet(deck).back()
+    back_url = media_url(back, "image/jpeg", "sorte.back")
 
     st.caption("Clique em uma das cartas abaixo:")
 
-    cols = st.columns(len(sample))
-    for col, card in zip(cols, sample):
+    cols = st.columns(len(hand))
+    for col, idx in zip(cols, hand):
         with col:
+            if back_url:
+                st.markdown(f'<img src="{back_url}" alt="" '
+                            f'style="width:100%;">', unsafe_allow_html=True)
+            else:
+                st.image(back, width="stretch")
             if st.button(
                 "🂠",
-                key=f"sorte_card_{stage}_{card['id']}",
+                key=f"sorte_card_{stage}_{deck[idx]['id']}",
                 help="Escolher esta carta",
             ):
-                pick_card(card)
+                pick_card(idx)
                 st.rerun()
 
 
+@timed(game="sorte")
 def page_sorte() -> None:
     """Renderiza o Jogo 3 — Sorte (3 cartas: passado, presente, futuro)."""
-    deck = load_sorte_cards()
-    init_sorte_state(deck)
+    init_sorte_state(current().sorte)
 
     st.title("🍀 Jogo 3 — Sorte")
     st.caption(
@@ -0,0 +1,139 @@
+"""Verifica que o motor matplotlib da roleta tem memória limitada.
+
+Simula giros renderizando com a `WheelFigure` de uma sessão, sem passar
+pelo cache de quadros, e mede o crescimento com tracemalloc (heap
+Python) e o RSS do processo. O padrão é 200 giros de 3 quadros de
+120 px (a página usa 41 por giro, em 550 px): sob o tracemalloc cada
+quadro custa uns 130 ms, e são os giros, não os quadros, que reabrem o
+caminho de um vazamento. Leva cerca de um minuto e meio.
+O primeiro quinto dos giros serve de aquecimento (caches de fontes e de
+layout do matplotlib); do fim dele até o último giro o heap e o RSS têm
+de ficar estáveis, abaixo dos limites. Sai com código 1 se não ficarem.
+
+`--legacy` roda o caminho antigo (figura pyplot nova por quadro, nunca
+fechada) para comparação — esse cresce sem parar.
+
+Uso:
+    python tools/check_mpl_memory.py [--spins 200] [--frames 3]
+        [--size 120] [--max-growth-kb 256] [--max-rss-growth-kb 1024]
+        [--legacy]
+"""
+
+import argparse
+import io
+import random
+import resource
+import sys
+import tracemalloc
+from pathlib import Path
+from typing import List
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt  # noqa: E402
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT_DIR))
+
+from games.roleta.core.frame_cache import quantize_angle  # noqa: E402
+from games.roleta.core.wheel_mpl import WheelFigure, draw_wheel  # noqa: E402
+
+WARMUP_SPINS = 3
+
+
+def _rss_kb() -> int:
+    """RSS atual do processo em KiB (Linux); sem /proc, o pico."""
+    try:
+        pages = int(Path("/proc/self/statm").read_text().split()[1])
+    except (OSError, IndexError, ValueError):
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return pages * resource.getpagesize() // 1024
+
+
+def _spin_angles(rng: random.Random, start: float, frames: int) -> List[float]:
+    """Ângulos de um giro com a mesma curva de easing da página."""
+    final = start + rng.randint(3, 6) * 360 + rng.uniform(0, 360)
+    out = []
+    for i in range(frames - 1):
+        t = (i + 1) / (frames - 1)
+        out.append(start + (final - start) * (1 - (1 - t) ** 3))
+    out.append(final)
+    return out
+
+
+def main(argv: List[str] | None = None) -> int:
+    """Ponto de entrada da linha de comando."""
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--spins", type=int, default=200)
+    ap.add_argument("--frames", type=int, default=3,
+                    help="quadros por giro (a página usa 41: 40 + destaque)")
+    ap.add_argument("--size", type=int, default=120,
+                    help="lado do quadro em pixels")
+    ap.add_argument("--labels", type=int, default=12)
+    ap.add_argument("--max-growth-kb", type=int, default=256,
+                    help="crescimento máximo do heap após o aquecimento")
+    ap.add_argument("--max-rss-growth-kb", type=int, default=1024,
+                    help="crescimento máximo do RSS após o aquecimento")
+    ap.add_argument("--legacy", action="store_true",
+                    help="usa draw_wheel sem plt.close (caminho antigo)")
+    args = ap.parse_args(argv)
+
+    rng = random.Random(0)
+    labels = [f"Pergunta {i}" for i in range(args.labels)]
+    fig = None if args.legacy else WheelFigure(labels)
+    angle = 0.0
+
+    def spin() -> None:
+        nonlocal angle
+        angles = _spin_angles(rng, angle, args.frames)
+        for k, a in enumerate(angles):
+            q = quantize_angle(a)
+            highlight = 0 if k == len(angles) - 1 else None
+            if fig is None:
+                f = draw_wheel(labels, q, highlight)
+                f.savefig(io.BytesIO(), format="png", dpi=args.size / 5.5)
+            else:
+                fig.render_png(q, highlight, args.size)
+        angle = quantize_angle(angles[-1])
+
+    for _ in range(WARMUP_SPINS):
+        spin()
+
+    tracemalloc.start()
+    base_heap, _ = tracemalloc.get_traced_memory()
+    base_rss = _rss_kb()
+    step = max(args.spins // 5, 1)
+    warm_heap = warm_rss = None
+    for n in range(1, args.spins + 1):
+        spin()
+        if n % step == 0 or n == args.spins:
+            heap, _ = tracemalloc.get_traced_memory()
+            rss = _rss_kb()
+            if warm_heap is None:
+                warm_heap, warm_rss = heap, rss
+            print(f"giro {n:4}: heap +{(heap - base_heap) / 1024:8.1f} KiB, "
+                  f"RSS +{rss - base_rss:7} KiB, "
+                  f"figuras pyplot {len(plt.get_fignums())}")
+
+    heap, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    growth = (heap - warm_heap) / 1024
+    rss_growth = _rss_kb() - warm_rss
+    if fig is not None:
+        fig.close()
+
+    ok_heap = growth <= args.max_growth_kb
+    ok_rss = rss_growth <= args.max_rss_growth_kb
+    print(f"{'ok' if ok_heap else 'FALHA'}: heap cresceu {growth:.1f} KiB "
+          f"em {args.spins - step} giros após o aquecimento "
+          f"(limite {args.max_growth_kb} KiB)")
+    print(f"{'ok' if ok_rss else 'FALHA'}: RSS cresceu {rss_growth} KiB "
+          f"em {args.spins - step} giros após o aquecimento "
+          f"(limite {args.max_rss_growth_kb} KiB)")
+    return 0 if ok_heap and ok_rss else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
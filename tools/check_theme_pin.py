@@ -0,0 +1,166 @@
+"""Confere que uma partida em curso mantém a versão do tema em que começou.
+
+Copia os dados para uma pasta temporária, inicia uma partida e, no meio
+dela, regrava o arquivo do tema e recarrega o snapshot mais vezes do que
+o cache de versões compiladas comporta (`--republishes`, padrão
+`_MAX_COMPILED + 8`). Cada regravação muda o título e o texto das
+perguntas. Depois confere que:
+
+- a versão original saiu do cache compartilhado (o teste exercita mesmo
+  o caminho de descarte);
+- a sessão ainda enxerga o mesmo tema compilado e as mesmas perguntas;
+- a partida termina no resultado e com o desfecho da versão original;
+- uma referência serializada volta só com (id, versão): resolve a
+  versão atual e devolve None para a que não existe mais.
+
+Sai com código 1 se alguma conferência falhar.
+
+Uso:
+    python tools/check_theme_pin.py [--theme musica_persona_v1] [--republishes N]
+"""
+
+import argparse
+import json
+import logging
+import os
+import pickle
+import random
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+from typing import List, Optional
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT_DIR))
+os.environ["APP_RELOAD_INTERVAL"] = "0"  # recargas só pelo refresh() abaixo
+
+
+def _copy_data(dest: Path) -> None:
+    """Copia temas e o banco da roleta (caminhos relativos ao cwd)."""
+    shutil.copytree(ROOT_DIR / "themes", dest / "themes")
+    roleta = Path("games/roleta/roleta.json")
+    (dest / roleta).parent.mkdir(parents=True)
+    shutil.copy(ROOT_DIR / roleta, dest / roleta)
+
+
+def _quiet_streamlit() -> None:
+    """Silencia os avisos do streamlit fora do `streamlit run`."""
+    import streamlit  # noqa: F401  (os loggers só existem após o import)
+
+    for name in logging.root.manager.loggerDict:
+        if name.startswith("streamlit"):
+            logging.getLogger(name).setLevel(logging.ERROR)
+
+
+def run(theme_id: str, republishes: Optional[int], seed: int) -> List[str]:
+    """Executa as conferências; retorna as falhas."""
+    _quiet_streamlit()
+    import streamlit as st
+
+    from games.quiz.core import compiled, state
+    from games.quiz.core.outcome import compute_outcome
+    from games.quiz.core.theme_io import THEMES_DIR
+    from games.shared.snapshot import current, refresh
+
+    failures: List[str] = []
+
+    def check(ok: bool, msg: str) -> None:
+        print(("ok   " if ok else "FALHA") + f" {msg}")
+        if not ok:
+            failures.append(msg)
+
+    raw = current().theme_by_id(theme_id)
+    if raw is None:
+        return [f"tema '{theme_id}' não encontrado"]
+    path = next(it["path"] for it in current().themes if it["id"] == theme_id)
+    original = compiled.compile_theme(raw)
+    texts = [q["text"] for q in raw["questions"]]
+    rng = random.Random(seed)
+    picks = [rng.randrange(len(q.options)) for q in original.questions]
+
+    state.init_state()
+    state.start_quiz(raw)
+    half = len(picks) // 2
+    for q, pick in zip(original.questions[:half], picks[:half]):
+        state.record_answer(q.id, q.options[pick].id)
+        state.next_step()
+
+    n = republishes or compiled._MAX_COMPILED + 8
+    data = json.loads((THEMES_DIR / path.name).read_text(encoding="utf-8"))
+    for i in range(n):
+        data["title"] = f"{raw['title']} (edição {i + 1})"
+        for q in data["questions"]:
+            q["text"] = f"[{i + 1}] {q['text'].split('] ', 1)[-1]}"
+        (THEMES_DIR / path.name).write_text(
+            json.dumps(data, ensure_ascii=False), encoding="utf-8"
+        )
+        refresh()
+        compiled.compile_theme(current().theme_by_id(theme_id))
+
+    latest = compiled.compile_theme(current().theme_by_id(theme_id))
+    check(latest.version != original.version,
+          f"{n} republicações trocaram a versão do snapshot")
+    check(compiled.find_compiled(original.id, original.version) is None,
+          "a versão original saiu do cache de versões")
+    check(state.session_theme() is original,
+          "a sessão continua com o tema compilado original")
+    check(state.current_question()["text"] == texts[half],
+          "a pergunta atual é a da versão original")
+
+    for q, pick in zip(original.questions[half:], picks[half:]):
+        state.record_answer(q.id, q.options[pick].id)
+        state.next_step()
+    check(st.session_state.page == "result", "a partida chegou ao resultado")
+
+    got = compute_outcome(state.session_theme(), st.session_state.picks,
+                          state.score_map(), st.session_state.signals)
+    want = compute_outcome(original, bytearray(picks), _scores(original, picks))
+    check(got == want, f"desfecho igual ao da versão original ({got.key})")
+
+    old_ref = pickle.loads(pickle.dumps(st.session_state.theme_ref))
+    check(old_ref.theme is None,
+          "referência serializada da versão descartada volta sem tema")
+    new_ref = pickle.loads(pickle.dumps(
+        state.ThemeRef(latest.id, latest.version, latest)
+    ))
+    check(new_ref.theme is latest,
+          "referência serializada da versão atual resolve o tema")
+    return failures
+
+
+def _scores(ct, picks: List[int]):
+    """Placar calculado do zero, sem o estado da sessão."""
+    scores = {rk: 0 for rk in ct.result_keys}
+    for q, pick in zip(ct.questions, picks):
+        for rk, v in q.options[pick].weights.items():
+            if rk in scores:
+                scores[rk] += v
+    return scores
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Ponto de entrada da linha de comando."""
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--theme", default="musica_persona_v1")
+    ap.add_argument("--republishes", type=int, default=None,
+                    help="padrão: tamanho do cache de versões + 8")
+    ap.add_argument("--seed", type=int, default=0)
+    args = ap.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        _copy_data(Path(tmp))
+        os.chdir(tmp)
+        try:
+            failures = run(args.theme, args.republishes, args.seed)
+        finally:
+            os.chdir(ROOT_DIR)
+    if failures:
+        print(f"{len(failures)} conferência(s) falharam")
+        return 1
+    print("versão fixada durante toda a partida")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,97 @@
+"""Mede o tempo de importação do hub com `-X importtime` e aplica um limite.
+
+Roda `import app` em um interpretador novo (várias vezes, usando a
+mediana), pega o tempo cumulativo desse import e falha quando ele passa
+do orçamento ou quando algum módulo proibido (por padrão matplotlib,
+numpy e PIL) entra no startup do hub. Lista também os imports diretos
+mais caros.
+
+Uso:
+    python tools/import_budget.py [--budget-ms 1500] [--repeat 5]
+        [--forbid MOD ...] [--top 15]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+DEFAULT_BUDGET_MS = float(os.environ.get("IMPORT_BUDGET_MS", "1500"))
+DEFAULT_FORBIDDEN = ("matplotlib", "numpy", "PIL")
+
+
+def _measure(module: str) -> Tuple[float, Dict[str, float], List[str]]:
+    """Importa `module` num processo novo; retorna (ms, filhos, nomes).
+
+    O tempo considerado é o cumulativo do próprio `module`, sem o custo
+    fixo de subir o interpretador (site, encodings...).
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    roots: Dict[str, float] = {}
+    top: Dict[str, float] = {}
+    names: List[str] = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        # "import time:  self [us] | cumulative | imported package"
+        raw = line.split("|")
+        cum = int(raw[1].strip())
+        name = raw[2].rstrip()
+        names.append(name.strip())
+        # Nível de aninhamento: 1 espaço no topo, +2 por nível
+        indent = len(name) - len(name.lstrip())
+        if indent == 1:
+            roots[name.strip()] = cum / 1000
+        elif indent == 3:
+            top[name.strip()] = cum / 1000
+    return roots.get(module, sum(roots.values())), top, names
+
+
+def main(argv: List[str] | None = None) -> int:
+    """Ponto de entrada da linha de comando."""
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--module", default="app")
+    ap.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS)
+    ap.add_argument("--repeat", type=int, default=5)
+    ap.add_argument("--forbid", action="append", default=None,
+                    help="módulo que não pode ser importado no startup")
+    ap.add_argument("--top", type=int, default=15)
+    args = ap.parse_args(argv)
+    forbidden = args.forbid if args.forbid is not None else DEFAULT_FORBIDDEN
+
+    runs = [_measure(args.module) for _ in range(max(args.repeat, 1))]
+    totals = [r[0] for r in runs]
+    total = statistics.median(totals)
+    _, top, names = runs[totals.index(sorted(totals)[len(totals) // 2])]
+
+    print(f"import {args.module}: mediana {total:.1f} ms "
+          f"(min {min(totals):.1f}, max {max(totals):.1f}, "
+          f"{len(totals)} execuções) — orçamento {args.budget_ms:.0f} ms")
+    for name, ms in sorted(top.items(), key=lambda kv: -kv[1])[:args.top]:
+        print(f"  {ms:9.1f} ms  {name}")
+
+    failed = False
+    loaded = {n.split(".")[0] for n in names}
+    for mod in forbidden:
+        if mod in loaded:
+            print(f"FALHA: '{mod}' é importado no startup do hub")
+            failed = True
+    if total > args.budget_ms:
+        print(f"FALHA: {total:.1f} ms acima do orçamento de "
+              f"{args.budget_ms:.0f} ms")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
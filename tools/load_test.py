@@ -0,0 +1,262 @@
+"""Carga de várias sessões simuladas sobre o app, sem servidor.
+
+Cada sessão é um `AppTest` de `app.py` que percorre o caminho de um
+jogador: hub → quiz (tela inicial, todas as perguntas com respostas
+aleatórias, resultado) → roleta (giro e "marcar como usada") → sorte
+(leitura completa de três cartas) → hub. Com `--rounds`, repete o
+caminho.
+
+As N sessões ficam vivas no mesmo processo, como numa réplica, e os
+reruns são intercalados (uma etapa de cada sessão por vez). O AppTest
+troca um runtime global a cada rerun, então duas sessões nunca rodam ao
+mesmo tempo: a medida corresponde a uma réplica cujo trabalho de CPU é
+serializado pelo GIL, sem sobrepor esperas (os `time.sleep` da animação
+da roleta entram inteiros na latência do giro).
+
+Para cada quantidade de sessões, um processo novo mede:
+
+- latência por rerun (p50/p90/p99/máx), no total e por tipo de etapa;
+- vazão: reruns e caminhos completos por segundo;
+- pico de RSS do processo e o acréscimo por sessão sobre o app já
+  carregado.
+
+Uso:
+    python tools/load_test.py [--sessions 1,5,10,25] [--rounds 1] [--seed 0]
+                              [--json curvas.json]
+"""
+
+import argparse
+import json
+import logging
+import random
+import resource
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT_DIR))
+
+APP = ROOT_DIR / "app.py"
+TIMEOUT_S = 120
+PERCENTILES = (50, 90, 99)
+
+# (tipo da etapa, segundos)
+Sample = Tuple[str, float]
+
+
+def _peak_rss_mb() -> float:
+    """Pico de memória residente do processo (Linux: ru_maxrss em KiB)."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 1024 if sys.platform != "darwin" else peak / 2**20
+
+
+def _quiet_streamlit() -> None:
+    """Silencia os avisos do streamlit fora do `streamlit run`."""
+    import streamlit  # noqa: F401  (os loggers só existem após o import)
+
+    for name in logging.root.manager.loggerDict:
+        if name.startswith("streamlit"):
+            logging.getLogger(name).setLevel(logging.ERROR)
+
+
+def _button(at, label: str):
+    """Primeiro botão cujo rótulo contém `label`."""
+    for b in at.button:
+        if label in b.label:
+            return b
+    raise LookupError(f"botão '{label}' não encontrado")
+
+
+def _check(at, step: str) -> None:
+    """Falha a sessão se o rerun terminou com exceção."""
+    if at.exception:
+        raise RuntimeError(f"{step}: {at.exception[0].value}")
+
+
+def _journey(at, rng: random.Random, rounds: int) -> Iterator[str]:
+    """Executa o caminho de um jogador, um rerun por `next()`.
+
+    Cada valor produzido é o tipo da etapa que acabou de rodar.
+    """
+    at.run()
+    _check(at, "hub")
+    yield "hub"
+    for _ in range(rounds):
+        # --- quiz ---------------------------------------------------
+        at.button(key="go_quiz").click().run()
+        _check(at, "quiz_home")
+        yield "quiz_home"
+        playable = [b for b in at.button
+                    if b.key and b.key.startswith("play_") and not b.disabled]
+        rng.choice(playable).click().run()
+        _check(at, "quiz_start")
+        yield "quiz_question"
+        while at.session_state["page"] == "quiz":
+            radio = at.radio[0]
+            radio.set_value(rng.choice(radio.options))
+            at.get("form_submit_button")[0].click().run()
+            _check(at, "quiz_question")
+            yield "quiz_question" if at.session_state["page"] == "quiz" \
+                else "quiz_result"
+        at.button(key="quiz_back").click().run()
+        _check(at, "hub")
+        yield "hub"
+
+        # --- roleta -------------------------------------------------
+        at.button(key="go_roleta_main").click().run()
+        _check(at, "roleta_home")
+        yield "roleta_home"
+        _button(at, "Girar").click().run()
+        _check(at, "roleta_spin")
+        yield "roleta_spin"
+        _button(at, "usada").click().run()
+        _check(at, "roleta_mark")
+        yield "roleta_mark"
+        at.button(key="roleta_back").click().run()
+        _check(at, "hub")
+        yield "hub"
+
+        # --- sorte --------------------------------------------------
+        at.button(key="go_sorte_main").click().run()
+        _check(at, "sorte_home")
+        yield "sorte_home"
+        for _ in range(3):
+            cards = [b for b in at.button
+                     if b.key and b.key.startswith("sorte_card_")]
+            rng.choice(cards).click().run()
+            _check(at, "sorte_pick")
+            yield "sorte_pick"
+        at.button(key="sorte_back").click().run()
+        _check(at, "hub")
+        yield "hub"
+
+
+def _percentiles(values: Sequence[float]) -> Dict[str, float]:
+    """p50/p90/p99/máx em milissegundos."""
+    if len(values) < 2:
+        v = values[0] * 1e3 if values else 0.0
+        return {**{f"p{p}": v for p in PERCENTILES}, "max": v}
+    cuts = statistics.quantiles(values, n=100, method="inclusive")
+    out = {f"p{p}": cuts[p - 1] * 1e3 for p in PERCENTILES}
+    out["max"] = max(values) * 1e3
+    return out
+
+
+def run_sessions(n: int, rounds: int, seed: int) -> Dict:
+    """Intercala `n` sessões até todas terminarem e resume as medidas."""
+    _quiet_streamlit()
+    from streamlit.testing.v1 import AppTest
+
+    # aquece o app (imports, snapshot, catálogo) fora da medida
+    warm = AppTest.from_file(str(APP), default_timeout=TIMEOUT_S)
+    for _ in _journey(warm, random.Random(seed), 1):
+        pass
+    del warm
+    base_rss = _peak_rss_mb()
+
+    live = [
+        _journey(AppTest.from_file(str(APP), default_timeout=TIMEOUT_S),
+                 random.Random(f"{seed}:{i}"), rounds)
+        for i in range(n)
+    ]
+    samples: List[Sample] = []
+    start = time.perf_counter()
+    while live:
+        for session in list(live):
+            t0 = time.perf_counter()
+            try:
+                kind = next(session)
+            except StopIteration:
+                live.remove(session)
+                continue
+            samples.append((kind, time.perf_counter() - t0))
+    wall = time.perf_counter() - start
+    peak = _peak_rss_mb()
+
+    by_kind: Dict[str, List[float]] = {}
+    for kind, dt in samples:
+        by_kind.setdefault(kind, []).append(dt)
+    return {
+        "sessions": n,
+        "rounds": rounds,
+        "reruns": len(samples),
+        "wall_s": wall,
+        "reruns_per_s": len(samples) / wall,
+        "journeys_per_s": n * rounds / wall,
+        "latency_ms": _percentiles([dt for _, dt in samples]),
+        "by_step_ms": {k: {"count": len(v), **_percentiles(v)}
+                       for k, v in sorted(by_kind.items())},
+        "peak_rss_mb": peak,
+        "rss_per_session_mb": max(peak - base_rss, 0.0) / n,
+    }
+
+
+def _child(n: int, rounds: int, seed: int) -> Dict:
+    """Roda uma quantidade de sessões num processo novo (pico de RSS limpo)."""
+    cmd = [sys.executable, str(Path(__file__).resolve()), "--child", str(n),
+           "--rounds", str(rounds), "--seed", str(seed)]
+    proc = subprocess.run(cmd, cwd=ROOT_DIR, capture_output=True, text=True)
+    if proc.returncode != 0:
+        raise RuntimeError(f"{n} sessões falharam:\n{proc.stderr[-2000:]}")
+    return json.loads(proc.stdout.splitlines()[-1])
+
+
+def _report(rows: List[Dict]) -> None:
+    """Tabela das curvas de escala."""
+    print(f"{'sessões':>7s} {'reruns':>7s} {'rerun/s':>8s} {'jogo/s':>7s} "
+          f"{'p50 ms':>8s} {'p90 ms':>8s} {'p99 ms':>8s} {'máx ms':>8s} "
+          f"{'pico MB':>8s} {'MB/sess':>8s}")
+    for r in rows:
+        lat = r["latency_ms"]
+        print(f"{r['sessions']:7d} {r['reruns']:7d} {r['reruns_per_s']:8.1f} "
+              f"{r['journeys_per_s']:7.2f} {lat['p50']:8.1f} {lat['p90']:8.1f} "
+              f"{lat['p99']:8.1f} {lat['max']:8.1f} {r['peak_rss_mb']:8.1f} "
+              f"{r['rss_per_session_mb']:8.2f}")
+    print("\np50/p99 (ms) por etapa, na maior carga:")
+    for kind, s in rows[-1]["by_step_ms"].items():
+        print(f"  {kind:14s} {s['count']:6d}× {s['p50']:8.1f} {s['p99']:8.1f}")
+
+
+def _counts(text: str) -> List[int]:
+    """Converte '1,5,10' em [1, 5, 10]."""
+    try:
+        out = sorted({int(x) for x in text.split(",") if x.strip()})
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"lista inválida: {text}")
+    if not out or out[0] < 1:
+        raise argparse.ArgumentTypeError("use quantidades positivas")
+    return out
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Ponto de entrada da linha de comando."""
+    ap = argparse.ArgumentParser(description="Carga de sessões via AppTest.")
+    ap.add_argument("--sessions", type=_counts, default=[1, 5, 10, 25])
+    ap.add_argument("--rounds", type=int, default=1,
+                    help="quantas vezes cada sessão repete o caminho")
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--json", type=Path, help="grava as curvas neste arquivo")
+    ap.add_argument("--child", type=int, help=argparse.SUPPRESS)
+    args = ap.parse_args(argv)
+
+    if args.child:
+        print(json.dumps(run_sessions(args.child, args.rounds, args.seed)))
+        return 0
+
+    rows = []
+    for n in args.sessions:
+        print(f"rodando {n} sessão(ões)...", file=sys.stderr)
+        rows.append(_child(n, args.rounds, args.seed))
+    _report(rows)
+    if args.json:
+        args.json.write_text(json.dumps(rows, indent=2) + "\n",
+                             encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
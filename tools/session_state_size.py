@@ -0,0 +1,112 @@
+"""Mede quanto cada sessão do quiz ocupa no session_state.
+
+Para cada tema do catálogo, simula `--sessions` partidas terminadas com
+respostas aleatórias e compara o layout antigo (o dicionário do tema,
+lista de pares de strings e placar em dict) com o atual (`theme_ref`,
+`picks` em bytearray, `score` e `signals` em array). Mostra:
+
+- heap: bytes alocados por sessão, medidos com tracemalloc (o tema em
+  si é compartilhado nos dois casos e não entra na conta);
+- pickle: bytes por sessão serializada, o que pesa quando o estado
+  precisa ser copiado ou persistido — no layout antigo inclui o tema.
+
+Uso:
+    python tools/session_state_size.py [--sessions 2000] [--seed 0]
+"""
+
+import argparse
+import pickle
+import random
+import sys
+import tracemalloc
+from array import array
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT_DIR))
+
+from games.quiz.core.catalog import load_catalog  # noqa: E402
+from games.quiz.core.compiled import CompiledTheme, compile_theme  # noqa: E402
+from games.quiz.core.state import ThemeRef  # noqa: E402
+
+Choices = List[int]
+
+
+def _legacy(ct: CompiledTheme, path: Choices) -> Dict:
+    """Estado de uma partida no layout antigo."""
+    answers = []
+    scores = {k: 0 for k in ct.result_keys}
+    for q, pick in zip(ct.questions, path):
+        opt = q.options[pick]
+        answers.append((q.id, opt.id))
+        for rk in scores:
+            scores[rk] += opt.weights.get(rk, 0)
+    return {"theme": ct.raw, "q_index": len(path) - 1, "answers": answers,
+            "scores": scores, "finished": True}
+
+
+def _compact(ct: CompiledTheme, path: Choices) -> Dict:
+    """Estado de uma partida no layout atual."""
+    score = array("i", [0]) * len(ct.result_keys)
+    signals = array("H", [0]) * len(ct.signals)
+    for q, pick in zip(ct.questions, path):
+        opt = q.options[pick]
+        for j, rk in enumerate(ct.result_keys):
+            score[j] += opt.weights.get(rk, 0)
+        for s in opt.signals:
+            signals[ct.signal_index[s]] += 1
+    return {"theme_ref": ThemeRef(ct.id, ct.version, ct),
+            "picks": bytearray(path),
+            "score": score, "signals": signals, "finished": True}
+
+
+def _heap_per_session(make: Callable[[CompiledTheme, Choices], Dict],
+                      ct: CompiledTheme, paths: List[Choices]) -> float:
+    """Bytes alocados por sessão ao montar todas de uma vez."""
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    sessions = [make(ct, p) for p in paths]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del sessions
+    return (after - before) / len(paths)
+
+
+def measure(ct: CompiledTheme, n: int,
+            rng: random.Random) -> Dict[str, Tuple[float, float]]:
+    """(heap, pickle) por sessão em cada layout."""
+    paths = [[rng.randrange(len(q.options)) for q in ct.questions]
+             for _ in range(n)]
+    out = {}
+    for name, make in (("antigo", _legacy), ("atual", _compact)):
+        heap = _heap_per_session(make, ct, paths)
+        sample = paths[: min(n, 200)]
+        pickled = sum(len(pickle.dumps(make(ct, p))) for p in sample)
+        out[name] = (heap, pickled / len(sample))
+    return out
+
+
+def main(argv: List[str] | None = None) -> int:
+    """Ponto de entrada da linha de comando."""
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--sessions", type=int, default=2000)
+    ap.add_argument("--seed", type=int, default=0)
+    args = ap.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    print(f"{'tema':26} {'layout':7} {'heap/sessão':>12} {'pickle/sessão':>14}")
+    for item in load_catalog():
+        ct = compile_theme(item["raw"])
+        if not ct.questions or any(not q.options for q in ct.questions):
+            continue
+        res = measure(ct, args.sessions, rng)
+        for name, (heap, pickled) in res.items():
+            print(f"{ct.id:26} {name:7} {heap:10,.0f} B {pickled:12,.0f} B")
+        (h0, p0), (h1, p1) = res["antigo"], res["atual"]
+        print(f"{'':26} {'redução':7} {1 - h1 / h0:11.0%} {1 - p1 / p0:13.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())